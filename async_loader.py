@@ -0,0 +1,87 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncLoader:
+    """Runs blocking data calls on a worker pool and hands results back to Tk.
+
+    Worker threads never touch widgets: finished calls are queued and drained
+    on the Tk main thread with ``root.after``. Every call is tagged with the
+    view generation it was submitted from, so results that arrive after the
+    user has navigated away are dropped instead of rendered. Results of
+    user-initiated actions (``submit_action``) are always delivered, so their
+    outcome is never lost.
+    """
+
+    def __init__(self, root, max_workers=4, poll_interval=30):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='data-loader')
+        self.results = queue.Queue()
+        self.generation = 0
+        self.pending = 0
+        self.dropped = 0
+        self._poll_job = None
+        self._lock = threading.Lock()
+
+    def new_view(self):
+        """Mark results of calls still in flight as stale"""
+        self.generation += 1
+
+    def submit(self, func, callback, *args):
+        """Run func(*args) on a worker and call callback(result) on the Tk thread"""
+        self._submit(self.generation, func, callback, args)
+
+    def submit_action(self, func, callback, *args):
+        """Like submit, but callback runs even if the user has left the view since"""
+        self._submit(None, func, callback, args)
+
+    def _submit(self, generation, func, callback, args):
+        with self._lock:
+            self.pending += 1
+
+        def run():
+            try:
+                result = func(*args)
+            except Exception as e:
+                result = (False, f"Error: {str(e)}")
+            self.results.put((generation, callback, result))
+
+        self.executor.submit(run)
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        """Deliver finished results on the Tk thread"""
+        self._poll_job = None
+        try:
+            while True:
+                try:
+                    generation, callback, result = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                with self._lock:
+                    self.pending -= 1
+                if generation is not None and generation != self.generation:
+                    self.dropped += 1
+                    continue
+                callback(result)
+        finally:
+            with self._lock:
+                pending = self.pending
+            if pending:
+                self._schedule_poll()
+
+    def shutdown(self):
+        """Stop polling and discard queued work"""
+        if self._poll_job is not None:
+            try:
+                self.root.after_cancel(self._poll_job)
+            except Exception:
+                pass
+            self._poll_job = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,9 +1,55 @@
 import re
 from database_config import DatabaseManager
+from membership_filter import get_availability_filter
+from query_cache import QueryCache
+
+# Seconds each cached read stays fresh; writes invalidate sooner
+CACHE_TTLS = {
+    'get_all_users': 15,
+    'get_active_officers': 30,
+    'get_user_stats': 30,
+    'get_all_services': 120,
+    'get_user_applications': 15,
+    'get_all_applications': 15,
+    'get_user_reports': 15,
+    'get_all_reports': 15,
+    'get_department_reports': 15,
+    'get_report_by_id': 15,
+    'get_report_stats': 30,
+    'count_user_items': 15,
+    'count_department_reports_by_status': 15
+}
+
+# Shared by every AuthManager in the process
+_query_cache = QueryCache(max_entries=256)
+
+# Cached reads whose rows include report data
+REPORT_READS = ('get_all_reports', 'get_user_reports', 'get_department_reports', 'get_report_stats',
+                'count_user_items', 'count_department_reports_by_status')
 
 class AuthManager:
     def __init__(self):
         self.db = DatabaseManager()
+        self.cache = _query_cache
+        self.availability = get_availability_filter(self.db)
+
+    def cached(self, method, fetch, *args):
+        """Serve a read from the query cache, calling fetch(*args) on a miss"""
+        key = (method,) + args
+        hit, result = self.cache.get(key)
+        if hit:
+            return result
+        version = self.cache.version
+        result = fetch(*args)
+        if result[0]:
+            self.cache.set(key, result, CACHE_TTLS[method], version)
+        return result
+
+    def invalidate_on_success(self, result, *keys):
+        """Drop the given cache keys if a write succeeded, then pass its result through"""
+        if result[0]:
+            self.cache.invalidate(*keys)
+        return result
 
     def validate_email(self, email):
         """Validate email format"""
@@ -74,15 +120,25 @@ class AuthManager:
         if len(user_data['password']) < 6:
             return False, "Password must be at least 6 characters long"
         
-        # Database checks
-        if not self.db.check_username_availability(user_data['username']):
-            return False, "Username already exists"
-        
-        if not self.db.check_nid_availability(user_data['nid']):
-            return False, "NID already registered"
-        
-        # Register user in database
-        return self.db.register_user(user_data)
+        # Register user in database; unique indexes reject taken usernames, NIDs and emails
+        result = self.invalidate_on_success(
+            self.db.register_user(user_data), 'get_all_users', 'get_active_officers', ('get_user_stats',)
+        )
+        if result[0]:
+            self.availability.add_user(user_data)
+        return result
+
+    def load_availability_filter(self):
+        """Load every username and NID into the in-memory availability filter"""
+        return self.availability.load()
+
+    def might_be_taken(self, field, value):
+        """Instant check: False only when a username or NID is certainly free"""
+        return self.availability.might_exist(field, value)
+
+    def check_availability(self, field, value):
+        """Check whether a username or NID is free, asking the database only on a filter hit"""
+        return self.availability.is_available(field, value)
 
     def login_user(self, username, password):
         """Authenticate user login"""
@@ -94,87 +150,227 @@ class AuthManager:
     # Admin methods
     def get_all_users(self, admin_id):
         """Get all users (admin only)"""
-        return self.db.get_all_users(admin_id)
+        return self.cached('get_all_users', self.db.get_all_users, admin_id)
+
+    def get_users_page(self, admin_id, page_cursor=None, page_size=50):
+        """Get one page of users (admin only)"""
+        return self.db.get_users_page(admin_id, page_cursor, page_size)
+
+    def search_users(self, prefix, limit=20, admin_id=None):
+        """Type-ahead user search by name, username, phone or NID prefix"""
+        return self.db.search_users(prefix, limit, admin_id)
+
+    def get_active_officers(self, department=None):
+        """Get active government officers"""
+        return self.cached('get_active_officers', self.db.get_active_officers, department)
 
     def update_user_status(self, user_id, status):
         """Update user status"""
-        return self.db.update_user_status(user_id, status)
+        return self.invalidate_on_success(
+            self.db.update_user_status(user_id, status), 'get_all_users', 'get_active_officers', ('get_user_stats',)
+        )
+
+    def bulk_update_user_status(self, user_ids, status):
+        """Update the status of many users"""
+        return self.invalidate_on_success(
+            self.db.bulk_update_user_status(user_ids, status), 'get_all_users', 'get_active_officers', ('get_user_stats',)
+        )
 
     def delete_user(self, user_id):
         """Delete a user"""
-        return self.db.delete_user(user_id)
+        return self.invalidate_on_success(
+            self.db.delete_user(user_id), 'get_all_users', 'get_active_officers', ('get_user_stats',)
+        )
+
+    def bulk_delete_users(self, user_ids):
+        """Delete many users"""
+        return self.invalidate_on_success(
+            self.db.bulk_delete_users(user_ids), 'get_all_users', 'get_active_officers', ('get_user_stats',)
+        )
 
     def update_user_role(self, user_id, new_role):
         """Update user role"""
-        return self.db.update_user_role(user_id, new_role)
+        return self.invalidate_on_success(
+            self.db.update_user_role(user_id, new_role), 'get_all_users', 'get_active_officers', ('get_user_stats',)
+        )
+
+    def bulk_update_user_role(self, user_ids, new_role):
+        """Update the role of many users"""
+        return self.invalidate_on_success(
+            self.db.bulk_update_user_role(user_ids, new_role), 'get_all_users', 'get_active_officers', ('get_user_stats',)
+        )
 
     def get_user_stats(self):
         """Get user statistics"""
-        return self.db.get_user_stats()
+        return self.cached('get_user_stats', self.db.get_user_stats)
+
+    def count_user_items(self, user_id):
+        """Count a user's applications and reports by status"""
+        return self.cached('count_user_items', self.db.count_user_items, user_id)
 
     # Service methods
     def create_service(self, service_data):
         """Create a new service"""
-        return self.db.create_service(service_data)
+        return self.invalidate_on_success(self.db.create_service(service_data), ('get_all_services',))
 
     def get_all_services(self):
         """Get all services"""
-        return self.db.get_all_services()
+        return self.cached('get_all_services', self.db.get_all_services)
 
     # Application methods
     def create_application(self, application_data):
         """Create a new application"""
-        return self.db.create_application(application_data)
+        return self.invalidate_on_success(
+            self.db.create_application(application_data),
+            ('get_user_applications', application_data['user_id']), ('get_all_applications',),
+            ('count_user_items', application_data['user_id'])
+        )
 
     def get_user_applications(self, user_id):
         """Get user applications"""
-        return self.db.get_user_applications(user_id)
+        return self.cached('get_user_applications', self.db.get_user_applications, user_id)
+
+    def get_user_applications_page(self, user_id, page_cursor=None, page_size=50):
+        """Get one page of user applications"""
+        return self.db.get_user_applications_page(user_id, page_cursor, page_size)
 
     def get_all_applications(self):
         """Get all applications"""
-        return self.db.get_all_applications()
+        return self.cached('get_all_applications', self.db.get_all_applications)
+
+    def get_applications_page(self, page_cursor=None, page_size=50):
+        """Get one page of applications"""
+        return self.db.get_applications_page(page_cursor, page_size)
 
     def update_application_status(self, application_id, status, processed_by, notes=None):
         """Update application status"""
-        return self.db.update_application_status(application_id, status, processed_by, notes)
+        return self.invalidate_on_success(
+            self.db.update_application_status(application_id, status, processed_by, notes),
+            'get_user_applications', 'count_user_items', ('get_all_applications',)
+        )
+
+    def bulk_update_application_status(self, application_ids, status, processed_by, notes=None):
+        """Update the status of many applications"""
+        return self.invalidate_on_success(
+            self.db.bulk_update_application_status(application_ids, status, processed_by, notes),
+            'get_user_applications', 'count_user_items', ('get_all_applications',)
+        )
 
     # Report methods - ADMIN ONLY
     def submit_citizen_report(self, report_data):
         """Submit a citizen report"""
-        return self.db.submit_report(report_data)
+        return self.invalidate_on_success(
+            self.db.submit_report(report_data),
+            ('get_all_reports',), ('get_user_reports', report_data['user_id']),
+            ('get_department_reports', report_data['category']), ('get_report_stats',),
+            ('count_user_items', report_data['user_id']),
+            ('count_department_reports_by_status', report_data['category'])
+        )
 
     def get_user_reports(self, user_id):
         """Get reports for a specific user"""
-        return self.db.get_user_reports(user_id)
+        return self.cached('get_user_reports', self.db.get_user_reports, user_id)
 
     def get_all_reports(self):
         """Get all reports (Admin only)"""
-        return self.db.get_all_reports()
+        return self.cached('get_all_reports', self.db.get_all_reports)
+
+    def get_reports_page(self, page_cursor=None, page_size=50):
+        """Get one page of reports (Admin only)"""
+        return self.db.get_reports_page(page_cursor, page_size)
 
     def get_department_reports(self, department):
         """Get reports by department"""
-        return self.db.get_reports_by_department(department)
+        return self.cached('get_department_reports', self.db.get_reports_by_department, department)
+
+    def get_department_reports_page(self, department, page_cursor=None, page_size=50):
+        """Get one page of reports by department"""
+        return self.db.get_department_reports_page(department, page_cursor, page_size)
+
+    def count_department_reports_by_status(self, department):
+        """Count department reports by status"""
+        return self.cached('count_department_reports_by_status', self.db.count_department_reports_by_status, department)
+
+    def search_reports(self, query, filters=None, page_cursor=None, page_size=50):
+        """Full-text search over reports"""
+        return self.db.search_reports(query, filters, page_cursor, page_size)
 
     def update_report_status(self, report_id, status, assigned_to=None, feedback=None):
         """Update report status"""
-        return self.db.update_report_status(report_id, status, assigned_to, feedback)
+        return self.invalidate_on_success(
+            self.db.update_report_status(report_id, status, assigned_to, feedback),
+            ('get_report_by_id', report_id), *REPORT_READS
+        )
+
+    def bulk_update_report_status(self, report_ids, status, feedback=None):
+        """Update the status of many reports"""
+        return self.invalidate_on_success(
+            self.db.bulk_update_report_status(report_ids, status, feedback), 'get_report_by_id', *REPORT_READS
+        )
 
     def delete_report(self, report_id):
         """Delete a report (Admin only)"""
-        return self.db.delete_report(report_id)
+        return self.invalidate_on_success(
+            self.db.delete_report(report_id), ('get_report_by_id', report_id), *REPORT_READS
+        )
+
+    def bulk_delete_reports(self, report_ids):
+        """Delete many reports (Admin only)"""
+        return self.invalidate_on_success(
+            self.db.bulk_delete_reports(report_ids), 'get_report_by_id', *REPORT_READS
+        )
 
     def get_report_by_id(self, report_id):
         """Get specific report by ID"""
-        return self.db.get_report_by_id(report_id)
+        return self.cached('get_report_by_id', self.db.get_report_by_id, report_id)
 
     def update_report_details(self, report_id, title, description, category, priority):
         """Update report details"""
-        return self.db.update_report_details(report_id, title, description, category, priority)
+        return self.invalidate_on_success(
+            self.db.update_report_details(report_id, title, description, category, priority),
+            ('get_report_by_id', report_id), *REPORT_READS
+        )
 
     def get_report_stats(self):
         """Get report statistics"""
-        return self.db.get_report_stats()
+        return self.cached('get_report_stats', self.db.get_report_stats)
 
     def assign_report_to_officer(self, report_id, officer_id):
         """Assign report to government officer"""
-        return self.db.assign_report_to_officer(report_id, officer_id)
\ No newline at end of file
+        return self.invalidate_on_success(
+            self.db.assign_report_to_officer(report_id, officer_id),
+            ('get_report_by_id', report_id), *REPORT_READS
+        )
+
+    def bulk_assign_reports(self, report_ids, officer_id):
+        """Assign many reports to a government officer"""
+        return self.invalidate_on_success(
+            self.db.bulk_assign_reports(report_ids, officer_id), 'get_report_by_id', *REPORT_READS
+        )
+
+    # Diagnostics
+    def get_pool_stats(self):
+        """Get database connection pool statistics"""
+        return self.db.get_pool_stats()
+
+    def reconcile_stats_counters(self):
+        """Rebuild dashboard statistics counters from the base tables"""
+        return self.invalidate_on_success(
+            self.db.reconcile_stats_counters(), ('get_user_stats',), ('get_report_stats',)
+        )
+
+    def get_statement_cache_stats(self):
+        """Get prepared statement cache statistics"""
+        return self.db.get_statement_cache_stats()
+
+    def get_query_metrics(self):
+        """Get per-method database call counts, latency, rows, bytes and errors"""
+        return self.db.get_query_metrics()
+
+    def get_cache_stats(self):
+        """Get query cache hit/miss statistics"""
+        return self.cache.stats()
+
+    def get_availability_stats(self):
+        """Get availability filter check counts"""
+        return self.availability.stats()
\ No newline at end of file
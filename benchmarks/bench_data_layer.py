@@ -0,0 +1,431 @@
+"""Latency of every DatabaseManager and AuthManager method at each data scale.
+
+Each scale is loaded with seeded synthetic data into a fresh database, then
+every method is called repeatedly with sampled arguments. Results (p50, p95
+and p99 latency, rows/s, errors) are printed and written to JSON, so runs on
+two commits can be compared with --compare.
+
+    python benchmarks/bench_data_layer.py --scales 10k 100k --output bench.json
+    python benchmarks/bench_data_layer.py --scales 10k --compare bench.json
+
+SQLite in memory is the default backend. --backend mysql loads into the
+database given by --mysql-database, which is dropped and recreated first,
+and also compares a cached prepared read with and without the statement
+reset mysql.connector sends before each execute (server round trips per
+call from the session's Com_stmt_* counters, and latency).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_config
+from auth_functions import AuthManager
+from membership_filter import AvailabilityFilter
+from password_hashing import configure_password_hashing
+from query_metrics import configure_query_metrics
+from statement_cache import prepared_cursor, wrapped_connection
+from synthetic_data import BENCH_PASSWORD, DEPARTMENTS, REPORT_CATEGORY_WEIGHTS, SCALES, seed_database
+
+DEFAULT_CALLS = 200
+
+# Calls for methods that read or rewrite whole tables
+HEAVY_CALLS = 5
+
+# Rows touched per call by the bulk_* methods
+BULK_SIZE = 50
+
+# No full-text index on SQLite: each search scans every report
+SQLITE_SCAN_METHODS = ('search_reports',)
+
+# A hot prepared read, kept as one string object so cursors reuse its statement
+LOGIN_LOOKUP_SQL = 'SELECT id, password_hash, status FROM users WHERE username = %s'
+
+# Server counters behind one prepared execute: COM_STMT_RESET and COM_STMT_EXECUTE round trips
+STATEMENT_COUNTERS = ('Com_stmt_reset', 'Com_stmt_execute')
+
+SEARCH_TERMS = ['road', 'water supply', 'garbage mirpur', 'power', 'school roof', 'drain']
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def count_rows(result):
+    """Rows a (success, data) result carries"""
+    if not isinstance(result, tuple) or len(result) != 2:
+        return 1
+    data = result[1]
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict) and isinstance(data.get('rows'), list):
+        return len(data['rows'])
+    return 1
+
+
+class Workload:
+    """Argument samplers for one loaded scale"""
+
+    def __init__(self, data, db, seed):
+        self.data = data
+        self.db = db
+        self.rng = random.Random(seed)
+        self.first_user = data.first_user_id
+        self.last_user = data.first_user_id + data.user_count - 1
+        self.officers = data.officer_ids or [self.first_user]
+        self.next_user = 0
+        with db.pool.connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute('SELECT MIN(id), MAX(id) FROM reports')
+            self.first_report, self.last_report = cursor.fetchone()
+            cursor.execute('SELECT MIN(id), MAX(id) FROM applications')
+            self.first_application, self.last_application = cursor.fetchone()
+            # Only active accounts can log in
+            cursor.execute("SELECT username FROM users WHERE status = 'Active' AND id >= %s ORDER BY id LIMIT 1000",
+                           (self.first_user,))
+            self.active_usernames = [row[0] for row in cursor.fetchall()]
+            cursor.close()
+        self.deletable_reports = []
+        self.deletable_users = []
+
+    def user_id(self):
+        return self.rng.randint(self.first_user, self.last_user)
+
+    def username(self):
+        return self.data.username(self.rng.randrange(self.data.user_count))
+
+    def active_username(self):
+        return self.rng.choice(self.active_usernames)
+
+    def report_id(self):
+        return self.rng.randint(self.first_report, self.last_report)
+
+    def application_id(self):
+        return self.rng.randint(self.first_application, self.last_application)
+
+    def report_ids(self):
+        return [self.report_id() for _ in range(BULK_SIZE)]
+
+    def category(self):
+        return self.rng.choice(list(REPORT_CATEGORY_WEIGHTS))
+
+    def new_user(self):
+        """A valid registration for a user that does not exist yet"""
+        self.next_user += 1
+        index = 10 ** 8 + self.next_user
+        return {
+            'full_name': 'Bench Registrant', 'email': f"bench{index}@gmail.com", 'phone': '01712345678',
+            'nid': f"9{index:012d}", 'date_of_birth': '1990-01-01', 'address': 'Benchmark Road',
+            'username': f"bench{index}", 'password': BENCH_PASSWORD, 'role': 'Citizen'
+        }
+
+    def new_report(self):
+        return {
+            'user_id': self.user_id(), 'title': 'Benchmark pothole', 'description': 'Pothole on the main road',
+            'category': self.category(), 'location': 'Mirpur, Dhaka', 'priority': 'Medium'
+        }
+
+    def first_page_cursor(self, fetch):
+        """Cursor of a page deep enough to exercise keyset seeks"""
+        success, page = fetch()
+        return page['next_cursor'] if success else None
+
+
+def db_cases(w):
+    """(name, calls, function) for every DatabaseManager method"""
+    db = w.db
+    cursor_users = w.first_page_cursor(lambda: db.get_users_page(1, None, 500))
+    cursor_reports = w.first_page_cursor(lambda: db.get_reports_page(None, 500))
+
+    def register():
+        user = w.new_user()
+        result = db.register_user(user)
+        w.deletable_users.append(user['username'])
+        return result
+
+    def submit():
+        result = db.submit_report(w.new_report())
+        if result[0]:
+            w.deletable_reports.append(int(result[1].rsplit(' ', 1)[-1].rstrip(')')))
+        return result
+
+    def delete_report():
+        return db.delete_report(w.deletable_reports.pop()) if w.deletable_reports else (True, None)
+
+    def delete_user():
+        if not w.deletable_users:
+            return True, None
+        success, users = db.search_users(w.deletable_users.pop(), 1)
+        return db.delete_user(users[0]['id']) if success and users else (True, None)
+
+    return [
+        ('login_user', DEFAULT_CALLS, lambda: db.login_user(w.active_username(), BENCH_PASSWORD)),
+        ('check_username_availability', DEFAULT_CALLS, lambda: db.check_username_availability(w.username())),
+        ('check_nid_availability', DEFAULT_CALLS, lambda: db.check_nid_availability('1000000000')),
+        ('register_user', DEFAULT_CALLS, register),
+        ('get_all_users', HEAVY_CALLS, lambda: db.get_all_users(1)),
+        ('get_users_page', DEFAULT_CALLS, lambda: db.get_users_page(1, w.rng.choice([None, cursor_users]))),
+        ('search_users', DEFAULT_CALLS, lambda: db.search_users(w.username()[:w.rng.randint(2, 6)])),
+        ('get_active_officers', DEFAULT_CALLS, lambda: db.get_active_officers(w.rng.choice(DEPARTMENTS))),
+        ('get_user_stats', DEFAULT_CALLS, db.get_user_stats),
+        ('count_user_items', DEFAULT_CALLS, lambda: db.count_user_items(w.user_id())),
+        ('create_service', DEFAULT_CALLS, lambda: db.create_service({
+            'name': 'Benchmark Service', 'description': 'x', 'category': 'Tax', 'created_by': w.first_user})),
+        ('get_all_services', DEFAULT_CALLS, db.get_all_services),
+        ('create_application', DEFAULT_CALLS, lambda: db.create_application({
+            'user_id': w.user_id(), 'service_id': w.data.first_service_id, 'application_data': '{}'})),
+        ('get_user_applications', DEFAULT_CALLS, lambda: db.get_user_applications(w.user_id())),
+        ('get_user_applications_page', DEFAULT_CALLS, lambda: db.get_user_applications_page(w.user_id())),
+        ('get_all_applications', HEAVY_CALLS, db.get_all_applications),
+        ('get_applications_page', DEFAULT_CALLS, db.get_applications_page),
+        ('update_application_status', DEFAULT_CALLS, lambda: db.update_application_status(
+            w.application_id(), 'In Review', w.rng.choice(w.officers))),
+        ('bulk_update_application_status', DEFAULT_CALLS, lambda: db.bulk_update_application_status(
+            [w.application_id() for _ in range(BULK_SIZE)], 'In Review', w.rng.choice(w.officers))),
+        ('submit_report', DEFAULT_CALLS, submit),
+        ('get_user_reports', DEFAULT_CALLS, lambda: db.get_user_reports(w.user_id())),
+        ('get_all_reports', HEAVY_CALLS, db.get_all_reports),
+        ('get_reports_page', DEFAULT_CALLS, lambda: db.get_reports_page(w.rng.choice([None, cursor_reports]))),
+        ('search_reports', DEFAULT_CALLS, lambda: db.search_reports(w.rng.choice(SEARCH_TERMS))),
+        ('get_report_by_id', DEFAULT_CALLS, lambda: db.get_report_by_id(w.report_id())),
+        ('get_reports_by_department', HEAVY_CALLS, lambda: db.get_reports_by_department(w.category())),
+        ('get_department_reports_page', DEFAULT_CALLS, lambda: db.get_department_reports_page(w.category())),
+        ('count_department_reports_by_status', DEFAULT_CALLS, lambda: db.count_department_reports_by_status(w.category())),
+        ('update_report_status', DEFAULT_CALLS, lambda: db.update_report_status(
+            w.report_id(), w.rng.choice(['In Progress', 'Resolved']), w.rng.choice(w.officers))),
+        ('update_report_details', DEFAULT_CALLS, lambda: db.update_report_details(
+            w.report_id(), 'Updated title', 'Updated description', w.category(), 'High')),
+        ('assign_report_to_officer', DEFAULT_CALLS, lambda: db.assign_report_to_officer(
+            w.report_id(), w.rng.choice(w.officers))),
+        ('bulk_update_report_status', DEFAULT_CALLS, lambda: db.bulk_update_report_status(w.report_ids(), 'Resolved')),
+        ('bulk_assign_reports', DEFAULT_CALLS, lambda: db.bulk_assign_reports(w.report_ids(), w.rng.choice(w.officers))),
+        ('get_report_stats', DEFAULT_CALLS, db.get_report_stats),
+        ('delete_report', DEFAULT_CALLS, delete_report),
+        ('update_user_status', DEFAULT_CALLS, lambda: db.update_user_status(w.user_id(), 'Active')),
+        ('bulk_update_user_status', DEFAULT_CALLS, lambda: db.bulk_update_user_status(
+            [w.user_id() for _ in range(BULK_SIZE)], 'Active')),
+        ('update_user_role', DEFAULT_CALLS, lambda: db.update_user_role(w.user_id(), 'Citizen')),
+        ('bulk_update_user_role', DEFAULT_CALLS, lambda: db.bulk_update_user_role(
+            [w.user_id() for _ in range(BULK_SIZE)], 'Citizen')),
+        ('delete_user', DEFAULT_CALLS, delete_user),
+        ('reconcile_stats_counters', HEAVY_CALLS, db.reconcile_stats_counters),
+    ]
+
+
+def auth_cases(w, auth):
+    """(name, calls, function) for the AuthManager layer: validation, cache hits and the availability filter"""
+    return [
+        ('login_user', DEFAULT_CALLS, lambda: auth.login_user(w.active_username(), BENCH_PASSWORD)),
+        ('register_user', DEFAULT_CALLS, lambda: auth.register_user(w.new_user())),
+        ('check_availability', DEFAULT_CALLS, lambda: auth.check_availability('username', w.username() + 'x')),
+        ('might_be_taken', DEFAULT_CALLS, lambda: auth.might_be_taken('username', w.username() + 'x')),
+        ('get_user_stats', DEFAULT_CALLS, auth.get_user_stats),
+        ('get_report_stats', DEFAULT_CALLS, auth.get_report_stats),
+        ('get_all_services', DEFAULT_CALLS, auth.get_all_services),
+        ('get_active_officers', DEFAULT_CALLS, lambda: auth.get_active_officers(w.rng.choice(DEPARTMENTS))),
+        ('count_user_items', DEFAULT_CALLS, lambda: auth.count_user_items(w.user_id())),
+        ('get_report_by_id', DEFAULT_CALLS, lambda: auth.get_report_by_id(w.report_id())),
+        ('get_user_reports', DEFAULT_CALLS, lambda: auth.get_user_reports(w.user_id())),
+        ('get_department_reports_page', DEFAULT_CALLS, lambda: auth.get_department_reports_page(w.category())),
+        ('count_department_reports_by_status', DEFAULT_CALLS, lambda: auth.count_department_reports_by_status(w.category())),
+        ('search_users', DEFAULT_CALLS, lambda: auth.search_users(w.username()[:4])),
+        ('search_reports', DEFAULT_CALLS, lambda: auth.search_reports(w.rng.choice(SEARCH_TERMS))),
+    ]
+
+
+def run_case(function, calls):
+    """Call function calls times, returning its latency and throughput summary"""
+    latencies = []
+    rows = 0
+    errors = 0
+    for _ in range(calls):
+        started = time.perf_counter()
+        try:
+            result = function()
+        except Exception:
+            result = (False, None)
+        latencies.append(time.perf_counter() - started)
+        if isinstance(result, tuple) and result and result[0] is False:
+            errors += 1
+        rows += count_rows(result)
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        'calls': calls,
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 3),
+        'rows': rows,
+        'rows_per_second': round(rows / total, 1) if total else 0.0
+    }
+
+
+def statement_counters(connection):
+    cursor = connection.cursor()
+    cursor.execute("SHOW SESSION STATUS WHERE Variable_name IN ('Com_stmt_reset', 'Com_stmt_execute')")
+    counters = {name: int(value) for name, value in cursor.fetchall()}
+    cursor.close()
+    return counters
+
+
+def measure_statement_resets(workload, calls):
+    """Round trips and latency of a cached prepared read, with and without mysql.connector's per-execute reset"""
+    results = {}
+    with workload.db.pool.connection() as connection:
+        pooled = wrapped_connection(connection)
+        for label, cursor in (('reset_before_execute', pooled.cursor(prepared=True)),
+                              ('statement_cache', prepared_cursor(pooled))):
+            cursor.execute(LOGIN_LOOKUP_SQL, (workload.active_username(),))
+            cursor.fetchall()
+            before = statement_counters(pooled)
+            summary = run_case(lambda: (cursor.execute(LOGIN_LOOKUP_SQL, (workload.active_username(),)),
+                                        cursor.fetchall())[1], calls)
+            after = statement_counters(pooled)
+            cursor.close()
+            for name in STATEMENT_COUNTERS:
+                summary[f"{name.lower()}_per_call"] = round((after[name] - before[name]) / calls, 2)
+            results[label] = summary
+    return results
+
+
+def prepare_database(args):
+    """Point database_config at an empty database for the next scale"""
+    if args.backend == 'sqlite':
+        database_config.configure_backend('sqlite', ':memory:')
+        return
+    import mysql.connector
+    name = args.mysql_database
+    server_config = {key: value for key, value in database_config.DB_CONFIG.items() if key != 'database'}
+    connection = mysql.connector.connect(**server_config)
+    cursor = connection.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{name}`")
+    cursor.execute(f"CREATE DATABASE `{name}`")
+    cursor.close()
+    connection.close()
+    database_config.DB_CONFIG['database'] = name
+    database_config.configure_backend('mysql')
+
+
+def run_scale(scale, args):
+    """Load one scale and benchmark every method on it"""
+    prepare_database(args)
+    auth = AuthManager()
+    auth.cache.clear()
+    auth.availability = AvailabilityFilter(auth.db)
+    data, counts = seed_database(auth.db, SCALES[scale], args.seed)
+    print(f"\n📦 {scale}: loaded {counts['users']} users, {counts['applications']} applications, "
+          f"{counts['reports']} reports in {counts['seconds']}s")
+    auth.availability.load()
+    auth.db.reset_query_metrics()
+
+    workload = Workload(data, auth.db, args.seed)
+    results = {'load': counts, 'methods': {}}
+    for layer, cases in (('db', db_cases(workload)), ('auth', auth_cases(workload, auth))):
+        for name, calls, function in cases:
+            if args.only and not any(pattern in f"{layer}.{name}" for pattern in args.only):
+                continue
+            if args.backend == 'sqlite' and name in SQLITE_SCAN_METHODS:
+                calls = HEAVY_CALLS
+            calls = max(1, int(calls * args.calls / DEFAULT_CALLS))
+            summary = run_case(function, calls)
+            results['methods'][f"{layer}.{name}"] = summary
+            print(f"  {layer + '.' + name:<44}{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}"
+                  f"{summary['p99_ms']:>9.2f}{summary['rows_per_second']:>12.0f}{summary['errors']:>7}")
+    if args.backend == 'mysql':
+        results['prepared_round_trips'] = measure_statement_resets(workload, args.calls)
+        print("  cached prepared read (login lookup):")
+        for label, summary in results['prepared_round_trips'].items():
+            print(f"    {label:<42}{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}{summary['p99_ms']:>9.2f}"
+                  f"   {summary['com_stmt_reset_per_call']:.2f} resets, "
+                  f"{summary['com_stmt_execute_per_call']:.2f} executes per call")
+    results['query_metrics'] = auth.get_query_metrics()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(current, previous_path):
+    """Print p95 changes against an earlier results file"""
+    with open(previous_path, encoding='utf-8') as previous_file:
+        previous = json.load(previous_file)
+    print(f"\n🔍 p95 vs {previous_path} ({previous['meta'].get('commit')}):")
+    for scale, results in current['scales'].items():
+        before = previous['scales'].get(scale, {}).get('methods', {})
+        for name, summary in results['methods'].items():
+            if name not in before or not before[name]['p95_ms']:
+                continue
+            change = (summary['p95_ms'] - before[name]['p95_ms']) / before[name]['p95_ms'] * 100
+            flag = '⚠️' if change > 20 else '  '
+            print(f"  {flag} {scale:<5}{name:<44}{before[name]['p95_ms']:>9.2f} -> {summary['p95_ms']:>9.2f} ms "
+                  f"({change:+.0f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the data layer on synthetic data")
+    parser.add_argument('--scales', nargs='+', choices=sorted(SCALES), default=['10k'])
+    parser.add_argument('--calls', type=int, default=DEFAULT_CALLS, help="Calls per method (heavy methods get fewer)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--backend', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--mysql-database', default='citizen_portal_bench')
+    parser.add_argument('--only', nargs='*', help="Run only methods whose name contains one of these")
+    parser.add_argument('--fast-hash', action='store_true',
+                        help="Use a cheap KDF so login/register time the database, not the password hash")
+    parser.add_argument('--slow-query-log', metavar='PATH',
+                        help="Log statements over the slow-query threshold to PATH (off by default)")
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--compare', metavar='PREVIOUS_JSON')
+    args = parser.parse_args()
+
+    if args.backend == 'mysql' and args.mysql_database == database_config.DB_CONFIG['database']:
+        parser.error("--mysql-database must not be the application database; it is dropped and reloaded")
+    if args.fast_hash:
+        configure_password_hashing('pbkdf2_sha256', iterations=1000)
+    if args.slow_query_log:
+        configure_query_metrics(slow_log_enabled=True, log_path=args.slow_query_log)
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'backend': args.backend,
+            'seed': args.seed,
+            'calls': args.calls,
+            'fast_hash': args.fast_hash,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'started_at': datetime.now().isoformat(timespec='seconds')
+        },
+        'scales': {}
+    }
+    print(f"{'method':<46}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'rows/s':>12}{'errors':>7}")
+    for scale in args.scales:
+        report['scales'][scale] = run_scale(scale, args)
+
+    with open(args.output, 'w', encoding='utf-8') as output:
+        json.dump(report, output, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Login storm with and without the prepared statement cache.
+
+Many threads log random active users in at once, first with every statement
+sent as text (parsed by the server on each call), then with the hot lookups
+run as cached prepared statements. "parsed" counts statements the server had
+to parse: every text statement plus one prepare per connection and SQL text.
+On MySQL the server's own Com_stmt_prepare/Com_select deltas are shown too.
+sqlite3 already caches compiled statements per connection, so on SQLite the
+run only checks that cached statements return the same rows and measures
+the cache's own overhead; the parse savings show up with --backend mysql.
+
+    python benchmarks/bench_login_storm.py [--backend mysql] [--threads 8] [--logins 5000]
+
+A cheap KDF is used unless --real-hash is given, so the storm times the
+database rather than password verification.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_config
+from bench_data_layer import percentile, prepare_database
+from password_hashing import configure_password_hashing
+from query_metrics import configure_query_metrics
+from statement_cache import configure_statement_cache, get_statement_cache_stats
+from synthetic_data import BENCH_PASSWORD, SCALES, seed_database
+
+MODES = [
+    ('text protocol', False),
+    ('prepared + cache', True),
+]
+
+SERVER_COUNTERS = ('Com_stmt_prepare', 'Com_stmt_execute', 'Com_select')
+
+WARMUP_LOGINS = 200
+
+
+def active_usernames(db, first_user_id, limit=5000):
+    """Seeded users that can log in with BENCH_PASSWORD"""
+    with db.pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT username FROM users WHERE status = 'Active' AND id >= %s ORDER BY id LIMIT %s",
+                       (first_user_id, limit))
+        usernames = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+    return usernames
+
+
+def server_counters(db):
+    """MySQL's global statement counters (empty on SQLite)"""
+    if database_config.DB_BACKEND != 'mysql':
+        return {}
+    with db.pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute(f"SHOW GLOBAL STATUS WHERE Variable_name IN ({', '.join(['%s'] * len(SERVER_COUNTERS))})",
+                       SERVER_COUNTERS)
+        counters = {name: int(value) for name, value in cursor.fetchall()}
+        cursor.close()
+    return counters
+
+
+def storm(db, usernames, threads):
+    """Log every username in from a pool of threads; returns (seconds, latencies, failures)"""
+    def login(username):
+        started = time.perf_counter()
+        success = db.login_user(username, BENCH_PASSWORD)[0]
+        return time.perf_counter() - started, success
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        results = list(executor.map(login, usernames))
+    elapsed = time.perf_counter() - started
+    latencies = sorted(latency for latency, success in results)
+    return elapsed, latencies, sum(1 for latency, success in results if not success)
+
+
+def run_mode(db, prepared, usernames, threads):
+    """Run one storm and summarize throughput, latency and statements parsed"""
+    configure_statement_cache(enabled=prepared)
+    db.reset_query_metrics()
+    cache_before = get_statement_cache_stats()
+    server_before = server_counters(db)
+
+    elapsed, latencies, failures = storm(db, usernames, threads)
+
+    cache_after = get_statement_cache_stats()
+    server_after = server_counters(db)
+    statements = db.get_query_metrics().get('login_user', {}).get('statements', 0)
+    return {
+        'logins_per_second': len(usernames) / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'failures': failures,
+        'statements': statements,
+        'parsed': statements - (cache_after['hits'] - cache_before['hits']),
+        'server': {name: server_after[name] - server_before.get(name, 0) for name in server_after}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=sorted(SCALES), default='10k')
+    parser.add_argument('--logins', type=int, default=5000)
+    parser.add_argument('--threads', type=int, default=database_config.POOL_SIZE)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--backend', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--mysql-database', default='citizen_portal_bench')
+    parser.add_argument('--real-hash', action='store_true', help="Verify passwords with the production KDF")
+    args = parser.parse_args()
+
+    if args.backend == 'mysql' and args.mysql_database == database_config.DB_CONFIG['database']:
+        parser.error("--mysql-database must not be the application database; it is dropped and reloaded")
+    if not args.real_hash:
+        configure_password_hashing('pbkdf2_sha256', iterations=1000)
+    configure_query_metrics(slow_log_enabled=False)
+
+    prepare_database(args)
+    db = database_config.DatabaseManager()
+    data, counts = seed_database(db, SCALES[args.scale], args.seed)
+    print(f"📦 {args.scale}: loaded {counts['users']} users in {counts['seconds']}s")
+
+    rng = random.Random(args.seed)
+    usernames = active_usernames(db, data.first_user_id)
+    storm(db, [rng.choice(usernames) for _ in range(WARMUP_LOGINS)], args.threads)
+
+    print(f"\n{args.logins} logins on {args.threads} threads ({args.backend})")
+    print(f"{'mode':<20}{'logins/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'statements':>12}{'parsed':>9}"
+          f"{'failures':>10}")
+    results = {}
+    for name, prepared in MODES:
+        summary = results[name] = run_mode(db, prepared, [rng.choice(usernames) for _ in range(args.logins)],
+                                           args.threads)
+        print(f"{name:<20}{summary['logins_per_second']:>10.0f}{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}"
+              f"{summary['p99_ms']:>9.2f}{summary['statements']:>12}{summary['parsed']:>9}{summary['failures']:>10}")
+        if summary['server']:
+            print(' ' * 20 + '  server: ' + ', '.join(f"{key}={value}" for key, value in summary['server'].items()))
+
+    text, prepared = results['text protocol'], results['prepared + cache']
+    saved = text['parsed'] - prepared['parsed']
+    print(f"\n✅ Prepared statements saved {saved} parses "
+          f"({saved / text['parsed'] * 100 if text['parsed'] else 0:.0f}%), "
+          f"throughput {(prepared['logins_per_second'] / text['logins_per_second'] - 1) * 100:+.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Logins per second per core for each password hashing cost setting.
+
+A login verifies one stored hash, which costs the same as creating it, so
+single-threaded verifications per second is the per-core login capacity.
+
+    python benchmarks/bench_password_hashing.py [--rounds 10] [--workers 4]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from password_hashing import PasswordHasher, Pbkdf2Hasher, ScryptHasher
+
+COST_SETTINGS = [
+    ('scrypt n=2^13', ScryptHasher(n=2 ** 13)),
+    ('scrypt n=2^14 (default)', ScryptHasher(n=2 ** 14)),
+    ('scrypt n=2^15', ScryptHasher(n=2 ** 15)),
+    ('scrypt n=2^16', ScryptHasher(n=2 ** 16)),
+    ('pbkdf2 100k', Pbkdf2Hasher(iterations=100000)),
+    ('pbkdf2 300k', Pbkdf2Hasher(iterations=300000)),
+    ('pbkdf2 600k (default)', Pbkdf2Hasher(iterations=600000)),
+]
+
+
+def bench(hasher, rounds, workers):
+    """Time single-threaded verifies and a batch on a worker pool"""
+    encoded = hasher.hash('correct horse battery staple')
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        hasher.verify('correct horse battery staple', encoded)
+    per_login = (time.perf_counter() - started) / rounds
+
+    pool = PasswordHasher(hasher, workers)
+    started = time.perf_counter()
+    pool.hash_many(['correct horse battery staple'] * rounds * workers)
+    pooled = rounds * workers / (time.perf_counter() - started)
+    pool.shutdown()
+
+    return per_login, pooled
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{'setting':<26}{'ms/login':>10}{'logins/s/core':>15}{f'logins/s x{args.workers}':>16}")
+    for name, hasher in COST_SETTINGS:
+        per_login, pooled = bench(hasher, args.rounds, args.workers)
+        print(f"{name:<26}{per_login * 1000:>10.1f}{1 / per_login:>15.1f}{pooled:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""Seeded synthetic users, services, applications and reports for benchmarks.
+
+The same seed and scale always produce the same rows. Phone numbers, NIDs and
+emails pass AuthManager's validators, and enum columns follow the rough mix a
+live portal sees (mostly citizens, most reports pending or in progress, ...).
+
+    python benchmarks/synthetic_data.py 10k --sqlite /tmp/portal_10k.db
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database_config import normalize_name
+
+# Scale name -> number of users; applications and reports are generated per user
+SCALES = {
+    '10k': 10000,
+    '100k': 100000,
+    '1m': 1000000
+}
+
+APPLICATIONS_PER_USER = 1.5
+REPORTS_PER_USER = 1.0
+USERS_PER_SERVICE = 2000
+MIN_SERVICES = 25
+
+# Password shared by every synthetic user, hashed once
+BENCH_PASSWORD = 'Benchmark#2024'
+
+# Rows per INSERT batch (and commit) while loading
+LOAD_BATCH_SIZE = 5000
+
+# Rows are spread over this many days before the generator's fixed "now"
+HISTORY_DAYS = 730
+GENERATED_AT = datetime(2024, 6, 1, 12, 0, 0)
+
+FIRST_NAMES = [
+    'Abdul', 'Aminul', 'Anisur', 'Arif', 'Ayesha', 'Farhana', 'Fatema', 'Habib', 'Hasan', 'Jannat',
+    'Kamal', 'Karim', 'Laila', 'Mahmud', 'Masud', 'Mim', 'Mohammad', 'Monir', 'Nasrin', 'Nusrat',
+    'Rafiq', 'Rahim', 'Rashed', 'Rina', 'Rubina', 'Sabina', 'Saiful', 'Shahana', 'Shakil', 'Sharmin',
+    'Sumon', 'Tahmina', 'Tanvir', 'Taslima', 'Zahid', 'Shirin', 'Jahid', 'Mitu', 'Rakib', 'Sadia'
+]
+LAST_NAMES = [
+    'Ahmed', 'Akter', 'Alam', 'Ali', 'Begum', 'Biswas', 'Chowdhury', 'Das', 'Hossain', 'Islam',
+    'Kabir', 'Khan', 'Khatun', 'Mahmud', 'Miah', 'Mondal', 'Rahman', 'Roy', 'Sarkar', 'Uddin'
+]
+AREAS = [
+    'Mirpur', 'Dhanmondi', 'Uttara', 'Gulshan', 'Mohammadpur', 'Banani', 'Motijheel', 'Badda',
+    'Jatrabari', 'Tejgaon', 'Agrabad', 'Panchlaish', 'Zindabazar', 'Sonadanga', 'Shaheb Bazar'
+]
+CITIES = ['Dhaka', 'Chattogram', 'Sylhet', 'Khulna', 'Rajshahi']
+MOBILE_PREFIXES = ['013', '014', '015', '016', '017', '018', '019']
+
+DEPARTMENTS = ["City Corporation", "Health Department", "Water Supply", "Electricity", "Education", "Environment"]
+
+ROLE_WEIGHTS = {'Citizen': 0.965, 'Government Officer': 0.03, 'Administrator': 0.005}
+USER_STATUS_WEIGHTS = {'Active': 0.9, 'Inactive': 0.07, 'Suspended': 0.03}
+APPLICATION_STATUS_WEIGHTS = {'Pending': 0.3, 'In Review': 0.2, 'Approved': 0.4, 'Rejected': 0.1}
+REPORT_CATEGORY_WEIGHTS = {
+    'Infrastructure': 0.3, 'Utility': 0.25, 'Environment': 0.15,
+    'Health': 0.12, 'Education': 0.08, 'Other': 0.1
+}
+REPORT_STATUS_WEIGHTS = {'Pending': 0.4, 'In Progress': 0.25, 'Resolved': 0.3, 'Rejected': 0.05}
+PRIORITY_WEIGHTS = {'Low': 0.25, 'Medium': 0.45, 'High': 0.25, 'Emergency': 0.05}
+
+SERVICE_NAMES = [
+    ('Birth Certificate', 'Civil Registration'), ('Death Certificate', 'Civil Registration'),
+    ('Trade License', 'Business'), ('Holding Tax Payment', 'Tax'), ('Water Connection', 'Utility'),
+    ('Electricity Connection', 'Utility'), ('Building Permit', 'Construction'),
+    ('Health Card', 'Health'), ('School Admission', 'Education'), ('Waste Collection', 'Environment')
+]
+
+REPORT_TOPICS = {
+    'Infrastructure': ['Broken road', 'Pothole on main road', 'Collapsed footpath', 'Damaged bridge railing', 'Streetlight not working'],
+    'Utility': ['No water supply', 'Low water pressure', 'Frequent power cuts', 'Gas line leakage', 'Sewer overflow'],
+    'Environment': ['Garbage not collected', 'Illegal dumping', 'Blocked drain', 'Tree fallen on road', 'Air pollution from factory'],
+    'Health': ['Mosquito breeding site', 'Clinic closed', 'Contaminated water', 'Stray dog bites', 'Unhygienic food stall'],
+    'Education': ['School roof leaking', 'Teacher absent', 'No drinking water at school', 'Broken classroom furniture', 'Unsafe school gate'],
+    'Other': ['Noise complaint', 'Illegal parking', 'Encroachment on footpath', 'Missing road sign', 'Public toilet closed']
+}
+
+
+def weighted(rng, weights):
+    """Pick a key of weights with probability proportional to its value"""
+    return rng.choices(list(weights), list(weights.values()))[0]
+
+
+def timestamp(moment):
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class SyntheticData:
+    """Deterministic rows for one scale.
+
+    Ids are assigned from ``first_user_id``/``first_service_id`` on, so the
+    rows can be loaded into a database that already holds the default admin.
+    Each generator method yields tuples in the column order of its INSERT.
+    """
+
+    def __init__(self, users, seed=42, first_user_id=2, first_service_id=1):
+        self.user_count = users
+        self.seed = seed
+        self.first_user_id = first_user_id
+        self.first_service_id = first_service_id
+        self.service_count = max(MIN_SERVICES, users // USERS_PER_SERVICE)
+        self.application_count = int(users * APPLICATIONS_PER_USER)
+        self.report_count = int(users * REPORTS_PER_USER)
+        self.officer_ids = []
+
+    def rng(self, stream):
+        """Independent random stream per table, so changing one table leaves the others identical"""
+        return random.Random(f"{self.seed}:{stream}")
+
+    def username(self, index):
+        rng = self.rng(f"name:{index}")
+        return f"{rng.choice(FIRST_NAMES).lower()}.{rng.choice(LAST_NAMES).lower()}{index}"
+
+    def nid(self, rng, index, birth_year):
+        """10-digit smart card, 13-digit or 17-digit NID, unique per index"""
+        kind = rng.random()
+        if kind < 0.6:
+            return f"{rng.randint(1, 9)}{index:09d}"
+        if kind < 0.85:
+            return f"{birth_year}{index:09d}"
+        return f"{birth_year}{rng.randint(10, 64):02d}{index:011d}"
+
+    def created_at(self, rng):
+        return GENERATED_AT - timedelta(seconds=rng.randrange(HISTORY_DAYS * 86400))
+
+    def users(self, password_hash):
+        """(id, full_name, name_normalized, email, phone, nid, date_of_birth, address, username,
+        password_hash, role, department, status, created_at, last_login)"""
+        rng = self.rng('users')
+        self.officer_ids = []
+        for index in range(self.user_count):
+            user_id = self.first_user_id + index
+            name_rng = self.rng(f"name:{index}")
+            full_name = f"{name_rng.choice(FIRST_NAMES)} {name_rng.choice(LAST_NAMES)}"
+            username = self.username(index)
+            birth = datetime(1950, 1, 1) + timedelta(days=rng.randrange(55 * 365))
+            role = weighted(rng, ROLE_WEIGHTS)
+            department = rng.choice(DEPARTMENTS) if role == 'Government Officer' else None
+            if role == 'Government Officer':
+                self.officer_ids.append(user_id)
+            created = self.created_at(rng)
+            last_login = created + timedelta(seconds=rng.randrange(86400 * 30)) if rng.random() < 0.7 else None
+            yield (
+                user_id, full_name, normalize_name(full_name),
+                f"{username}@gmail.com" if rng.random() < 0.6 else None,
+                f"{rng.choice(MOBILE_PREFIXES)}{rng.randrange(10 ** 8):08d}",
+                self.nid(rng, index, birth.year),
+                birth.strftime('%Y-%m-%d'),
+                f"House {rng.randint(1, 200)}, Road {rng.randint(1, 40)}, {rng.choice(AREAS)}, {rng.choice(CITIES)}",
+                username, password_hash, role, department,
+                weighted(rng, USER_STATUS_WEIGHTS), timestamp(created),
+                timestamp(min(last_login, GENERATED_AT)) if last_login else None
+            )
+
+    def services(self, created_by):
+        """(id, name, description, category, department, requirements, processing_time, fee, status,
+        created_by, created_at)"""
+        rng = self.rng('services')
+        for index in range(self.service_count):
+            name, category = SERVICE_NAMES[index % len(SERVICE_NAMES)]
+            if index >= len(SERVICE_NAMES):
+                name = f"{name} ({rng.choice(CITIES)} {index // len(SERVICE_NAMES)})"
+            yield (
+                self.first_service_id + index, name, f"Apply for {name.lower()} online",
+                category, rng.choice(DEPARTMENTS), '["NID copy", "Photograph"]',
+                f"{rng.choice([3, 5, 7, 15, 30])} days", rng.choice([0, 50, 100, 250, 500, 1000]),
+                'Active' if rng.random() < 0.9 else 'Inactive', created_by,
+                timestamp(self.created_at(rng))
+            )
+
+    def applications(self):
+        """(user_id, service_id, application_data, status, applied_date, processed_date, processed_by, notes)"""
+        rng = self.rng('applications')
+        officers = self.officer_ids or [self.first_user_id]
+        for index in range(self.application_count):
+            status = weighted(rng, APPLICATION_STATUS_WEIGHTS)
+            applied = self.created_at(rng)
+            processed = status in ('Approved', 'Rejected')
+            yield (
+                self.first_user_id + rng.randrange(self.user_count),
+                self.first_service_id + rng.randrange(self.service_count),
+                f'{{"reference": "APP-{index:08d}"}}', status, timestamp(applied),
+                timestamp(min(applied + timedelta(days=rng.randint(1, 30)), GENERATED_AT)) if processed else None,
+                rng.choice(officers) if processed else None,
+                'Processed' if processed else None
+            )
+
+    def reports(self):
+        """(user_id, title, description, category, location, status, priority, assigned_to, created_at,
+        resolved_at, feedback)"""
+        rng = self.rng('reports')
+        officers = self.officer_ids or [self.first_user_id]
+        for index in range(self.report_count):
+            category = weighted(rng, REPORT_CATEGORY_WEIGHTS)
+            status = weighted(rng, REPORT_STATUS_WEIGHTS)
+            topic = rng.choice(REPORT_TOPICS[category])
+            area = rng.choice(AREAS)
+            created = self.created_at(rng)
+            resolved = status == 'Resolved'
+            yield (
+                self.first_user_id + rng.randrange(self.user_count),
+                f"{topic} in {area}",
+                f"{topic} near {rng.choice(['the market', 'the school', 'the mosque', 'the bus stand', 'our house'])} "
+                f"in {area} for {rng.randint(1, 30)} days. Please take action.",
+                category, f"{area}, {rng.choice(CITIES)}", status, weighted(rng, PRIORITY_WEIGHTS),
+                rng.choice(officers) if status in ('In Progress', 'Resolved') else None,
+                timestamp(created),
+                timestamp(min(created + timedelta(days=rng.randint(1, 60)), GENERATED_AT)) if resolved else None,
+                'Issue fixed' if resolved else None
+            )
+
+
+INSERTS = {
+    'users': '''
+        INSERT INTO users (id, full_name, name_normalized, email, phone, nid, date_of_birth, address, username,
+                           password_hash, role, department, status, created_at, last_login)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ''',
+    'services': '''
+        INSERT INTO services (id, name, description, category, department, requirements, processing_time, fee,
+                              status, created_by, created_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ''',
+    'applications': '''
+        INSERT INTO applications (user_id, service_id, application_data, status, applied_date, processed_date,
+                                  processed_by, notes)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ''',
+    'reports': '''
+        INSERT INTO reports (user_id, title, description, category, location, status, priority, assigned_to,
+                             created_at, resolved_at, feedback)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    '''
+}
+
+
+def insert_rows(connection, cursor, table, rows, batch_size=LOAD_BATCH_SIZE):
+    """Insert rows in batches, one commit per batch; returns the row count"""
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            cursor.executemany(INSERTS[table], batch)
+            connection.commit()
+            count += len(batch)
+            batch = []
+    if batch:
+        cursor.executemany(INSERTS[table], batch)
+        connection.commit()
+        count += len(batch)
+    return count
+
+
+def seed_database(db, users, seed=42, batch_size=LOAD_BATCH_SIZE):
+    """Load one scale of synthetic data through db's pool and rebuild the stats counters.
+
+    Returns (data, {'users': n, ..., 'seconds': s}).
+    """
+    started = time.monotonic()
+    password_hash = db.hash_password(BENCH_PASSWORD)
+    with db.pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM users')
+        first_user_id = cursor.fetchone()[0] + 1
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM services')
+        first_service_id = cursor.fetchone()[0] + 1
+        data = SyntheticData(users, seed, first_user_id, first_service_id)
+
+        counts = {
+            'users': insert_rows(connection, cursor, 'users', data.users(password_hash), batch_size),
+            'services': insert_rows(connection, cursor, 'services', data.services(first_user_id), batch_size),
+            'applications': insert_rows(connection, cursor, 'applications', data.applications(), batch_size),
+            'reports': insert_rows(connection, cursor, 'reports', data.reports(), batch_size)
+        }
+        db.rebuild_stats_counters(cursor)
+        connection.commit()
+        cursor.close()
+    counts['seconds'] = round(time.monotonic() - started, 2)
+    return data, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load seeded synthetic portal data")
+    parser.add_argument('scale', choices=sorted(SCALES))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--sqlite', metavar='PATH', help="Load into this SQLite file instead of the configured MySQL database")
+    args = parser.parse_args()
+
+    import database_config
+    if args.sqlite:
+        database_config.configure_backend('sqlite', args.sqlite)
+    db = database_config.DatabaseManager()
+    data, counts = seed_database(db, SCALES[args.scale], args.seed)
+    print(f"✅ Loaded {counts['users']} users, {counts['services']} services, {counts['applications']} applications "
+          f"and {counts['reports']} reports in {counts['seconds']}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+import argparse
+import csv
+import time
+from mysql.connector import Error, errorcode
+from auth_functions import AuthManager
+from database_config import STATS_TOTAL_DIMENSION, duplicate_key_message, normalize_name
+from password_hashing import HASHERS, get_password_hasher
+
+BATCH_SIZE = 2000
+
+REQUIRED_FIELDS = [
+    ('full_name', 'Full Name'),
+    ('phone', 'Phone Number'),
+    ('nid', 'NID Number'),
+    ('date_of_birth', 'Date of Birth'),
+    ('address', 'Address'),
+    ('username', 'Username')
+]
+
+# Columns never copied into the rejects file
+SECRET_FIELDS = ('password', 'password_hash')
+
+VALID_ROLES = ('Citizen', 'Government Officer', 'Administrator')
+
+# Columns checked for clashes with existing users, with the message used for rejects
+UNIQUE_FIELDS = [
+    ('username', "Username already exists"),
+    ('nid', "NID already registered"),
+    ('email', "Email already registered")
+]
+
+INSERT_USER_SQL = '''
+    INSERT INTO users (full_name, name_normalized, email, phone, nid, date_of_birth, address, username, password_hash, role, department, status)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Active')
+'''
+
+
+class UserImporter:
+    """Streams users from a CSV file into the users table in batches.
+
+    Each batch is validated with the same rules as ``AuthManager.register_user``
+    and checked for duplicates, both within the file and against existing
+    users. That check loads the batch keys into a temporary staging table and
+    joins it against ``users``. Valid rows go in with one multi-row INSERT and
+    one commit per batch. Rejected rows are written to a CSV with their line
+    number and reason, with the password columns left blank.
+
+    Passwords are hashed per batch before a pooled connection is taken, so the
+    KDF never runs inside a transaction or holds a pool slot. At the default
+    scrypt cost that hashing limits an import to a few dozen rows per second
+    per hashing worker. For large migrations, supply a ``password_hash``
+    column instead of ``password``, holding hashes in a format
+    ``password_hashing`` understands (``scrypt$...`` or ``pbkdf2_sha256$...``).
+    Those rows skip the KDF entirely. Hashes made at another cost are upgraded
+    on the user's next login.
+    """
+
+    def __init__(self, auth=None, batch_size=BATCH_SIZE, default_role='Citizen'):
+        self.auth = auth or AuthManager()
+        self.db = self.auth.db
+        self.batch_size = batch_size
+        self.default_role = default_role
+        self.seen = {field: set() for field, message in UNIQUE_FIELDS}
+        self.stats = {'rows': 0, 'imported': 0, 'rejected': 0}
+
+    def validate_row(self, row):
+        """Validate one CSV row, returning (user_data, None) or (None, reason)"""
+        user_data = {key: (value or '').strip() for key, value in row.items() if key}
+        for field, field_name in REQUIRED_FIELDS:
+            if not user_data.get(field):
+                return None, f"{field_name} is required"
+
+        user_data['email'] = user_data.get('email') or None
+        user_data['department'] = user_data.get('department') or None
+        user_data['role'] = user_data.get('role') or self.default_role
+
+        if user_data['role'] not in VALID_ROLES:
+            return None, f"Unknown role: {user_data['role']}"
+        if user_data['email'] and not self.auth.validate_email(user_data['email']):
+            return None, "Please enter a valid email address"
+        if not self.auth.validate_phone(user_data['phone']):
+            return None, "Please enter a valid Bangladeshi phone number (01XXXXXXXXX)"
+        if not self.auth.validate_nid(user_data['nid']):
+            return None, "Please enter a valid NID number (10-17 digits)"
+        if not self.auth.validate_date(user_data['date_of_birth']):
+            return None, "Please enter date in YYYY-MM-DD format"
+        if user_data.get('password_hash'):
+            if user_data['password_hash'].split('$', 1)[0] not in HASHERS:
+                return None, "Unsupported password hash format"
+        elif not user_data.get('password'):
+            return None, "Password is required"
+        elif len(user_data['password']) < 6:
+            return None, "Password must be at least 6 characters long"
+
+        # Duplicates earlier in the same file
+        for field, message in UNIQUE_FIELDS:
+            value = user_data[field]
+            if value is not None and value in self.seen[field]:
+                return None, f"{message} (duplicate in file)"
+        for field, message in UNIQUE_FIELDS:
+            if user_data[field] is not None:
+                self.seen[field].add(user_data[field])
+        return user_data, None
+
+    def create_staging_table(self, cursor):
+        """Create the per-connection staging table used for uniqueness checks"""
+        cursor.execute('DROP TEMPORARY TABLE IF EXISTS import_staging')
+        cursor.execute('''
+            CREATE TEMPORARY TABLE import_staging (
+                line_no INT PRIMARY KEY,
+                username VARCHAR(100) NOT NULL,
+                nid VARCHAR(50) NOT NULL,
+                email VARCHAR(255) NULL,
+                KEY (username),
+                KEY (nid),
+                KEY (email)
+            )
+        ''')
+
+    def find_existing(self, cursor, batch):
+        """Get {line_no: reason} for batch rows that clash with existing users"""
+        cursor.execute('DELETE FROM import_staging')
+        cursor.executemany(
+            'INSERT INTO import_staging (line_no, username, nid, email) VALUES (%s, %s, %s, %s)',
+            [(line_no, user['username'], user['nid'], user['email']) for line_no, user, raw in batch]
+        )
+        cursor.execute(' UNION ALL '.join(
+            f"SELECT s.line_no, '{field}' FROM import_staging s JOIN users u ON u.{field} = s.{field}"
+            for field, message in UNIQUE_FIELDS
+        ))
+        messages = dict(UNIQUE_FIELDS)
+        clashes = {}
+        for line_no, field in cursor.fetchall():
+            clashes.setdefault(line_no, messages[field])
+        return clashes
+
+    def user_params(self, user):
+        """Build INSERT parameters for one validated, hashed user"""
+        return (
+            user['full_name'], normalize_name(user['full_name']), user['email'], user['phone'], user['nid'],
+            user['date_of_birth'], user['address'], user['username'],
+            user['password_hash'], user['role'], user['department']
+        )
+
+    def counter_deltas(self, users):
+        """Stats counter changes for a set of newly inserted users"""
+        deltas = {(STATS_TOTAL_DIMENSION, ''): len(users), ('status', 'Active'): len(users)}
+        for user in users:
+            deltas[('role', user['role'])] = deltas.get(('role', user['role']), 0) + 1
+        return deltas
+
+    def hash_batch(self, batch):
+        """Hash the plaintext passwords of a batch across the hasher pool, keeping supplied hashes"""
+        plaintext = [user for line_no, user, raw in batch if not user.get('password_hash')]
+        password_hashes = get_password_hasher().hash_many([user['password'] for user in plaintext])
+        for user, password_hash in zip(plaintext, password_hashes):
+            user['password_hash'] = password_hash
+
+    def import_batch(self, batch, reject):
+        """Hash a validated batch, then check and insert it on one pooled connection"""
+        # Salted KDF hashing dominates import time: finish it before taking a connection
+        self.hash_batch(batch)
+        with self.db.pool.connection() as connection:
+            cursor = connection.cursor()
+            self.create_staging_table(cursor)
+            self.insert_batch(connection, cursor, batch, reject)
+            cursor.execute('DROP TEMPORARY TABLE IF EXISTS import_staging')
+            cursor.close()
+
+    def insert_batch(self, connection, cursor, batch, reject):
+        """Check a validated batch against existing users and insert the rest"""
+        clashes = self.find_existing(cursor, batch)
+        accepted = []
+        for line_no, user, raw in batch:
+            if line_no in clashes:
+                reject(line_no, raw, clashes[line_no])
+            else:
+                accepted.append((line_no, user, raw))
+        if not accepted:
+            return
+
+        params = [self.user_params(user) for line_no, user, raw in accepted]
+
+        try:
+            # executemany rewrites this into a single multi-row INSERT
+            cursor.executemany(INSERT_USER_SQL, params)
+            self.db.apply_stats_counter_deltas(cursor, 'users', self.counter_deltas([user for line_no, user, raw in accepted]))
+            connection.commit()
+            self.stats['imported'] += len(accepted)
+            for line_no, user, raw in accepted:
+                self.auth.availability.add_user(user)
+        except Error as e:
+            if e.errno != errorcode.ER_DUP_ENTRY:
+                raise
+            # A concurrent registration took a key after the staging check: retry row by row
+            connection.rollback()
+            for (line_no, user, raw), user_params in zip(accepted, params):
+                try:
+                    cursor.execute(INSERT_USER_SQL, user_params)
+                    self.db.apply_stats_counter_deltas(cursor, 'users', self.counter_deltas([user]))
+                    connection.commit()
+                    self.stats['imported'] += 1
+                    self.auth.availability.add_user(user)
+                except Error as row_error:
+                    connection.rollback()
+                    message = duplicate_key_message(row_error)
+                    if message is None:
+                        raise
+                    reject(line_no, raw, message)
+
+    def run(self, csv_path, rejects_path=None):
+        """Import every row of csv_path, writing rejects to rejects_path"""
+        rejects_path = rejects_path or f"{csv_path}.rejects.csv"
+        started = time.monotonic()
+
+        with open(csv_path, newline='', encoding='utf-8-sig') as source, \
+                open(rejects_path, 'w', newline='', encoding='utf-8') as rejects_file:
+            reader = csv.DictReader(source)
+            rejects = csv.writer(rejects_file)
+            rejects.writerow(['line'] + list(reader.fieldnames or []) + ['reason'])
+
+            def reject(line_no, raw, reason):
+                rejects.writerow([line_no] + ['' if field in SECRET_FIELDS else raw.get(field)
+                                              for field in reader.fieldnames] + [reason])
+                self.stats['rejected'] += 1
+
+            batch = []
+            for raw in reader:
+                self.stats['rows'] += 1
+                line_no = reader.line_num
+                user, reason = self.validate_row(raw)
+                if reason:
+                    reject(line_no, raw, reason)
+                    continue
+                batch.append((line_no, user, raw))
+                if len(batch) >= self.batch_size:
+                    self.import_batch(batch, reject)
+                    batch = []
+            if batch:
+                self.import_batch(batch, reject)
+
+        self.auth.cache.invalidate('get_all_users', 'get_active_officers', ('get_user_stats',))
+        elapsed = time.monotonic() - started
+        self.stats.update({
+            'rejects_path': rejects_path,
+            'seconds': round(elapsed, 2),
+            'rows_per_second': round(self.stats['rows'] / elapsed) if elapsed else 0
+        })
+        return self.stats
+
+
+def import_users(csv_path, rejects_path=None, batch_size=BATCH_SIZE, auth=None):
+    """Bulk import users from a CSV file"""
+    try:
+        return True, UserImporter(auth, batch_size).run(csv_path, rejects_path)
+    except (Error, OSError, csv.Error) as e:
+        return False, f"Import failed: {str(e)}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import users from a CSV file")
+    parser.add_argument('csv_path', help="CSV with full_name, email, phone, nid, date_of_birth, address, "
+                                         "username, password (or a pre-computed password_hash) and "
+                                         "optional role, department columns")
+    parser.add_argument('--rejects', help="Where to write rejected rows (default: <csv_path>.rejects.csv)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    success, result = import_users(args.csv_path, args.rejects, args.batch_size)
+    if not success:
+        print(f"❌ {result}")
+        return
+    print(f"✅ Imported {result['imported']} of {result['rows']} users in {result['seconds']}s "
+          f"({result['rows_per_second']} rows/s)")
+    if result['rejected']:
+        print(f"⚠️ {result['rejected']} rows rejected, see {result['rejects_path']}")
+
+
+if __name__ == "__main__":
+    main()
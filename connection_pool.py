@@ -0,0 +1,237 @@
+import threading
+import time
+from contextlib import contextmanager
+from queue import LifoQueue, Empty
+
+import mysql.connector
+from mysql.connector import errorcode, errors
+
+# Client errors meaning the server connection is gone (MySQL restart, wait_timeout, network drop)
+DISCONNECT_ERRNOS = (errorcode.CR_SERVER_GONE_ERROR, errorcode.CR_SERVER_LOST, errorcode.CR_SERVER_LOST_EXTENDED,
+                     errorcode.CR_CONNECTION_ERROR, errorcode.CR_CONN_HOST_ERROR)
+
+
+def is_disconnect(error):
+    """True for errors raised because the connection to the server was lost"""
+    if error.errno in DISCONNECT_ERRNOS:
+        return True
+    # "MySQL Connection not available" and friends carry no server errno
+    return isinstance(error, (errors.InterfaceError, errors.OperationalError)) and error.errno in (None, -1)
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of MySQL connections.
+
+    Connections are opened lazily up to ``pool_size`` and handed out one per
+    call. When every connection is in use, callers wait up to
+    ``checkout_timeout`` seconds before a ``PoolError`` is raised.
+    ``connect`` opens one connection from ``db_config``; any factory returning
+    mysql.connector-compatible connections (e.g. the SQLite backend) works.
+
+    A connection idle for ``validate_after`` seconds or more is pinged before
+    it is handed out, so busy connections cost no extra round trip. Dead
+    connections, and new ones the server refuses, are retried up to
+    ``reconnect_attempts`` times with exponentially growing delays starting at
+    ``reconnect_delay``, all within the checkout timeout. ``disconnects_seen``
+    lets callers re-run idempotent reads whose connection died mid-call.
+    """
+
+    def __init__(self, db_config, pool_size=5, checkout_timeout=10, connect=mysql.connector.connect,
+                 validate_after=1.0, reconnect_attempts=5, reconnect_delay=0.1, max_reconnect_delay=2.0):
+        self.db_config = dict(db_config)
+        self.connect = connect
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.validate_after = validate_after
+        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._idle = LifoQueue()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._created = 0
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'failed_checkouts': 0,
+            'connections_opened': 0,
+            'connections_discarded': 0,
+            'validations': 0,
+            'reconnects': 0,
+            'reconnect_failures': 0,
+            'disconnects': 0,
+            'read_retries': 0,
+            'wait_time_total': 0.0
+        }
+
+    def count(self, stat, amount=1):
+        with self._lock:
+            self._stats[stat] += amount
+
+    def with_backoff(self, attempt, deadline):
+        """Call attempt() until it succeeds, sleeping exponentially longer between failures"""
+        delay = self.reconnect_delay
+        for tries in range(1, self.reconnect_attempts + 1):
+            try:
+                return attempt()
+            except errors.Error:
+                self.count('reconnect_failures')
+                if tries == self.reconnect_attempts or time.monotonic() + delay > deadline:
+                    raise
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _open_connection(self, deadline):
+        """Open a new connection if the pool still has room"""
+        with self._lock:
+            if self._created >= self.pool_size:
+                return None
+            self._created += 1
+        try:
+            connection = self.with_backoff(lambda: self.connect(**self.db_config), deadline)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._stats['connections_opened'] += 1
+        return connection
+
+    def _discard(self, connection):
+        """Close a connection and free its slot"""
+        try:
+            connection.close()
+        except errors.Error:
+            pass
+        with self._lock:
+            self._created -= 1
+            self._stats['connections_discarded'] += 1
+
+    def _reopen(self, connection):
+        """Reconnect a dead connection in place, or replace it through the factory"""
+        if hasattr(connection, 'reconnect'):
+            connection.reconnect()
+            return connection
+        try:
+            connection.close()
+        except errors.Error:
+            pass
+        return self.connect(**self.db_config)
+
+    def _validate(self, connection, idle_since, deadline):
+        """Ping a connection that sat idle, reconnecting it if the server dropped it"""
+        if time.monotonic() - idle_since < self.validate_after:
+            return connection
+        self.count('validations')
+        try:
+            connection.ping()
+            return connection
+        except errors.Error:
+            pass
+        try:
+            connection = self.with_backoff(lambda: self._reopen(connection), deadline)
+        except errors.Error:
+            # Give up the slot; the next checkout opens a fresh connection
+            self._discard(connection)
+            raise
+        self.count('reconnects')
+        return connection
+
+    def acquire(self, timeout=None):
+        """Check out a connection, waiting up to timeout seconds"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        try:
+            try:
+                connection = self._validate(*self._idle.get_nowait(), deadline)
+            except Empty:
+                connection = self._open_connection(deadline)
+                if connection is None:
+                    self.count('waits')
+                    try:
+                        idle = self._idle.get(timeout=max(0, deadline - time.monotonic()))
+                    except Empty:
+                        self.count('timeouts')
+                        raise errors.PoolError(
+                            f"Timed out after {timeout}s waiting for a database connection "
+                            f"(pool size {self.pool_size})"
+                        )
+                    connection = self._validate(*idle, deadline)
+        except errors.Error:
+            self.count('failed_checkouts')
+            raise
+
+        with self._lock:
+            self._stats['checkouts'] += 1
+            self._stats['wait_time_total'] += time.monotonic() - started
+        return connection
+
+    def release(self, connection, lost=False):
+        """Return a connection to the pool, resetting any open transaction.
+
+        No round trip is spent checking the connection: one that raised a
+        disconnect error is passed with ``lost`` and discarded, and one that
+        died while idle is caught by the ping before its next checkout.
+        """
+        if lost:
+            self._discard(connection)
+            return
+        try:
+            if connection.unread_result:
+                connection.consume_results()
+            if connection.in_transaction:
+                connection.rollback()
+        except errors.Error:
+            self._discard(connection)
+            return
+        self._idle.put((connection, time.monotonic()))
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks a connection out for one call"""
+        connection = self.acquire()
+        lost = False
+        try:
+            yield connection
+        except errors.Error as e:
+            if is_disconnect(e):
+                lost = True
+                self._local.disconnects = self.disconnects_seen() + 1
+                self.count('disconnects')
+            raise
+        finally:
+            self.release(connection, lost)
+
+    def disconnects_seen(self):
+        """Connections this thread has lost mid-call so far"""
+        return getattr(self._local, 'disconnects', 0)
+
+    def close_all(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                connection, idle_since = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(connection)
+
+    def stats(self):
+        """Get pool usage statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            created = self._created
+        idle = self._idle.qsize()
+        checkouts = stats.pop('checkouts')
+        wait_time_total = stats.pop('wait_time_total')
+        stats.update({
+            'pool_size': self.pool_size,
+            'checkout_timeout': self.checkout_timeout,
+            'open_connections': created,
+            'idle_connections': idle,
+            'in_use_connections': created - idle,
+            'checkouts': checkouts,
+            'avg_wait_ms': (wait_time_total / checkouts * 1000) if checkouts else 0.0
+        })
+        return stats
@@ -1,15 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from tkinter import scrolledtext
+from tkinter import scrolledtext, filedialog
 from auth_functions import AuthManager
+from async_loader import AsyncLoader
+from bulk_import import import_users, BATCH_SIZE
+from data_export import export_data
+from virtual_widgets import LazyTreeview, RecycledCardList
 import json
 from datetime import datetime
 
+# Pause in typing before the user directory search runs
+USER_SEARCH_DELAY_MS = 250
+
 class Dashboard:
     def __init__(self, root, user_data):
         self.root = root
         self.user_data = user_data
         self.auth = AuthManager()
+        self.loader = AsyncLoader(root)
         
         self.COLORS = {
             'primary': '#2c3e50',
@@ -103,6 +111,9 @@ class Dashboard:
 
     def handle_navigation(self, menu):
         """Handle navigation menu clicks"""
+        # Drop results still loading for the view being left
+        self.loader.new_view()
+        
         # Clear current content
         for widget in self.content_frame.winfo_children():
             widget.destroy()
@@ -138,6 +149,44 @@ class Dashboard:
         elif menu == 'System Reports' and self.user_data['role'] == 'Administrator':
             self.show_system_reports()
 
+    def load_async(self, container, fetch, render):
+        """Show a loading placeholder, run fetch on a worker and render its result"""
+        placeholder = tk.Label(container, text="Loading...", font=self.FONTS['body'],
+                              bg=self.COLORS['white'], fg=self.COLORS['text_light'])
+        placeholder.pack(pady=20)
+        
+        def on_loaded(result):
+            if not container.winfo_exists():
+                return
+            placeholder.destroy()
+            render(result)
+        
+        self.loader.submit(fetch, on_loaded)
+
+    def run_action(self, action, args, view=None, dialog=None, on_success=None):
+        """Run a write on a worker and report its outcome on the Tk thread.
+
+        The outcome is shown even if the user has moved on. On success the
+        dialog is closed, on_success is called and view is reopened, unless
+        another view has been opened in the meantime.
+        """
+        generation = self.loader.generation
+        
+        def on_done(result):
+            success, message = result
+            if not success:
+                messagebox.showerror("Error", message)
+                return
+            messagebox.showinfo("Success", message)
+            if dialog is not None:
+                dialog.destroy()
+            if on_success is not None:
+                on_success()
+            if view is not None and self.loader.generation == generation:
+                self.handle_navigation(view)
+        
+        self.loader.submit_action(action, on_done, *args)
+
     # Admin Features
     def show_admin_dashboard(self):
         """Show admin dashboard with statistics"""
@@ -147,57 +196,58 @@ class Dashboard:
         tk.Label(container, text="Admin Dashboard", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        # Get statistics
-        success, stats = self.auth.get_user_stats()
-        report_success, report_stats = self.auth.get_report_stats()
+        def render(result):
+            (success, stats), (report_success, report_stats) = result
         
-        if success and report_success:
-            # Statistics cards
-            stats_frame = tk.Frame(container, bg=self.COLORS['white'])
-            stats_frame.pack(fill='x', pady=20)
+            if success and report_success:
+                # Statistics cards
+                stats_frame = tk.Frame(container, bg=self.COLORS['white'])
+                stats_frame.pack(fill='x', pady=20)
             
-            # Total Users Card
-            total_card = self.create_stat_card(stats_frame, "Total Users", 
-                                             stats['total_users'], self.COLORS['primary'])
-            total_card.pack(side='left', padx=10, fill='x', expand=True)
+                # Total Users Card
+                total_card = self.create_stat_card(stats_frame, "Total Users", 
+                                                 stats['total_users'], self.COLORS['primary'])
+                total_card.pack(side='left', padx=10, fill='x', expand=True)
             
-            # Recent Registrations Card
-            recent_card = self.create_stat_card(stats_frame, "Recent Users (7 days)", 
-                                              stats['recent_registrations'], self.COLORS['success'])
-            recent_card.pack(side='left', padx=10, fill='x', expand=True)
+                # Recent Registrations Card
+                recent_card = self.create_stat_card(stats_frame, "Recent Users (7 days)", 
+                                                  stats['recent_registrations'], self.COLORS['success'])
+                recent_card.pack(side='left', padx=10, fill='x', expand=True)
             
-            # Total Reports Card
-            reports_card = self.create_stat_card(stats_frame, "Total Reports", 
-                                               report_stats['total_reports'], self.COLORS['warning'])
-            reports_card.pack(side='left', padx=10, fill='x', expand=True)
+                # Total Reports Card
+                reports_card = self.create_stat_card(stats_frame, "Total Reports", 
+                                                   report_stats['total_reports'], self.COLORS['warning'])
+                reports_card.pack(side='left', padx=10, fill='x', expand=True)
             
-            # Recent Reports Card
-            recent_reports_card = self.create_stat_card(stats_frame, "Recent Reports (7 days)", 
-                                                      report_stats['recent_reports'], self.COLORS['danger'])
-            recent_reports_card.pack(side='left', padx=10, fill='x', expand=True)
+                # Recent Reports Card
+                recent_reports_card = self.create_stat_card(stats_frame, "Recent Reports (7 days)", 
+                                                          report_stats['recent_reports'], self.COLORS['danger'])
+                recent_reports_card.pack(side='left', padx=10, fill='x', expand=True)
             
-            # Quick actions
-            actions_frame = tk.Frame(container, bg=self.COLORS['white'])
-            actions_frame.pack(fill='x', pady=20)
+                # Quick actions
+                actions_frame = tk.Frame(container, bg=self.COLORS['white'])
+                actions_frame.pack(fill='x', pady=20)
             
-            tk.Button(actions_frame, text="Manage Users", font=self.FONTS['body'],
-                     bg=self.COLORS['secondary'], fg='white', relief='raised',
-                     command=lambda: self.handle_navigation('User Management')).pack(side='left', padx=5)
+                tk.Button(actions_frame, text="Manage Users", font=self.FONTS['body'],
+                         bg=self.COLORS['secondary'], fg='white', relief='raised',
+                         command=lambda: self.handle_navigation('User Management')).pack(side='left', padx=5)
             
-            tk.Button(actions_frame, text="View Applications", font=self.FONTS['body'],
-                     bg=self.COLORS['success'], fg='white', relief='raised',
-                     command=lambda: self.handle_navigation('Applications')).pack(side='left', padx=5)
+                tk.Button(actions_frame, text="View Applications", font=self.FONTS['body'],
+                         bg=self.COLORS['success'], fg='white', relief='raised',
+                         command=lambda: self.handle_navigation('Applications')).pack(side='left', padx=5)
             
-            tk.Button(actions_frame, text="Report Management", font=self.FONTS['body'],
-                     bg=self.COLORS['warning'], fg='white', relief='raised',
-                     command=lambda: self.handle_navigation('Report Management')).pack(side='left', padx=5)
+                tk.Button(actions_frame, text="Report Management", font=self.FONTS['body'],
+                         bg=self.COLORS['warning'], fg='white', relief='raised',
+                         command=lambda: self.handle_navigation('Report Management')).pack(side='left', padx=5)
             
-            tk.Button(actions_frame, text="System Reports", font=self.FONTS['body'],
-                     bg=self.COLORS['info'], fg='white', relief='raised',
-                     command=lambda: self.handle_navigation('System Reports')).pack(side='left', padx=5)
-        else:
-            tk.Label(container, text="Could not load statistics", 
-                    font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+                tk.Button(actions_frame, text="System Reports", font=self.FONTS['body'],
+                         bg=self.COLORS['info'], fg='white', relief='raised',
+                         command=lambda: self.handle_navigation('System Reports')).pack(side='left', padx=5)
+            else:
+                tk.Label(container, text="Could not load statistics", 
+                        font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        
+        self.load_async(container, lambda: (self.auth.get_user_stats(), self.auth.get_report_stats()), render)
 
     def show_report_management(self):
         """Show admin report management interface"""
@@ -207,90 +257,123 @@ class Dashboard:
         tk.Label(container, text="Report Management - All Reports", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        # Get all reports
-        success, reports = self.auth.get_all_reports()
+        self.create_search_bar(container, lambda query: tree.reset(
+            (lambda page_cursor, page_size: self.auth.search_reports(query, None, page_cursor, page_size))
+            if query else self.auth.get_reports_page
+        ))
+        
+        # Create treeview for reports
+        tree_frame = tk.Frame(container, bg=self.COLORS['white'])
+        tree_frame.pack(fill='both', expand=True, pady=10)
+        
+        # Treeview scrollbar
+        scrollbar = ttk.Scrollbar(tree_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        def report_values(report):
+            created_date = report['created_at'].strftime('%Y-%m-%d') if report['created_at'] else 'N/A'
+            return (
+                report['id'], 
+                report['title'], 
+                report['reporter_name'],
+                report['category'],
+                report['priority'],
+                report['status'],
+                report['assigned_officer'] or 'Not Assigned',
+                created_date
+            )
         
-        if success:
-            # Create treeview for reports
-            tree_frame = tk.Frame(container, bg=self.COLORS['white'])
-            tree_frame.pack(fill='both', expand=True, pady=10)
-            
-            # Treeview scrollbar
-            scrollbar = ttk.Scrollbar(tree_frame)
-            scrollbar.pack(side='right', fill='y')
-            
-            # Treeview
-            tree = ttk.Treeview(tree_frame, columns=('ID', 'Title', 'Reporter', 'Category', 'Priority', 'Status', 'Assigned To', 'Created Date'), 
-                               show='headings', yscrollcommand=scrollbar.set, height=15)
-            
-            # Define headings
-            tree.heading('ID', text='ID')
-            tree.heading('Title', text='Report Title')
-            tree.heading('Reporter', text='Reporter')
-            tree.heading('Category', text='Category')
-            tree.heading('Priority', text='Priority')
-            tree.heading('Status', text='Status')
-            tree.heading('Assigned To', text='Assigned To')
-            tree.heading('Created Date', text='Created Date')
-            
-            # Configure columns
-            tree.column('ID', width=50)
-            tree.column('Title', width=200)
-            tree.column('Reporter', width=150)
-            tree.column('Category', width=120)
-            tree.column('Priority', width=80)
-            tree.column('Status', width=100)
-            tree.column('Assigned To', width=120)
-            tree.column('Created Date', width=120)
-            
-            # Add reports to treeview
-            for report in reports:
-                created_date = report['created_at'].strftime('%Y-%m-%d') if report['created_at'] else 'N/A'
-                tree.insert('', 'end', values=(
-                    report['id'], 
-                    report['title'], 
-                    report['reporter_name'],
-                    report['category'],
-                    report['priority'],
-                    report['status'],
-                    report['assigned_officer'] or 'Not Assigned',
-                    created_date
-                ))
-            
-            tree.pack(side='left', fill='both', expand=True)
-            scrollbar.config(command=tree.yview)
-            
-            # Action buttons frame
-            action_frame = tk.Frame(container, bg=self.COLORS['white'])
-            action_frame.pack(fill='x', pady=10)
-            
-            tk.Button(action_frame, text="Refresh", font=self.FONTS['body'],
-                     bg=self.COLORS['secondary'], fg='white', relief='raised',
-                     command=self.show_report_management).pack(side='left', padx=5)
-            
-            tk.Button(action_frame, text="View Details", font=self.FONTS['body'],
-                     bg=self.COLORS['primary'], fg='white', relief='raised',
-                     command=lambda: self.view_report_details(tree)).pack(side='left', padx=5)
-            
-            tk.Button(action_frame, text="Edit Report", font=self.FONTS['body'],
-                     bg=self.COLORS['warning'], fg='white', relief='raised',
-                     command=lambda: self.edit_report(tree)).pack(side='left', padx=5)
-            
-            tk.Button(action_frame, text="Update Status", font=self.FONTS['body'],
-                     bg=self.COLORS['success'], fg='white', relief='raised',
-                     command=lambda: self.update_report_status_dialog(tree)).pack(side='left', padx=5)
-            
-            tk.Button(action_frame, text="Assign Officer", font=self.FONTS['body'],
-                     bg=self.COLORS['info'], fg='white', relief='raised',
-                     command=lambda: self.assign_report_dialog(tree)).pack(side='left', padx=5)
-            
-            tk.Button(action_frame, text="Delete Report", font=self.FONTS['body'],
-                     bg=self.COLORS['danger'], fg='white', relief='raised',
-                     command=lambda: self.delete_report(tree)).pack(side='left', padx=5)
-            
-        else:
-            tk.Label(container, text="No reports found.", 
-                    font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        def show_error(message):
+            messagebox.showerror("Error", f"Could not load reports:\n{message}")
+        
+        # Treeview - reports are paged in as the user scrolls
+        tree = LazyTreeview(tree_frame, self.loader, self.auth.get_reports_page, report_values,
+                            scrollbar=scrollbar, on_error=show_error,
+                            columns=('ID', 'Title', 'Reporter', 'Category', 'Priority', 'Status', 'Assigned To', 'Created Date'), 
+                            show='headings', height=15, selectmode='extended')
+        
+        # Define headings
+        tree.heading('ID', text='ID')
+        tree.heading('Title', text='Report Title')
+        tree.heading('Reporter', text='Reporter')
+        tree.heading('Category', text='Category')
+        tree.heading('Priority', text='Priority')
+        tree.heading('Status', text='Status')
+        tree.heading('Assigned To', text='Assigned To')
+        tree.heading('Created Date', text='Created Date')
+        
+        # Configure columns
+        tree.column('ID', width=50)
+        tree.column('Title', width=200)
+        tree.column('Reporter', width=150)
+        tree.column('Category', width=120)
+        tree.column('Priority', width=80)
+        tree.column('Status', width=100)
+        tree.column('Assigned To', width=120)
+        tree.column('Created Date', width=120)
+        
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=tree.yview)
+        
+        # Action buttons frame
+        action_frame = tk.Frame(container, bg=self.COLORS['white'])
+        action_frame.pack(fill='x', pady=10)
+        
+        tk.Button(action_frame, text="Refresh", font=self.FONTS['body'],
+                 bg=self.COLORS['secondary'], fg='white', relief='raised',
+                 command=lambda: self.handle_navigation('Report Management')).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="View Details", font=self.FONTS['body'],
+                 bg=self.COLORS['primary'], fg='white', relief='raised',
+                 command=lambda: self.view_report_details(tree)).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Edit Report", font=self.FONTS['body'],
+                 bg=self.COLORS['warning'], fg='white', relief='raised',
+                 command=lambda: self.edit_report(tree)).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Update Status", font=self.FONTS['body'],
+                 bg=self.COLORS['success'], fg='white', relief='raised',
+                 command=lambda: self.update_report_status_dialog(tree)).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Assign Officer", font=self.FONTS['body'],
+                 bg=self.COLORS['info'], fg='white', relief='raised',
+                 command=lambda: self.assign_report_dialog(tree)).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Delete Report", font=self.FONTS['body'],
+                 bg=self.COLORS['danger'], fg='white', relief='raised',
+                 command=lambda: self.delete_report(tree)).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Export", font=self.FONTS['body'],
+                 bg=self.COLORS['primary'], fg='white', relief='raised',
+                 command=lambda: self.export_dialog('reports')).pack(side='left', padx=5)
+        
+        tree.load_next()
+
+    def create_search_bar(self, container, on_search):
+        """Create a search entry that calls on_search(query); an empty query clears the search"""
+        search_frame = tk.Frame(container, bg=self.COLORS['white'])
+        search_frame.pack(fill='x', pady=5)
+        
+        tk.Label(search_frame, text="Search:", font=self.FONTS['body'], 
+                bg=self.COLORS['white']).pack(side='left')
+        
+        search_entry = tk.Entry(search_frame, font=self.FONTS['body'], width=40)
+        search_entry.pack(side='left', padx=5)
+        search_entry.bind('<Return>', lambda e: on_search(search_entry.get().strip()))
+        
+        def clear_search():
+            search_entry.delete(0, tk.END)
+            on_search('')
+        
+        tk.Button(search_frame, text="Search", font=self.FONTS['body'],
+                 bg=self.COLORS['secondary'], fg='white', relief='raised',
+                 command=lambda: on_search(search_entry.get().strip())).pack(side='left', padx=5)
+        
+        tk.Button(search_frame, text="Clear", font=self.FONTS['body'],
+                 bg=self.COLORS['text_light'], fg='white', relief='raised',
+                 command=clear_search).pack(side='left', padx=5)
+        
+        return search_frame
 
     def view_report_details(self, tree):
         """View detailed information about selected report"""
@@ -298,37 +381,41 @@ class Dashboard:
         if not selected:
             messagebox.showwarning("Warning", "Please select a report first")
             return
+        if len(selected) > 1:
+            messagebox.showwarning("Warning", "Please select a single report")
+            return
         
         report_id = tree.item(selected[0])['values'][0]
-        success, report = self.auth.get_report_by_id(report_id)
-        
-        if success:
-            # Create details dialog
-            dialog = tk.Toplevel(self.root)
-            dialog.title(f"Report Details - ID: {report_id}")
-            dialog.geometry("600x500")
-            dialog.configure(bg=self.COLORS['white'])
-            dialog.transient(self.root)
-            dialog.grab_set()
-            
-            # Main container
-            main_frame = tk.Frame(dialog, bg=self.COLORS['white'])
-            main_frame.pack(fill='both', expand=True, padx=20, pady=20)
-            
-            tk.Label(main_frame, text=f"Report Details - ID: {report_id}", 
-                    font=self.FONTS['header'], bg=self.COLORS['white']).pack(pady=10)
-            
-            # Create scrollable frame
-            canvas = tk.Canvas(main_frame, bg=self.COLORS['white'], highlightthickness=0)
-            scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg=self.COLORS['white'])
-            
-            scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
+        def show_details(result):
+            success, report = result
             
-            # Report details
-            details_text = f"""
+            if success:
+                # Create details dialog
+                dialog = tk.Toplevel(self.root)
+                dialog.title(f"Report Details - ID: {report_id}")
+                dialog.geometry("600x500")
+                dialog.configure(bg=self.COLORS['white'])
+                dialog.transient(self.root)
+                dialog.grab_set()
+                
+                # Main container
+                main_frame = tk.Frame(dialog, bg=self.COLORS['white'])
+                main_frame.pack(fill='both', expand=True, padx=20, pady=20)
+                
+                tk.Label(main_frame, text=f"Report Details - ID: {report_id}", 
+                        font=self.FONTS['header'], bg=self.COLORS['white']).pack(pady=10)
+                
+                # Create scrollable frame
+                canvas = tk.Canvas(main_frame, bg=self.COLORS['white'], highlightthickness=0)
+                scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+                scrollable_frame = tk.Frame(canvas, bg=self.COLORS['white'])
+                
+                scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+                canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+                canvas.configure(yscrollcommand=scrollbar.set)
+                
+                # Report details
+                details_text = f"""
 Report Information:
 ─────────────────
 ID: {report['id']}
@@ -353,22 +440,24 @@ Created Date: {report['created_at'].strftime('%Y-%m-%d %H:%M') if report['create
 Resolved Date: {report['resolved_at'].strftime('%Y-%m-%d %H:%M') if report['resolved_at'] else 'Not resolved'}
 
 Feedback: {report['feedback'] or 'No feedback provided'}
-            """
-            
-            details_display = scrolledtext.ScrolledText(scrollable_frame, width=70, height=20, font=self.FONTS['body'])
-            details_display.pack(fill='both', expand=True, padx=10, pady=10)
-            details_display.insert('1.0', details_text)
-            details_display.config(state='disabled')
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-            
-            # Close button
-            tk.Button(main_frame, text="Close", font=self.FONTS['body'],
-                     bg=self.COLORS['secondary'], fg='white', relief='raised',
-                     command=dialog.destroy).pack(pady=10)
-        else:
-            messagebox.showerror("Error", report)
+                """
+                
+                details_display = scrolledtext.ScrolledText(scrollable_frame, width=70, height=20, font=self.FONTS['body'])
+                details_display.pack(fill='both', expand=True, padx=10, pady=10)
+                details_display.insert('1.0', details_text)
+                details_display.config(state='disabled')
+                
+                canvas.pack(side="left", fill="both", expand=True)
+                scrollbar.pack(side="right", fill="y")
+                
+                # Close button
+                tk.Button(main_frame, text="Close", font=self.FONTS['body'],
+                         bg=self.COLORS['secondary'], fg='white', relief='raised',
+                         command=dialog.destroy).pack(pady=10)
+            else:
+                messagebox.showerror("Error", report)
+        
+        self.loader.submit(self.auth.get_report_by_id, show_details, report_id)
 
     def edit_report(self, tree):
         """Edit report details"""
@@ -376,97 +465,96 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         if not selected:
             messagebox.showwarning("Warning", "Please select a report first")
             return
+        if len(selected) > 1:
+            messagebox.showwarning("Warning", "Please select a single report")
+            return
         
         report_id = tree.item(selected[0])['values'][0]
-        success, report = self.auth.get_report_by_id(report_id)
-        
-        if success:
-            # Create edit dialog
-            dialog = tk.Toplevel(self.root)
-            dialog.title(f"Edit Report - ID: {report_id}")
-            dialog.geometry("500x600")
-            dialog.configure(bg=self.COLORS['white'])
-            dialog.transient(self.root)
-            dialog.grab_set()
-            
-            tk.Label(dialog, text=f"Edit Report - ID: {report_id}", 
-                    font=self.FONTS['header'], bg=self.COLORS['white']).pack(pady=10)
-            
-            form_frame = tk.Frame(dialog, bg=self.COLORS['white'])
-            form_frame.pack(fill='both', expand=True, padx=20, pady=10)
-            
-            # Title
-            tk.Label(form_frame, text="Title *", font=self.FONTS['body'], 
-                    bg=self.COLORS['white']).pack(anchor='w', pady=5)
-            title_entry = tk.Entry(form_frame, width=50, font=self.FONTS['body'])
-            title_entry.insert(0, report['title'])
-            title_entry.pack(fill='x', pady=5)
+        def show_form(result):
+            success, report = result
             
-            # Category
-            tk.Label(form_frame, text="Category *", font=self.FONTS['body'], 
-                    bg=self.COLORS['white']).pack(anchor='w', pady=5)
-            category_var = tk.StringVar(value=report['category'])
-            category_combo = ttk.Combobox(form_frame, textvariable=category_var,
-                                         values=["Infrastructure", "Health", "Education", "Utility", "Environment", "Other"],
-                                         state="readonly", width=50)
-            category_combo.pack(fill='x', pady=5)
-            
-            # Priority
-            tk.Label(form_frame, text="Priority", font=self.FONTS['body'], 
-                    bg=self.COLORS['white']).pack(anchor='w', pady=5)
-            priority_var = tk.StringVar(value=report['priority'])
-            priority_combo = ttk.Combobox(form_frame, textvariable=priority_var,
-                                         values=["Low", "Medium", "High", "Emergency"],
-                                         state="readonly", width=50)
-            priority_combo.pack(fill='x', pady=5)
-            
-            # Location
-            tk.Label(form_frame, text="Location", font=self.FONTS['body'], 
-                    bg=self.COLORS['white']).pack(anchor='w', pady=5)
-            location_entry = tk.Entry(form_frame, width=50, font=self.FONTS['body'])
-            location_entry.insert(0, report['location'] or '')
-            location_entry.pack(fill='x', pady=5)
-            
-            # Description
-            tk.Label(form_frame, text="Description *", font=self.FONTS['body'], 
-                    bg=self.COLORS['white']).pack(anchor='w', pady=5)
-            desc_text = scrolledtext.ScrolledText(form_frame, width=50, height=10, font=self.FONTS['body'])
-            desc_text.pack(fill='both', expand=True, pady=5)
-            desc_text.insert('1.0', report['description'])
-            
-            def save_changes():
-                title = title_entry.get().strip()
-                description = desc_text.get('1.0', tk.END).strip()
-                location = location_entry.get().strip()
+            if success:
+                # Create edit dialog
+                dialog = tk.Toplevel(self.root)
+                dialog.title(f"Edit Report - ID: {report_id}")
+                dialog.geometry("500x600")
+                dialog.configure(bg=self.COLORS['white'])
+                dialog.transient(self.root)
+                dialog.grab_set()
                 
-                if not title or not description:
-                    messagebox.showwarning("Warning", "Please fill in all required fields")
-                    return
+                tk.Label(dialog, text=f"Edit Report - ID: {report_id}", 
+                        font=self.FONTS['header'], bg=self.COLORS['white']).pack(pady=10)
                 
-                success, message = self.auth.update_report_details(
-                    report_id, title, description, category_var.get(), priority_var.get()
-                )
+                form_frame = tk.Frame(dialog, bg=self.COLORS['white'])
+                form_frame.pack(fill='both', expand=True, padx=20, pady=10)
                 
-                if success:
-                    messagebox.showinfo("Success", message)
-                    dialog.destroy()
-                    self.show_report_management()
-                else:
-                    messagebox.showerror("Error", message)
-            
-            # Buttons frame
-            button_frame = tk.Frame(form_frame, bg=self.COLORS['white'])
-            button_frame.pack(fill='x', pady=10)
-            
-            tk.Button(button_frame, text="Save Changes", font=self.FONTS['body'],
-                     bg=self.COLORS['success'], fg='white', relief='raised',
-                     command=save_changes).pack(side='left', padx=5)
-            
-            tk.Button(button_frame, text="Cancel", font=self.FONTS['body'],
-                     bg=self.COLORS['secondary'], fg='white', relief='raised',
-                     command=dialog.destroy).pack(side='left', padx=5)
-        else:
-            messagebox.showerror("Error", report)
+                # Title
+                tk.Label(form_frame, text="Title *", font=self.FONTS['body'], 
+                        bg=self.COLORS['white']).pack(anchor='w', pady=5)
+                title_entry = tk.Entry(form_frame, width=50, font=self.FONTS['body'])
+                title_entry.insert(0, report['title'])
+                title_entry.pack(fill='x', pady=5)
+                
+                # Category
+                tk.Label(form_frame, text="Category *", font=self.FONTS['body'], 
+                        bg=self.COLORS['white']).pack(anchor='w', pady=5)
+                category_var = tk.StringVar(value=report['category'])
+                category_combo = ttk.Combobox(form_frame, textvariable=category_var,
+                                             values=["Infrastructure", "Health", "Education", "Utility", "Environment", "Other"],
+                                             state="readonly", width=50)
+                category_combo.pack(fill='x', pady=5)
+                
+                # Priority
+                tk.Label(form_frame, text="Priority", font=self.FONTS['body'], 
+                        bg=self.COLORS['white']).pack(anchor='w', pady=5)
+                priority_var = tk.StringVar(value=report['priority'])
+                priority_combo = ttk.Combobox(form_frame, textvariable=priority_var,
+                                             values=["Low", "Medium", "High", "Emergency"],
+                                             state="readonly", width=50)
+                priority_combo.pack(fill='x', pady=5)
+                
+                # Location
+                tk.Label(form_frame, text="Location", font=self.FONTS['body'], 
+                        bg=self.COLORS['white']).pack(anchor='w', pady=5)
+                location_entry = tk.Entry(form_frame, width=50, font=self.FONTS['body'])
+                location_entry.insert(0, report['location'] or '')
+                location_entry.pack(fill='x', pady=5)
+                
+                # Description
+                tk.Label(form_frame, text="Description *", font=self.FONTS['body'], 
+                        bg=self.COLORS['white']).pack(anchor='w', pady=5)
+                desc_text = scrolledtext.ScrolledText(form_frame, width=50, height=10, font=self.FONTS['body'])
+                desc_text.pack(fill='both', expand=True, pady=5)
+                desc_text.insert('1.0', report['description'])
+                
+                def save_changes():
+                    title = title_entry.get().strip()
+                    description = desc_text.get('1.0', tk.END).strip()
+                    location = location_entry.get().strip()
+                    
+                    if not title or not description:
+                        messagebox.showwarning("Warning", "Please fill in all required fields")
+                        return
+                    
+                    self.run_action(self.auth.update_report_details,
+                                    (report_id, title, description, category_var.get(), priority_var.get()),
+                                    view='Report Management', dialog=dialog)
+                
+                # Buttons frame
+                button_frame = tk.Frame(form_frame, bg=self.COLORS['white'])
+                button_frame.pack(fill='x', pady=10)
+                
+                tk.Button(button_frame, text="Save Changes", font=self.FONTS['body'],
+                         bg=self.COLORS['success'], fg='white', relief='raised',
+                         command=save_changes).pack(side='left', padx=5)
+                
+                tk.Button(button_frame, text="Cancel", font=self.FONTS['body'],
+                         bg=self.COLORS['secondary'], fg='white', relief='raised',
+                         command=dialog.destroy).pack(side='left', padx=5)
+            else:
+                messagebox.showerror("Error", report)
+        
+        self.loader.submit(self.auth.get_report_by_id, show_form, report_id)
 
     def update_report_status_dialog(self, tree):
         """Update report status dialog"""
@@ -475,7 +563,7 @@ Feedback: {report['feedback'] or 'No feedback provided'}
             messagebox.showwarning("Warning", "Please select a report first")
             return
         
-        report_id = tree.item(selected[0])['values'][0]
+        report_ids = [tree.item(item)['values'][0] for item in selected]
         
         # Create status update dialog
         dialog = tk.Toplevel(self.root)
@@ -485,7 +573,7 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         dialog.transient(self.root)
         dialog.grab_set()
         
-        tk.Label(dialog, text="Update Report Status", 
+        tk.Label(dialog, text="Update Report Status" if len(report_ids) == 1 else f"Update Status of {len(report_ids)} Reports", 
                 font=self.FONTS['header'], bg=self.COLORS['white']).pack(pady=10)
         
         form_frame = tk.Frame(dialog, bg=self.COLORS['white'])
@@ -508,17 +596,10 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         
         def update_status():
             feedback = feedback_text.get('1.0', tk.END).strip()
-            
-            success, message = self.auth.update_report_status(
-                report_id, status_var.get(), None, feedback
-            )
-            
-            if success:
-                messagebox.showinfo("Success", message)
-                dialog.destroy()
-                self.show_report_management()
-            else:
-                messagebox.showerror("Error", message)
+
+            # Keeps the assigned officer, and the current feedback when the box is left empty
+            self.run_action(self.auth.bulk_update_report_status, (report_ids, status_var.get(), feedback),
+                            view='Report Management', dialog=dialog)
         
         tk.Button(form_frame, text="Update Status", font=self.FONTS['body'],
                  bg=self.COLORS['success'], fg='white', relief='raised',
@@ -531,83 +612,99 @@ Feedback: {report['feedback'] or 'No feedback provided'}
             messagebox.showwarning("Warning", "Please select a report first")
             return
         
-        report_id = tree.item(selected[0])['values'][0]
-        
-        # Get available officers
-        success, users = self.auth.get_all_users(self.user_data['id'])
-        officers = [user for user in users if user['role'] == 'Government Officer' and user['status'] == 'Active'] if success else []
-        
-        if not officers:
-            messagebox.showwarning("Warning", "No active government officers available")
-            return
-        
-        # Create assignment dialog
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Assign Report to Officer")
-        dialog.geometry("400x200")
-        dialog.configure(bg=self.COLORS['white'])
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        tk.Label(dialog, text="Assign Report to Officer", 
-                font=self.FONTS['header'], bg=self.COLORS['white']).pack(pady=10)
-        
-        form_frame = tk.Frame(dialog, bg=self.COLORS['white'])
-        form_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        report_ids = [tree.item(item)['values'][0] for item in selected]
         
-        # Officer selection
-        tk.Label(form_frame, text="Select Officer *", font=self.FONTS['body'], 
-                bg=self.COLORS['white']).pack(anchor='w', pady=5)
-        
-        officer_var = tk.StringVar()
-        officer_combo = ttk.Combobox(form_frame, textvariable=officer_var, width=40)
-        officer_combo['values'] = [f"{officer['full_name']} ({officer['department']})" for officer in officers]
-        officer_combo.pack(fill='x', pady=5)
-        
-        def assign_officer():
-            selected_officer = officer_var.get()
-            if not selected_officer:
-                messagebox.showwarning("Warning", "Please select an officer")
+        # Load available officers, then show the dialog
+        def show_dialog(result):
+            success, officers = result
+            if not success:
+                officers = []
+            
+            if not officers:
+                messagebox.showwarning("Warning", "No active government officers available")
                 return
             
-            # Extract officer ID from selection
-            officer_name = selected_officer.split(' (')[0]
-            officer = next((o for o in officers if o['full_name'] == officer_name), None)
+            # Create assignment dialog
+            dialog = tk.Toplevel(self.root)
+            dialog.title("Assign Report to Officer")
+            dialog.geometry("400x200")
+            dialog.configure(bg=self.COLORS['white'])
+            dialog.transient(self.root)
+            dialog.grab_set()
+            
+            tk.Label(dialog, text="Assign Report to Officer" if len(report_ids) == 1 else f"Assign {len(report_ids)} Reports to Officer", 
+                    font=self.FONTS['header'], bg=self.COLORS['white']).pack(pady=10)
+            
+            form_frame = tk.Frame(dialog, bg=self.COLORS['white'])
+            form_frame.pack(fill='both', expand=True, padx=20, pady=10)
+            
+            # Officer selection
+            tk.Label(form_frame, text="Select Officer *", font=self.FONTS['body'], 
+                    bg=self.COLORS['white']).pack(anchor='w', pady=5)
+            
+            officer_var = tk.StringVar()
+            officer_combo = ttk.Combobox(form_frame, textvariable=officer_var, width=40, state='readonly')
+            officer_combo['values'] = [f"{officer['full_name']} ({officer['department']})" for officer in officers]
+            officer_combo.pack(fill='x', pady=5)
             
-            if officer:
-                success, message = self.auth.assign_report_to_officer(report_id, officer['id'])
+            def assign_officer():
+                selected_index = officer_combo.current()
+                if selected_index < 0:
+                    messagebox.showwarning("Warning", "Please select an officer")
+                    return
                 
-                if success:
-                    messagebox.showinfo("Success", message)
-                    dialog.destroy()
-                    self.show_report_management()
+                # Combobox entries are in the same order as officers
+                officer = officers[selected_index]
+                if len(report_ids) == 1:
+                    self.run_action(self.auth.assign_report_to_officer, (report_ids[0], officer['id']),
+                                    view='Report Management', dialog=dialog)
                 else:
-                    messagebox.showerror("Error", message)
-            else:
-                messagebox.showerror("Error", "Selected officer not found")
+                    self.run_action(self.auth.bulk_assign_reports, (report_ids, officer['id']),
+                                    view='Report Management', dialog=dialog)
+            
+            tk.Button(form_frame, text="Assign Officer", font=self.FONTS['body'],
+                     bg=self.COLORS['success'], fg='white', relief='raised',
+                     command=assign_officer).pack(pady=10)
         
-        tk.Button(form_frame, text="Assign Officer", font=self.FONTS['body'],
-                 bg=self.COLORS['success'], fg='white', relief='raised',
-                 command=assign_officer).pack(pady=10)
+        self.loader.submit(self.auth.get_active_officers, show_dialog)
 
     def delete_report(self, tree):
-        """Delete selected report"""
+        """Delete the selected reports"""
         selected = tree.selection()
         if not selected:
             messagebox.showwarning("Warning", "Please select a report first")
             return
         
-        report_id = tree.item(selected[0])['values'][0]
-        report_title = tree.item(selected[0])['values'][1]
+        report_ids = [tree.item(item)['values'][0] for item in selected]
+        if len(report_ids) == 1:
+            prompt = f"Are you sure you want to delete report:\n'{tree.item(selected[0])['values'][1]}'?"
+        else:
+            prompt = f"Are you sure you want to delete {len(report_ids)} reports?"
         
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete report:\n'{report_title}'?"):
-            success, message = self.auth.delete_report(report_id)
-            
+        if messagebox.askyesno("Confirm Delete", prompt):
+            if len(report_ids) == 1:
+                self.run_action(self.auth.delete_report, (report_ids[0],), view='Report Management')
+            else:
+                self.run_action(self.auth.bulk_delete_reports, (report_ids,), view='Report Management')
+
+    def export_dialog(self, entity):
+        """Export all reports or applications to a file chosen by the user"""
+        output_path = filedialog.asksaveasfilename(
+            title=f"Export {entity.title()}", defaultextension='.csv',
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"),
+                       ("Compressed CSV", "*.csv.gz"), ("Compressed JSON Lines", "*.jsonl.gz")]
+        )
+        if not output_path:
+            return
+        
+        def on_exported(result):
+            success, summary = result
             if success:
-                messagebox.showinfo("Success", message)
-                self.show_report_management()
+                messagebox.showinfo("Export Complete", f"Exported {summary['rows']} {entity} to:\n{summary['path']}")
             else:
-                messagebox.showerror("Error", message)
+                messagebox.showerror("Error", summary)
+        
+        self.loader.submit_action(export_data, on_exported, entity, output_path)
 
     def create_stat_card(self, parent, title, value, color):
         """Create a statistics card"""
@@ -627,140 +724,202 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text="User Management", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        # Get all users
-        success, users = self.auth.get_all_users(self.user_data['id'])
+        # Type-ahead search by name, username, phone or NID
+        search_frame = tk.Frame(container, bg=self.COLORS['white'])
+        search_frame.pack(fill='x', pady=5)
         
-        if success:
-            # Create treeview for users
-            tree_frame = tk.Frame(container, bg=self.COLORS['white'])
-            tree_frame.pack(fill='both', expand=True, pady=10)
-            
-            # Treeview scrollbar
-            scrollbar = ttk.Scrollbar(tree_frame)
-            scrollbar.pack(side='right', fill='y')
-            
-            # Treeview
-            tree = ttk.Treeview(tree_frame, columns=('ID', 'Name', 'Username', 'Email', 'Phone', 'Role', 'Department', 'Status'), 
-                               show='headings', yscrollcommand=scrollbar.set)
-            
-            # Define headings
-            tree.heading('ID', text='ID')
-            tree.heading('Name', text='Full Name')
-            tree.heading('Username', text='Username')
-            tree.heading('Email', text='Email')
-            tree.heading('Phone', text='Phone')
-            tree.heading('Role', text='Role')
-            tree.heading('Department', text='Department')
-            tree.heading('Status', text='Status')
-            
-            # Configure columns
-            tree.column('ID', width=50)
-            tree.column('Name', width=150)
-            tree.column('Username', width=100)
-            tree.column('Email', width=150)
-            tree.column('Phone', width=100)
-            tree.column('Role', width=120)
-            tree.column('Department', width=120)
-            tree.column('Status', width=80)
-            
-            # Add users to treeview
-            for user in users:
-                tree.insert('', 'end', values=(
-                    user['id'], user['full_name'], user['username'], 
-                    user['email'] or 'N/A', user['phone'], user['role'], 
-                    user['department'] or 'N/A', user['status']
-                ))
-            
-            tree.pack(side='left', fill='both', expand=True)
-            scrollbar.config(command=tree.yview)
-            
-            # Action buttons frame
-            action_frame = tk.Frame(container, bg=self.COLORS['white'])
-            action_frame.pack(fill='x', pady=10)
-            
-            tk.Button(action_frame, text="Refresh", font=self.FONTS['body'],
-                     bg=self.COLORS['secondary'], fg='white', relief='raised',
-                     command=self.show_user_management).pack(side='left', padx=5)
-            
-            tk.Button(action_frame, text="Activate User", font=self.FONTS['body'],
-                     bg=self.COLORS['success'], fg='white', relief='raised',
-                     command=lambda: self.update_user_status(tree, 'Active')).pack(side='left', padx=5)
-            
-            tk.Button(action_frame, text="Suspend User", font=self.FONTS['body'],
-                     bg=self.COLORS['warning'], fg='white', relief='raised',
-                     command=lambda: self.update_user_status(tree, 'Suspended')).pack(side='left', padx=5)
-            
-            tk.Button(action_frame, text="Delete User", font=self.FONTS['body'],
-                     bg=self.COLORS['danger'], fg='white', relief='raised',
-                     command=lambda: self.delete_user(tree)).pack(side='left', padx=5)
-            
-            # Role update
-            role_frame = tk.Frame(action_frame, bg=self.COLORS['white'])
-            role_frame.pack(side='left', padx=20)
-            
-            tk.Label(role_frame, text="Change Role:", font=self.FONTS['body'], 
-                    bg=self.COLORS['white']).pack(side='left')
-            
-            role_var = tk.StringVar(value="Citizen")
-            role_combo = ttk.Combobox(role_frame, textvariable=role_var, 
-                                     values=["Citizen", "Government Officer", "Administrator"],
-                                     state="readonly", width=15)
-            role_combo.pack(side='left', padx=5)
-            
-            tk.Button(role_frame, text="Update Role", font=self.FONTS['body'],
-                     bg=self.COLORS['secondary'], fg='white', relief='raised',
-                     command=lambda: self.update_user_role(tree, role_var.get())).pack(side='left', padx=5)
+        tk.Label(search_frame, text="Find user (name, username, phone or NID):", font=self.FONTS['body'], 
+                bg=self.COLORS['white']).pack(side='left')
+        
+        search_var = tk.StringVar()
+        tk.Entry(search_frame, textvariable=search_var, font=self.FONTS['body'], width=40).pack(side='left', padx=5)
+        
+        def users_page(page_cursor, page_size):
+            return self.auth.get_users_page(self.user_data['id'], page_cursor, page_size)
+        
+        def search_page(prefix):
+            def fetch(page_cursor, page_size):
+                success, users = self.auth.search_users(prefix, page_size, self.user_data['id'])
+                if not success:
+                    return False, users
+                return True, {'rows': users, 'next_cursor': None}
+            return fetch
+        
+        search_job = [None]
+        
+        def run_search():
+            search_job[0] = None
+            if not tree.winfo_exists():
+                return
+            prefix = search_var.get().strip()
+            tree.reset(search_page(prefix) if prefix else users_page)
+        
+        def on_search_changed(*args):
+            # Debounce: only search once typing pauses
+            if search_job[0] is not None:
+                self.root.after_cancel(search_job[0])
+            search_job[0] = self.root.after(USER_SEARCH_DELAY_MS, run_search)
+        
+        search_var.trace_add('write', on_search_changed)
+        
+        # Create treeview for users
+        tree_frame = tk.Frame(container, bg=self.COLORS['white'])
+        tree_frame.pack(fill='both', expand=True, pady=10)
+        
+        # Treeview scrollbar
+        scrollbar = ttk.Scrollbar(tree_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        def user_values(user):
+            return (
+                user['id'], user['full_name'], user['username'], 
+                user['email'] or 'N/A', user['phone'], user['role'], 
+                user['department'] or 'N/A', user['status']
+            )
+        
+        def show_error(message):
+            messagebox.showerror("Error", f"Could not load users:\n{message}")
+        
+        # Treeview - users are paged in as the user scrolls
+        tree = LazyTreeview(tree_frame, self.loader, users_page, user_values,
+                            scrollbar=scrollbar, on_error=show_error,
+                            columns=('ID', 'Name', 'Username', 'Email', 'Phone', 'Role', 'Department', 'Status'), 
+                            show='headings', selectmode='extended')
+        
+        # Define headings
+        tree.heading('ID', text='ID')
+        tree.heading('Name', text='Full Name')
+        tree.heading('Username', text='Username')
+        tree.heading('Email', text='Email')
+        tree.heading('Phone', text='Phone')
+        tree.heading('Role', text='Role')
+        tree.heading('Department', text='Department')
+        tree.heading('Status', text='Status')
+        
+        # Configure columns
+        tree.column('ID', width=50)
+        tree.column('Name', width=150)
+        tree.column('Username', width=100)
+        tree.column('Email', width=150)
+        tree.column('Phone', width=100)
+        tree.column('Role', width=120)
+        tree.column('Department', width=120)
+        tree.column('Status', width=80)
+        
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=tree.yview)
+        
+        # Action buttons frame
+        action_frame = tk.Frame(container, bg=self.COLORS['white'])
+        action_frame.pack(fill='x', pady=10)
+        
+        tk.Button(action_frame, text="Refresh", font=self.FONTS['body'],
+                 bg=self.COLORS['secondary'], fg='white', relief='raised',
+                 command=lambda: self.handle_navigation('User Management')).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Activate User", font=self.FONTS['body'],
+                 bg=self.COLORS['success'], fg='white', relief='raised',
+                 command=lambda: self.update_user_status(tree, 'Active')).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Suspend User", font=self.FONTS['body'],
+                 bg=self.COLORS['warning'], fg='white', relief='raised',
+                 command=lambda: self.update_user_status(tree, 'Suspended')).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Delete User", font=self.FONTS['body'],
+                 bg=self.COLORS['danger'], fg='white', relief='raised',
+                 command=lambda: self.delete_user(tree)).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Import CSV", font=self.FONTS['body'],
+                 bg=self.COLORS['primary'], fg='white', relief='raised',
+                 command=self.import_users_dialog).pack(side='left', padx=5)
+        
+        # Role update
+        role_frame = tk.Frame(action_frame, bg=self.COLORS['white'])
+        role_frame.pack(side='left', padx=20)
+        
+        tk.Label(role_frame, text="Change Role:", font=self.FONTS['body'], 
+                bg=self.COLORS['white']).pack(side='left')
+        
+        role_var = tk.StringVar(value="Citizen")
+        role_combo = ttk.Combobox(role_frame, textvariable=role_var, 
+                                 values=["Citizen", "Government Officer", "Administrator"],
+                                 state="readonly", width=15)
+        role_combo.pack(side='left', padx=5)
+        
+        tk.Button(role_frame, text="Update Role", font=self.FONTS['body'],
+                 bg=self.COLORS['secondary'], fg='white', relief='raised',
+                 command=lambda: self.update_user_role(tree, role_var.get())).pack(side='left', padx=5)
+        
+        tree.load_next()
 
     def update_user_status(self, tree, status):
-        """Update selected user status"""
+        """Update status of the selected users"""
         selected = tree.selection()
         if not selected:
             messagebox.showwarning("Warning", "Please select a user first")
             return
         
-        user_id = tree.item(selected[0])['values'][0]
-        success, message = self.auth.update_user_status(user_id, status)
-        
-        if success:
-            messagebox.showinfo("Success", message)
-            self.show_user_management()
+        user_ids = [tree.item(item)['values'][0] for item in selected]
+        if len(user_ids) == 1:
+            self.run_action(self.auth.update_user_status, (user_ids[0], status), view='User Management')
         else:
-            messagebox.showerror("Error", message)
+            self.run_action(self.auth.bulk_update_user_status, (user_ids, status), view='User Management')
+
+    def import_users_dialog(self):
+        """Bulk import users from a CSV file"""
+        csv_path = filedialog.askopenfilename(title="Import Users",
+                                              filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not csv_path:
+            return
+        
+        generation = self.loader.generation
+        
+        def on_imported(result):
+            success, summary = result
+            if success:
+                message = f"Imported {summary['imported']} of {summary['rows']} users."
+                if summary['rejected']:
+                    message += f"\n{summary['rejected']} rows were rejected, see:\n{summary['rejects_path']}"
+                messagebox.showinfo("Import Complete", message)
+                # Refresh the user list only if it is still the open view
+                if self.loader.generation == generation:
+                    self.handle_navigation('User Management')
+            else:
+                messagebox.showerror("Error", summary)
+        
+        self.loader.submit_action(import_users, on_imported, csv_path, None, BATCH_SIZE, self.auth)
 
     def delete_user(self, tree):
-        """Delete selected user"""
+        """Delete the selected users"""
         selected = tree.selection()
         if not selected:
             messagebox.showwarning("Warning", "Please select a user first")
             return
         
-        user_id = tree.item(selected[0])['values'][0]
-        user_name = tree.item(selected[0])['values'][1]
+        user_ids = [tree.item(item)['values'][0] for item in selected]
+        if len(user_ids) == 1:
+            prompt = f"Are you sure you want to delete user: {tree.item(selected[0])['values'][1]}?"
+        else:
+            prompt = f"Are you sure you want to delete {len(user_ids)} users?"
         
-        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete user: {user_name}?"):
-            success, message = self.auth.delete_user(user_id)
-            
-            if success:
-                messagebox.showinfo("Success", message)
-                self.show_user_management()
+        if messagebox.askyesno("Confirm Delete", prompt):
+            if len(user_ids) == 1:
+                self.run_action(self.auth.delete_user, (user_ids[0],), view='User Management')
             else:
-                messagebox.showerror("Error", message)
+                self.run_action(self.auth.bulk_delete_users, (user_ids,), view='User Management')
 
     def update_user_role(self, tree, new_role):
-        """Update selected user role"""
+        """Update the role of the selected users"""
         selected = tree.selection()
         if not selected:
             messagebox.showwarning("Warning", "Please select a user first")
             return
         
-        user_id = tree.item(selected[0])['values'][0]
-        success, message = self.auth.update_user_role(user_id, new_role)
-        
-        if success:
-            messagebox.showinfo("Success", message)
-            self.show_user_management()
+        user_ids = [tree.item(item)['values'][0] for item in selected]
+        if len(user_ids) == 1:
+            self.run_action(self.auth.update_user_role, (user_ids[0], new_role), view='User Management')
         else:
-            messagebox.showerror("Error", message)
+            self.run_action(self.auth.bulk_update_user_role, (user_ids, new_role), view='User Management')
 
     # Citizen Features
     def show_citizen_dashboard(self):
@@ -771,39 +930,42 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text="Citizen Dashboard", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        # Get user stats
-        success, applications = self.auth.get_user_applications(self.user_data['id'])
-        report_success, reports = self.auth.get_user_reports(self.user_data['id'])
+        def render(result):
+            success, counts = result
+            if not success:
+                counts = {'applications': 0, 'reports': 0, 'applications_by_status': {}}
         
-        # Welcome message with stats
-        welcome_text = f"Welcome, {self.user_data['name']}!\n\n"
-        welcome_text += f"Your Statistics:\n"
-        welcome_text += f"• Applications Submitted: {len(applications) if success else 0}\n"
-        welcome_text += f"• Reports Submitted: {len(reports) if report_success else 0}\n"
-        welcome_text += f"• Pending Items: {len([app for app in applications if app['status'] == 'Pending']) if success else 0}"
+            # Welcome message with stats
+            welcome_text = f"Welcome, {self.user_data['name']}!\n\n"
+            welcome_text += f"Your Statistics:\n"
+            welcome_text += f"• Applications Submitted: {counts['applications']}\n"
+            welcome_text += f"• Reports Submitted: {counts['reports']}\n"
+            welcome_text += f"• Pending Items: {counts['applications_by_status'].get('Pending', 0)}"
         
-        tk.Label(container, text=welcome_text, font=self.FONTS['body'], 
-                bg=self.COLORS['white'], justify='left').pack(pady=20)
+            tk.Label(container, text=welcome_text, font=self.FONTS['body'], 
+                    bg=self.COLORS['white'], justify='left').pack(pady=20)
         
-        # Quick actions
-        actions_frame = tk.Frame(container, bg=self.COLORS['white'])
-        actions_frame.pack(pady=20)
+            # Quick actions
+            actions_frame = tk.Frame(container, bg=self.COLORS['white'])
+            actions_frame.pack(pady=20)
+        
+            tk.Button(actions_frame, text="View Available Services", font=self.FONTS['body'],
+                     bg=self.COLORS['secondary'], fg='white', relief='raised', width=20,
+                     command=lambda: self.handle_navigation('Available Services')).pack(pady=5)
         
-        tk.Button(actions_frame, text="View Available Services", font=self.FONTS['body'],
-                 bg=self.COLORS['secondary'], fg='white', relief='raised', width=20,
-                 command=lambda: self.handle_navigation('Available Services')).pack(pady=5)
+            tk.Button(actions_frame, text="Submit Report/Complaint", font=self.FONTS['body'],
+                     bg=self.COLORS['warning'], fg='white', relief='raised', width=20,
+                     command=lambda: self.handle_navigation('Submit Report')).pack(pady=5)
         
-        tk.Button(actions_frame, text="Submit Report/Complaint", font=self.FONTS['body'],
-                 bg=self.COLORS['warning'], fg='white', relief='raised', width=20,
-                 command=lambda: self.handle_navigation('Submit Report')).pack(pady=5)
+            tk.Button(actions_frame, text="My Applications", font=self.FONTS['body'],
+                     bg=self.COLORS['success'], fg='white', relief='raised', width=20,
+                     command=lambda: self.handle_navigation('My Applications')).pack(pady=5)
         
-        tk.Button(actions_frame, text="My Applications", font=self.FONTS['body'],
-                 bg=self.COLORS['success'], fg='white', relief='raised', width=20,
-                 command=lambda: self.handle_navigation('My Applications')).pack(pady=5)
+            tk.Button(actions_frame, text="My Reports", font=self.FONTS['body'],
+                     bg=self.COLORS['danger'], fg='white', relief='raised', width=20,
+                     command=lambda: self.handle_navigation('My Reports')).pack(pady=5)
         
-        tk.Button(actions_frame, text="My Reports", font=self.FONTS['body'],
-                 bg=self.COLORS['danger'], fg='white', relief='raised', width=20,
-                 command=lambda: self.handle_navigation('My Reports')).pack(pady=5)
+        self.load_async(container, lambda: self.auth.count_user_items(self.user_data['id']), render)
 
     def show_available_services(self):
         """Show available services for citizens"""
@@ -813,36 +975,52 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text="Available Services", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        success, services = self.auth.get_all_services()
-        
-        if success and services:
-            for service in services:
-                service_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
-                service_frame.pack(fill='x', pady=5, padx=10)
-                
-                tk.Label(service_frame, text=service['name'], font=self.FONTS['subheader'], 
-                        bg=self.COLORS['light_bg']).pack(anchor='w', padx=10, pady=5)
-                
-                tk.Label(service_frame, text=service['description'], font=self.FONTS['body'], 
-                        bg=self.COLORS['light_bg'], wraplength=800, justify='left').pack(anchor='w', padx=10, pady=2)
-                
-                info_text = f"Category: {service['category']}"
-                if service.get('department'):
-                    info_text += f" | Department: {service['department']}"
-                if service.get('processing_time'):
-                    info_text += f" | Processing Time: {service['processing_time']}"
-                if service.get('fee') and service['fee'] > 0:
-                    info_text += f" | Fee: ৳{service['fee']}"
-                
-                tk.Label(service_frame, text=info_text, font=self.FONTS['small'], 
-                        bg=self.COLORS['light_bg']).pack(anchor='w', padx=10, pady=2)
-                
-                tk.Button(service_frame, text="Apply Now", font=self.FONTS['body'],
-                         bg=self.COLORS['success'], fg='white', relief='raised',
-                         command=lambda s=service: self.apply_for_service(s)).pack(anchor='e', padx=10, pady=5)
-        else:
+        def make_card(parent):
+            card = tk.Frame(parent, bg=self.COLORS['light_bg'], relief='raised', bd=1)
+            card.name_label = tk.Label(card, font=self.FONTS['subheader'], bg=self.COLORS['light_bg'])
+            card.name_label.pack(anchor='w', padx=10, pady=5)
+            card.description_label = tk.Label(card, font=self.FONTS['body'], bg=self.COLORS['light_bg'],
+                                              wraplength=800, justify='left')
+            card.description_label.pack(anchor='w', padx=10, pady=2)
+            card.info_label = tk.Label(card, font=self.FONTS['small'], bg=self.COLORS['light_bg'])
+            card.info_label.pack(side='left', anchor='w', padx=10, pady=2)
+            card.apply_button = tk.Button(card, text="Apply Now", font=self.FONTS['body'],
+                                          bg=self.COLORS['success'], fg='white', relief='raised')
+            card.apply_button.pack(side='right', anchor='e', padx=10, pady=5)
+            return card
+        
+        def bind_card(card, service):
+            info_text = f"Category: {service['category']}"
+            if service.get('department'):
+                info_text += f" | Department: {service['department']}"
+            if service.get('processing_time'):
+                info_text += f" | Processing Time: {service['processing_time']}"
+            if service.get('fee') and service['fee'] > 0:
+                info_text += f" | Fee: ৳{service['fee']}"
+            
+            card.name_label.config(text=service['name'])
+            card.description_label.config(text=service['description'] or '')
+            card.info_label.config(text=info_text)
+            card.apply_button.config(command=lambda s=service: self.apply_for_service(s))
+        
+        def fetch_services(page_cursor, page_size):
+            # The service catalogue is small and unpaged, so it arrives as a single page
+            success, services = self.auth.get_all_services()
+            if not success:
+                return False, services
+            return True, {'rows': services, 'next_cursor': None}
+        
+        def show_empty():
+            card_list.destroy()
             tk.Label(container, text="No services available at the moment.", 
                     font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        
+        card_list = RecycledCardList(container, self.loader, fetch_services, make_card, bind_card,
+                                     card_height=120, on_empty=show_empty,
+                                     on_error=lambda message: messagebox.showerror("Error", message),
+                                     bg=self.COLORS['white'])
+        card_list.pack(fill='both', expand=True, padx=10)
+        card_list.load_next()
 
     def apply_for_service(self, service):
         """Apply for a service"""
@@ -880,13 +1058,7 @@ Feedback: {report['feedback'] or 'No feedback provided'}
                 })
             }
             
-            success, message = self.auth.create_application(application_data)
-            
-            if success:
-                messagebox.showinfo("Success", message)
-                dialog.destroy()
-            else:
-                messagebox.showerror("Error", message)
+            self.run_action(self.auth.create_application, (application_data,), dialog=dialog)
         
         tk.Button(form_frame, text="Submit Application", font=self.FONTS['body'],
                  bg=self.COLORS['success'], fg='white', relief='raised',
@@ -900,50 +1072,63 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text="My Applications", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        success, applications = self.auth.get_user_applications(self.user_data['id'])
-        
-        if success and applications:
-            for app in applications:
-                status_color = self.COLORS['warning']  # Default for pending
-                if app['status'] == 'Approved':
-                    status_color = self.COLORS['success']
-                elif app['status'] == 'Rejected':
-                    status_color = self.COLORS['danger']
-                elif app['status'] == 'In Review':
-                    status_color = self.COLORS['secondary']
-                
-                app_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
-                app_frame.pack(fill='x', pady=5, padx=10)
-                
-                # Application header
-                header_frame = tk.Frame(app_frame, bg=self.COLORS['light_bg'])
-                header_frame.pack(fill='x', padx=10, pady=5)
-                
-                tk.Label(header_frame, text=app['service_name'], font=self.FONTS['subheader'], 
-                        bg=self.COLORS['light_bg']).pack(side='left')
-                
-                tk.Label(header_frame, text=app['status'], font=self.FONTS['body'], 
-                        bg=status_color, fg='white', relief='raised', bd=1).pack(side='right', padx=5)
-                
-                # Application details
-                details_frame = tk.Frame(app_frame, bg=self.COLORS['light_bg'])
-                details_frame.pack(fill='x', padx=10, pady=2)
-                
-                applied_date = app['applied_date'].strftime('%Y-%m-%d %H:%M') if app['applied_date'] else 'N/A'
-                tk.Label(details_frame, text=f"Applied: {applied_date}", font=self.FONTS['small'], 
-                        bg=self.COLORS['light_bg']).pack(anchor='w')
-                
-                if app['processed_date']:
-                    processed_date = app['processed_date'].strftime('%Y-%m-%d %H:%M')
-                    tk.Label(details_frame, text=f"Processed: {processed_date}", font=self.FONTS['small'], 
-                            bg=self.COLORS['light_bg']).pack(anchor='w')
-                
-                if app['notes']:
-                    tk.Label(details_frame, text=f"Notes: {app['notes']}", font=self.FONTS['small'], 
-                            bg=self.COLORS['light_bg'], wraplength=600, justify='left').pack(anchor='w')
-        else:
+        def make_card(parent):
+            card = tk.Frame(parent, bg=self.COLORS['light_bg'], relief='raised', bd=1)
+            
+            # Application header
+            header_frame = tk.Frame(card, bg=self.COLORS['light_bg'])
+            header_frame.pack(fill='x', padx=10, pady=5)
+            card.service_label = tk.Label(header_frame, font=self.FONTS['subheader'], bg=self.COLORS['light_bg'])
+            card.service_label.pack(side='left')
+            card.status_label = tk.Label(header_frame, font=self.FONTS['body'], fg='white', relief='raised', bd=1)
+            card.status_label.pack(side='right', padx=5)
+            
+            # Application details
+            details_frame = tk.Frame(card, bg=self.COLORS['light_bg'])
+            details_frame.pack(fill='x', padx=10, pady=2)
+            card.applied_label = tk.Label(details_frame, font=self.FONTS['small'], bg=self.COLORS['light_bg'])
+            card.applied_label.pack(anchor='w')
+            card.processed_label = tk.Label(details_frame, font=self.FONTS['small'], bg=self.COLORS['light_bg'])
+            card.processed_label.pack(anchor='w')
+            card.notes_label = tk.Label(details_frame, font=self.FONTS['small'], bg=self.COLORS['light_bg'],
+                                        wraplength=600, justify='left')
+            card.notes_label.pack(anchor='w')
+            return card
+        
+        def bind_card(card, app):
+            status_color = self.COLORS['warning']  # Default for pending
+            if app['status'] == 'Approved':
+                status_color = self.COLORS['success']
+            elif app['status'] == 'Rejected':
+                status_color = self.COLORS['danger']
+            elif app['status'] == 'In Review':
+                status_color = self.COLORS['secondary']
+            
+            applied_date = app['applied_date'].strftime('%Y-%m-%d %H:%M') if app['applied_date'] else 'N/A'
+            processed_text = ''
+            if app['processed_date']:
+                processed_text = f"Processed: {app['processed_date'].strftime('%Y-%m-%d %H:%M')}"
+            
+            card.service_label.config(text=app['service_name'])
+            card.status_label.config(text=app['status'], bg=status_color)
+            card.applied_label.config(text=f"Applied: {applied_date}")
+            card.processed_label.config(text=processed_text)
+            card.notes_label.config(text=f"Notes: {app['notes']}" if app['notes'] else '')
+        
+        def show_empty():
+            card_list.destroy()
             tk.Label(container, text="You haven't submitted any applications yet.", 
                     font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        
+        card_list = RecycledCardList(
+            container, self.loader,
+            lambda page_cursor, page_size: self.auth.get_user_applications_page(
+                self.user_data['id'], page_cursor, page_size),
+            make_card, bind_card, card_height=120, on_empty=show_empty,
+            on_error=lambda message: messagebox.showerror("Error", message),
+            bg=self.COLORS['white'])
+        card_list.pack(fill='both', expand=True, padx=10)
+        card_list.load_next()
 
     def show_submit_report(self):
         """Show report submission form"""
@@ -1010,18 +1195,14 @@ Feedback: {report['feedback'] or 'No feedback provided'}
                 'priority': priority_var.get()
             }
             
-            success, message = self.auth.submit_citizen_report(report_data)
-            
-            if success:
-                messagebox.showinfo("Success", message)
-                # Clear form
+            def clear_form():
                 title_entry.delete(0, tk.END)
                 desc_text.delete('1.0', tk.END)
                 location_entry.delete(0, tk.END)
                 category_var.set("Infrastructure")
                 priority_var.set("Medium")
-            else:
-                messagebox.showerror("Error", message)
+            
+            self.run_action(self.auth.submit_citizen_report, (report_data,), on_success=clear_form)
         
         tk.Button(form_frame, text="Submit Report", font=self.FONTS['body'],
                  bg=self.COLORS['success'], fg='white', relief='raised',
@@ -1035,68 +1216,71 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text="My Reports", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        success, reports = self.auth.get_user_reports(self.user_data['id'])
-        
-        if success and reports:
-            for report in reports:
-                status_color = self.COLORS['warning']  # Default for pending
-                if report['status'] == 'Resolved':
-                    status_color = self.COLORS['success']
-                elif report['status'] == 'Rejected':
-                    status_color = self.COLORS['danger']
-                elif report['status'] == 'In Progress':
-                    status_color = self.COLORS['secondary']
-                
-                priority_color = self.COLORS['text_light']
-                if report['priority'] == 'High':
-                    priority_color = self.COLORS['warning']
-                elif report['priority'] == 'Emergency':
-                    priority_color = self.COLORS['danger']
+        def render(result):
+            success, reports = result
+        
+            if success and reports:
+                for report in reports:
+                    status_color = self.COLORS['warning']  # Default for pending
+                    if report['status'] == 'Resolved':
+                        status_color = self.COLORS['success']
+                    elif report['status'] == 'Rejected':
+                        status_color = self.COLORS['danger']
+                    elif report['status'] == 'In Progress':
+                        status_color = self.COLORS['secondary']
                 
-                report_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
-                report_frame.pack(fill='x', pady=5, padx=10)
+                    priority_color = self.COLORS['text_light']
+                    if report['priority'] == 'High':
+                        priority_color = self.COLORS['warning']
+                    elif report['priority'] == 'Emergency':
+                        priority_color = self.COLORS['danger']
                 
-                # Report header
-                header_frame = tk.Frame(report_frame, bg=self.COLORS['light_bg'])
-                header_frame.pack(fill='x', padx=10, pady=5)
+                    report_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
+                    report_frame.pack(fill='x', pady=5, padx=10)
                 
-                tk.Label(header_frame, text=report['title'], font=self.FONTS['subheader'], 
-                        bg=self.COLORS['light_bg']).pack(side='left')
+                    # Report header
+                    header_frame = tk.Frame(report_frame, bg=self.COLORS['light_bg'])
+                    header_frame.pack(fill='x', padx=10, pady=5)
                 
-                status_frame = tk.Frame(header_frame, bg=self.COLORS['light_bg'])
-                status_frame.pack(side='right')
+                    tk.Label(header_frame, text=report['title'], font=self.FONTS['subheader'], 
+                            bg=self.COLORS['light_bg']).pack(side='left')
                 
-                tk.Label(status_frame, text=report['priority'], font=self.FONTS['small'], 
-                        bg=priority_color, fg='white', relief='raised', bd=1).pack(side='left', padx=2)
-                tk.Label(status_frame, text=report['status'], font=self.FONTS['small'], 
-                        bg=status_color, fg='white', relief='raised', bd=1).pack(side='left', padx=2)
+                    status_frame = tk.Frame(header_frame, bg=self.COLORS['light_bg'])
+                    status_frame.pack(side='right')
                 
-                # Report details
-                details_frame = tk.Frame(report_frame, bg=self.COLORS['light_bg'])
-                details_frame.pack(fill='x', padx=10, pady=2)
+                    tk.Label(status_frame, text=report['priority'], font=self.FONTS['small'], 
+                            bg=priority_color, fg='white', relief='raised', bd=1).pack(side='left', padx=2)
+                    tk.Label(status_frame, text=report['status'], font=self.FONTS['small'], 
+                            bg=status_color, fg='white', relief='raised', bd=1).pack(side='left', padx=2)
                 
-                created_date = report['created_at'].strftime('%Y-%m-%d %H:%M') if report['created_at'] else 'N/A'
-                tk.Label(details_frame, text=f"Category: {report['category']} | Created: {created_date}", 
-                        font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
+                    # Report details
+                    details_frame = tk.Frame(report_frame, bg=self.COLORS['light_bg'])
+                    details_frame.pack(fill='x', padx=10, pady=2)
                 
-                if report['location']:
-                    tk.Label(details_frame, text=f"Location: {report['location']}", 
+                    created_date = report['created_at'].strftime('%Y-%m-%d %H:%M') if report['created_at'] else 'N/A'
+                    tk.Label(details_frame, text=f"Category: {report['category']} | Created: {created_date}", 
                             font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
                 
-                tk.Label(details_frame, text=report['description'], font=self.FONTS['small'], 
-                        bg=self.COLORS['light_bg'], wraplength=800, justify='left').pack(anchor='w')
+                    if report['location']:
+                        tk.Label(details_frame, text=f"Location: {report['location']}", 
+                                font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
                 
-                if report['assigned_officer']:
-                    tk.Label(details_frame, text=f"Assigned Officer: {report['assigned_officer']}", 
-                            font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
+                    tk.Label(details_frame, text=report['description'], font=self.FONTS['small'], 
+                            bg=self.COLORS['light_bg'], wraplength=800, justify='left').pack(anchor='w')
                 
-                if report['resolved_at']:
-                    resolved_date = report['resolved_at'].strftime('%Y-%m-%d %H:%M')
-                    tk.Label(details_frame, text=f"Resolved: {resolved_date}", 
-                            font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
-        else:
-            tk.Label(container, text="You haven't submitted any reports yet.", 
-                    font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+                    if report['assigned_officer']:
+                        tk.Label(details_frame, text=f"Assigned Officer: {report['assigned_officer']}", 
+                                font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
+                
+                    if report['resolved_at']:
+                        resolved_date = report['resolved_at'].strftime('%Y-%m-%d %H:%M')
+                        tk.Label(details_frame, text=f"Resolved: {resolved_date}", 
+                                font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
+            else:
+                tk.Label(container, text="You haven't submitted any reports yet.", 
+                        font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        
+        self.load_async(container, lambda: self.auth.get_user_reports(self.user_data['id']), render)
 
     # Officer Features
     def show_officer_dashboard(self):
@@ -1107,33 +1291,34 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text="Government Officer Dashboard", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        # Get department reports
-        success, reports = self.auth.get_department_reports(self.user_data['department'])
-        report_success, report_stats = self.auth.get_report_stats()
+        def render(result):
+            success, counts = result
         
-        welcome_text = f"Welcome, Officer {self.user_data['name']}!\n"
-        welcome_text += f"Department: {self.user_data['department']}\n\n"
+            welcome_text = f"Welcome, Officer {self.user_data['name']}!\n"
+            welcome_text += f"Department: {self.user_data['department']}\n\n"
         
-        if report_success:
-            welcome_text += f"Department Statistics:\n"
-            welcome_text += f"• Total Reports: {report_stats['total_reports']}\n"
-            welcome_text += f"• Pending Reports: {len([r for r in reports if r['status'] == 'Pending']) if success else 0}\n"
-            welcome_text += f"• Reports In Progress: {len([r for r in reports if r['status'] == 'In Progress']) if success else 0}"
+            if success:
+                welcome_text += f"Department Statistics:\n"
+                welcome_text += f"• Total Reports: {counts['total']}\n"
+                welcome_text += f"• Pending Reports: {counts['by_status'].get('Pending', 0)}\n"
+                welcome_text += f"• Reports In Progress: {counts['by_status'].get('In Progress', 0)}"
         
-        tk.Label(container, text=welcome_text, font=self.FONTS['body'], 
-                bg=self.COLORS['white'], justify='left').pack(pady=20)
+            tk.Label(container, text=welcome_text, font=self.FONTS['body'], 
+                    bg=self.COLORS['white'], justify='left').pack(pady=20)
         
-        # Quick actions
-        actions_frame = tk.Frame(container, bg=self.COLORS['white'])
-        actions_frame.pack(pady=20)
+            # Quick actions
+            actions_frame = tk.Frame(container, bg=self.COLORS['white'])
+            actions_frame.pack(pady=20)
         
-        tk.Button(actions_frame, text="Department Reports", font=self.FONTS['body'],
-                 bg=self.COLORS['secondary'], fg='white', relief='raised', width=20,
-                 command=lambda: self.handle_navigation('Department Reports')).pack(pady=5)
+            tk.Button(actions_frame, text="Department Reports", font=self.FONTS['body'],
+                     bg=self.COLORS['secondary'], fg='white', relief='raised', width=20,
+                     command=lambda: self.handle_navigation('Department Reports')).pack(pady=5)
         
-        tk.Button(actions_frame, text="View Applications", font=self.FONTS['body'],
-                 bg=self.COLORS['success'], fg='white', relief='raised', width=20,
-                 command=lambda: self.handle_navigation('Applications')).pack(pady=5)
+            tk.Button(actions_frame, text="View Applications", font=self.FONTS['body'],
+                     bg=self.COLORS['success'], fg='white', relief='raised', width=20,
+                     command=lambda: self.handle_navigation('Applications')).pack(pady=5)
+        
+        self.load_async(container, lambda: self.auth.count_department_reports_by_status(self.user_data['department']), render)
 
     def show_department_reports(self):
         """Show department-specific reports"""
@@ -1143,81 +1328,100 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text=f"Department Reports - {self.user_data['department']}", 
                 font=self.FONTS['title'], bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        success, reports = self.auth.get_department_reports(self.user_data['department'])
-        
-        if success and reports:
-            for report in reports:
-                status_color = self.COLORS['warning']
-                if report['status'] == 'Resolved':
-                    status_color = self.COLORS['success']
-                elif report['status'] == 'Rejected':
-                    status_color = self.COLORS['danger']
-                elif report['status'] == 'In Progress':
-                    status_color = self.COLORS['secondary']
-                
-                priority_color = self.COLORS['text_light']
-                if report['priority'] == 'High':
-                    priority_color = self.COLORS['warning']
-                elif report['priority'] == 'Emergency':
-                    priority_color = self.COLORS['danger']
-                
-                report_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
-                report_frame.pack(fill='x', pady=5, padx=10)
-                
-                # Report header
-                header_frame = tk.Frame(report_frame, bg=self.COLORS['light_bg'])
-                header_frame.pack(fill='x', padx=10, pady=5)
-                
-                tk.Label(header_frame, text=f"{report['title']} - {report['reporter_name']}", 
-                        font=self.FONTS['subheader'], bg=self.COLORS['light_bg']).pack(side='left')
-                
-                status_frame = tk.Frame(header_frame, bg=self.COLORS['light_bg'])
-                status_frame.pack(side='right')
-                
-                tk.Label(status_frame, text=report['priority'], font=self.FONTS['small'], 
-                        bg=priority_color, fg='white', relief='raised', bd=1).pack(side='left', padx=2)
-                tk.Label(status_frame, text=report['status'], font=self.FONTS['small'], 
-                        bg=status_color, fg='white', relief='raised', bd=1).pack(side='left', padx=2)
-                
-                # Report details and actions
-                details_frame = tk.Frame(report_frame, bg=self.COLORS['light_bg'])
-                details_frame.pack(fill='x', padx=10, pady=5)
-                
-                created_date = report['created_at'].strftime('%Y-%m-%d %H:%M') if report['created_at'] else 'N/A'
-                tk.Label(details_frame, text=f"Reporter: {report['reporter_name']} | Created: {created_date}", 
-                        font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
-                
-                if report['location']:
-                    tk.Label(details_frame, text=f"Location: {report['location']}", 
-                            font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
-                
-                tk.Label(details_frame, text=report['description'], font=self.FONTS['small'], 
-                        bg=self.COLORS['light_bg'], wraplength=800, justify='left').pack(anchor='w')
-                
-                # Action buttons for pending reports
-                if report['status'] == 'Pending':
-                    action_frame = tk.Frame(details_frame, bg=self.COLORS['light_bg'])
-                    action_frame.pack(fill='x', pady=5)
-                    
-                    tk.Button(action_frame, text="Take Action", font=self.FONTS['small'],
-                             bg=self.COLORS['success'], fg='white', relief='raised',
-                             command=lambda r=report: self.update_report_status(r['id'], 'In Progress')).pack(side='left', padx=2)
-        else:
-            tk.Label(container, text="No reports found for your department.", 
-                    font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        department = self.user_data['department']
+        
+        def department_page(page_cursor, page_size):
+            return self.auth.get_department_reports_page(department, page_cursor, page_size)
+        
+        def search_page(query):
+            def fetch(page_cursor, page_size):
+                return self.auth.search_reports(query, {'category': department}, page_cursor, page_size)
+            return fetch
+        
+        def search(query):
+            card_list.empty_label.config(
+                text="No matching reports found." if query else "No reports found for your department."
+            )
+            card_list.reset(search_page(query) if query else department_page)
+        
+        self.create_search_bar(container, search)
+        
+        def make_card(parent):
+            card = tk.Frame(parent, bg=self.COLORS['light_bg'], relief='raised', bd=1)
+            
+            # Report header
+            header_frame = tk.Frame(card, bg=self.COLORS['light_bg'])
+            header_frame.pack(fill='x', padx=10, pady=5)
+            card.title_label = tk.Label(header_frame, font=self.FONTS['subheader'], bg=self.COLORS['light_bg'])
+            card.title_label.pack(side='left')
+            
+            status_frame = tk.Frame(header_frame, bg=self.COLORS['light_bg'])
+            status_frame.pack(side='right')
+            card.priority_label = tk.Label(status_frame, font=self.FONTS['small'], fg='white', relief='raised', bd=1)
+            card.priority_label.pack(side='left', padx=2)
+            card.status_label = tk.Label(status_frame, font=self.FONTS['small'], fg='white', relief='raised', bd=1)
+            card.status_label.pack(side='left', padx=2)
+            
+            # Report details and actions
+            details_frame = tk.Frame(card, bg=self.COLORS['light_bg'])
+            details_frame.pack(fill='x', padx=10, pady=5)
+            card.reporter_label = tk.Label(details_frame, font=self.FONTS['small'], bg=self.COLORS['light_bg'])
+            card.reporter_label.pack(anchor='w')
+            card.location_label = tk.Label(details_frame, font=self.FONTS['small'], bg=self.COLORS['light_bg'])
+            card.location_label.pack(anchor='w')
+            card.description_label = tk.Label(details_frame, font=self.FONTS['small'], bg=self.COLORS['light_bg'],
+                                              wraplength=800, justify='left')
+            card.description_label.pack(anchor='w')
+            
+            card.action_frame = tk.Frame(details_frame, bg=self.COLORS['light_bg'])
+            card.action_frame.pack(fill='x', pady=5)
+            card.action_button = tk.Button(card.action_frame, text="Take Action", font=self.FONTS['small'],
+                                           bg=self.COLORS['success'], fg='white', relief='raised')
+            return card
+        
+        def bind_card(card, report):
+            status_color = self.COLORS['warning']
+            if report['status'] == 'Resolved':
+                status_color = self.COLORS['success']
+            elif report['status'] == 'Rejected':
+                status_color = self.COLORS['danger']
+            elif report['status'] == 'In Progress':
+                status_color = self.COLORS['secondary']
+            
+            priority_color = self.COLORS['text_light']
+            if report['priority'] == 'High':
+                priority_color = self.COLORS['warning']
+            elif report['priority'] == 'Emergency':
+                priority_color = self.COLORS['danger']
+            
+            created_date = report['created_at'].strftime('%Y-%m-%d %H:%M') if report['created_at'] else 'N/A'
+            
+            card.title_label.config(text=f"{report['title']} - {report['reporter_name']}")
+            card.priority_label.config(text=report['priority'], bg=priority_color)
+            card.status_label.config(text=report['status'], bg=status_color)
+            card.reporter_label.config(text=f"Reporter: {report['reporter_name']} | Created: {created_date}")
+            card.location_label.config(text=f"Location: {report['location']}" if report['location'] else '')
+            card.description_label.config(text=report['description'])
+            
+            # Action buttons for pending reports
+            if report['status'] == 'Pending':
+                card.action_button.config(command=lambda r=report: self.update_report_status(r['id'], 'In Progress'))
+                card.action_button.pack(side='left', padx=2)
+            else:
+                card.action_button.pack_forget()
+        
+        card_list = RecycledCardList(container, self.loader, department_page, make_card, bind_card,
+                                     card_height=170, empty_text="No reports found for your department.",
+                                     on_error=lambda message: messagebox.showerror("Error", message),
+                                     bg=self.COLORS['white'])
+        card_list.empty_label.config(font=self.FONTS['body'])
+        card_list.pack(fill='both', expand=True, padx=10)
+        card_list.load_next()
 
     def update_report_status(self, report_id, status):
         """Update report status"""
-        success, message = self.auth.update_report_status(report_id, status, self.user_data['id'])
-        
-        if success:
-            messagebox.showinfo("Success", message)
-            if self.user_data['role'] == 'Government Officer':
-                self.show_department_reports()
-            else:
-                self.show_applications()
-        else:
-            messagebox.showerror("Error", message)
+        view = 'Department Reports' if self.user_data['role'] == 'Government Officer' else 'Applications'
+        self.run_action(self.auth.update_report_status, (report_id, status, self.user_data['id']), view=view)
 
     def show_applications(self):
         """Show applications for processing (officer/admin)"""
@@ -1227,70 +1431,104 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text="All Applications", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        success, applications = self.auth.get_all_applications()
-        
-        if success and applications:
-            for app in applications:
-                status_color = self.COLORS['warning']
-                if app['status'] == 'Approved':
-                    status_color = self.COLORS['success']
-                elif app['status'] == 'Rejected':
-                    status_color = self.COLORS['danger']
-                elif app['status'] == 'In Review':
-                    status_color = self.COLORS['secondary']
-                
-                app_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
-                app_frame.pack(fill='x', pady=5, padx=10)
-                
-                # Application header
-                header_frame = tk.Frame(app_frame, bg=self.COLORS['light_bg'])
-                header_frame.pack(fill='x', padx=10, pady=5)
-                
-                tk.Label(header_frame, text=f"{app['service_name']} - {app['applicant_name']}", 
-                        font=self.FONTS['subheader'], bg=self.COLORS['light_bg']).pack(side='left')
-                
-                tk.Label(header_frame, text=app['status'], font=self.FONTS['body'], 
-                        bg=status_color, fg='white', relief='raised', bd=1).pack(side='right', padx=5)
-                
-                # Application details and actions
-                details_frame = tk.Frame(app_frame, bg=self.COLORS['light_bg'])
-                details_frame.pack(fill='x', padx=10, pady=5)
-                
-                applied_date = app['applied_date'].strftime('%Y-%m-%d %H:%M') if app['applied_date'] else 'N/A'
-                tk.Label(details_frame, text=f"Applicant: {app['applicant_name']} ({app['applicant_username']})", 
-                        font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
-                tk.Label(details_frame, text=f"Applied: {applied_date}", 
-                        font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w')
-                
-                # Action buttons for pending applications
-                if app['status'] == 'Pending' and self.user_data['role'] in ['Government Officer', 'Administrator']:
-                    action_frame = tk.Frame(details_frame, bg=self.COLORS['light_bg'])
-                    action_frame.pack(fill='x', pady=5)
-                    
-                    tk.Button(action_frame, text="Approve", font=self.FONTS['small'],
-                             bg=self.COLORS['success'], fg='white', relief='raised',
-                             command=lambda a=app: self.update_app_status(a['id'], 'Approved')).pack(side='left', padx=2)
-                    
-                    tk.Button(action_frame, text="Reject", font=self.FONTS['small'],
-                             bg=self.COLORS['danger'], fg='white', relief='raised',
-                             command=lambda a=app: self.update_app_status(a['id'], 'Rejected')).pack(side='left', padx=2)
-                    
-                    tk.Button(action_frame, text="Mark In Review", font=self.FONTS['small'],
-                             bg=self.COLORS['secondary'], fg='white', relief='raised',
-                             command=lambda a=app: self.update_app_status(a['id'], 'In Review')).pack(side='left', padx=2)
-        else:
-            tk.Label(container, text="No applications found.", 
-                    font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        # Create treeview for applications
+        tree_frame = tk.Frame(container, bg=self.COLORS['white'])
+        tree_frame.pack(fill='both', expand=True, pady=10)
+        
+        # Treeview scrollbar
+        scrollbar = ttk.Scrollbar(tree_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        def application_values(app):
+            applied_date = app['applied_date'].strftime('%Y-%m-%d %H:%M') if app['applied_date'] else 'N/A'
+            return (
+                app['id'],
+                app['service_name'],
+                f"{app['applicant_name']} ({app['applicant_username']})",
+                applied_date,
+                app['status'],
+                app['processor_name'] or 'N/A'
+            )
+        
+        def show_error(message):
+            messagebox.showerror("Error", f"Could not load applications:\n{message}")
+        
+        # Treeview - applications are paged in as the user scrolls
+        tree = LazyTreeview(tree_frame, self.loader, self.auth.get_applications_page, application_values,
+                            scrollbar=scrollbar, on_error=show_error,
+                            columns=('ID', 'Service', 'Applicant', 'Applied', 'Status', 'Processed By'),
+                            show='headings', height=15, selectmode='extended')
+        
+        # Define headings
+        tree.heading('ID', text='ID')
+        tree.heading('Service', text='Service')
+        tree.heading('Applicant', text='Applicant')
+        tree.heading('Applied', text='Applied')
+        tree.heading('Status', text='Status')
+        tree.heading('Processed By', text='Processed By')
+        
+        # Configure columns
+        tree.column('ID', width=50)
+        tree.column('Service', width=200)
+        tree.column('Applicant', width=200)
+        tree.column('Applied', width=130)
+        tree.column('Status', width=100)
+        tree.column('Processed By', width=150)
+        
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=tree.yview)
+        
+        # Action buttons frame
+        action_frame = tk.Frame(container, bg=self.COLORS['white'])
+        action_frame.pack(fill='x', pady=10)
+        
+        tk.Button(action_frame, text="Refresh", font=self.FONTS['body'],
+                 bg=self.COLORS['secondary'], fg='white', relief='raised',
+                 command=lambda: self.handle_navigation('Applications')).pack(side='left', padx=5)
+        
+        # Action buttons for pending applications
+        if self.user_data['role'] in ['Government Officer', 'Administrator']:
+            tk.Button(action_frame, text="Approve", font=self.FONTS['body'],
+                     bg=self.COLORS['success'], fg='white', relief='raised',
+                     command=lambda: self.update_selected_app_status(tree, 'Approved')).pack(side='left', padx=5)
+            
+            tk.Button(action_frame, text="Reject", font=self.FONTS['body'],
+                     bg=self.COLORS['danger'], fg='white', relief='raised',
+                     command=lambda: self.update_selected_app_status(tree, 'Rejected')).pack(side='left', padx=5)
+            
+            tk.Button(action_frame, text="Mark In Review", font=self.FONTS['body'],
+                     bg=self.COLORS['secondary'], fg='white', relief='raised',
+                     command=lambda: self.update_selected_app_status(tree, 'In Review')).pack(side='left', padx=5)
+        
+        tk.Button(action_frame, text="Export", font=self.FONTS['body'],
+                 bg=self.COLORS['primary'], fg='white', relief='raised',
+                 command=lambda: self.export_dialog('applications')).pack(side='left', padx=5)
+        
+        tree.load_next()
+
+    def update_selected_app_status(self, tree, status):
+        """Update status of the selected pending applications"""
+        selected = tree.selection()
+        if not selected:
+            messagebox.showwarning("Warning", "Please select an application first")
+            return
+        
+        app_ids = [tree.item(item)['values'][0] for item in selected if tree.item(item)['values'][4] == 'Pending']
+        if not app_ids:
+            messagebox.showwarning("Warning", "Only pending applications can be processed")
+            return
+        
+        if len(app_ids) == 1:
+            self.update_app_status(app_ids[0], status)
+            return
+        
+        self.run_action(self.auth.bulk_update_application_status, (app_ids, status, self.user_data['id']),
+                        view='Applications')
 
     def update_app_status(self, app_id, status):
         """Update application status"""
-        success, message = self.auth.update_application_status(app_id, status, self.user_data['id'])
-        
-        if success:
-            messagebox.showinfo("Success", message)
-            self.show_applications()
-        else:
-            messagebox.showerror("Error", message)
+        self.run_action(self.auth.update_application_status, (app_id, status, self.user_data['id']),
+                        view='Applications')
 
     def show_services(self):
         """Show services management"""
@@ -1306,33 +1544,36 @@ Feedback: {report['feedback'] or 'No feedback provided'}
                      bg=self.COLORS['success'], fg='white', relief='raised',
                      command=self.show_add_service_dialog).pack(anchor='e', pady=10)
         
-        success, services = self.auth.get_all_services()
+        def render(result):
+            success, services = result
         
-        if success and services:
-            for service in services:
-                service_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
-                service_frame.pack(fill='x', pady=5, padx=10)
+            if success and services:
+                for service in services:
+                    service_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
+                    service_frame.pack(fill='x', pady=5, padx=10)
                 
-                tk.Label(service_frame, text=service['name'], font=self.FONTS['subheader'], 
-                        bg=self.COLORS['light_bg']).pack(anchor='w', padx=10, pady=5)
+                    tk.Label(service_frame, text=service['name'], font=self.FONTS['subheader'], 
+                            bg=self.COLORS['light_bg']).pack(anchor='w', padx=10, pady=5)
                 
-                tk.Label(service_frame, text=service['description'], font=self.FONTS['body'], 
-                        bg=self.COLORS['light_bg'], wraplength=800, justify='left').pack(anchor='w', padx=10, pady=2)
+                    tk.Label(service_frame, text=service['description'], font=self.FONTS['body'], 
+                            bg=self.COLORS['light_bg'], wraplength=800, justify='left').pack(anchor='w', padx=10, pady=2)
                 
-                info_text = f"Category: {service['category']}"
-                if service.get('department'):
-                    info_text += f" | Department: {service['department']}"
-                if service.get('processing_time'):
-                    info_text += f" | Processing Time: {service['processing_time']}"
-                if service.get('fee') and service['fee'] > 0:
-                    info_text += f" | Fee: ৳{service['fee']}"
-                info_text += f" | Created by: {service['created_by_name']}"
+                    info_text = f"Category: {service['category']}"
+                    if service.get('department'):
+                        info_text += f" | Department: {service['department']}"
+                    if service.get('processing_time'):
+                        info_text += f" | Processing Time: {service['processing_time']}"
+                    if service.get('fee') and service['fee'] > 0:
+                        info_text += f" | Fee: ৳{service['fee']}"
+                    info_text += f" | Created by: {service['created_by_name']}"
                 
-                tk.Label(service_frame, text=info_text, 
-                        font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w', padx=10, pady=2)
-        else:
-            tk.Label(container, text="No services available.", 
-                    font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+                    tk.Label(service_frame, text=info_text, 
+                            font=self.FONTS['small'], bg=self.COLORS['light_bg']).pack(anchor='w', padx=10, pady=2)
+            else:
+                tk.Label(container, text="No services available.", 
+                        font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        
+        self.load_async(container, self.auth.get_all_services, render)
 
     def show_add_service_dialog(self):
         """Show dialog to add new service"""
@@ -1416,14 +1657,7 @@ Feedback: {report['feedback'] or 'No feedback provided'}
                 'created_by': self.user_data['id']
             }
             
-            success, message = self.auth.create_service(service_data)
-            
-            if success:
-                messagebox.showinfo("Success", message)
-                dialog.destroy()
-                self.show_services()
-            else:
-                messagebox.showerror("Error", message)
+            self.run_action(self.auth.create_service, (service_data,), view='Services', dialog=dialog)
         
         tk.Button(form_frame, text="Create Service", font=self.FONTS['body'],
                  bg=self.COLORS['success'], fg='white', relief='raised',
@@ -1469,12 +1703,11 @@ Feedback: {report['feedback'] or 'No feedback provided'}
         tk.Label(container, text="System Reports", font=self.FONTS['title'], 
                 bg=self.COLORS['white'], fg=self.COLORS['primary']).pack(pady=10)
         
-        # Get statistics
-        success, stats = self.auth.get_user_stats()
-        report_success, report_stats = self.auth.get_report_stats()
+        def render(result):
+            (success, stats), (report_success, report_stats) = result
         
-        if success and report_success:
-            report_text = f"""
+            if success and report_success:
+                report_text = f"""
             SYSTEM REPORT - {datetime.now().strftime('%Y-%m-%d %H:%M')}
             
             User Statistics:
@@ -1484,14 +1717,14 @@ Feedback: {report['feedback'] or 'No feedback provided'}
             Users by Role:
             """
             
-            for role_stat in stats['users_by_role']:
-                report_text += f"• {role_stat['role']}: {role_stat['count']}\n"
+                for role_stat in stats['users_by_role']:
+                    report_text += f"• {role_stat['role']}: {role_stat['count']}\n"
             
-            report_text += "\nUsers by Status:\n"
-            for status_stat in stats['users_by_status']:
-                report_text += f"• {status_stat['status']}: {status_stat['count']}\n"
+                report_text += "\nUsers by Status:\n"
+                for status_stat in stats['users_by_status']:
+                    report_text += f"• {status_stat['status']}: {status_stat['count']}\n"
             
-            report_text += f"""
+                report_text += f"""
             
             Report Statistics:
             • Total Reports: {report_stats['total_reports']}
@@ -1500,27 +1733,37 @@ Feedback: {report['feedback'] or 'No feedback provided'}
             Reports by Status:
             """
             
-            for status_stat in report_stats['reports_by_status']:
-                report_text += f"• {status_stat['status']}: {status_stat['count']}\n"
+                for status_stat in report_stats['reports_by_status']:
+                    report_text += f"• {status_stat['status']}: {status_stat['count']}\n"
             
-            report_text += "\nReports by Category:\n"
-            for category_stat in report_stats['reports_by_category']:
-                report_text += f"• {category_stat['category']}: {category_stat['count']}\n"
+                report_text += "\nReports by Category:\n"
+                for category_stat in report_stats['reports_by_category']:
+                    report_text += f"• {category_stat['category']}: {category_stat['count']}\n"
             
-            report_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
-            report_frame.pack(fill='both', expand=True, pady=10, padx=10)
+                report_frame = tk.Frame(container, bg=self.COLORS['light_bg'], relief='raised', bd=1)
+                report_frame.pack(fill='both', expand=True, pady=10, padx=10)
             
-            report_display = scrolledtext.ScrolledText(report_frame, width=80, height=20, font=self.FONTS['body'])
-            report_display.pack(fill='both', expand=True, padx=10, pady=10)
-            report_display.insert('1.0', report_text)
-            report_display.config(state='disabled')
-        else:
-            tk.Label(container, text="Could not generate reports.", 
-                    font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+                report_display = scrolledtext.ScrolledText(report_frame, width=80, height=20, font=self.FONTS['body'])
+                report_display.pack(fill='both', expand=True, padx=10, pady=10)
+                report_display.insert('1.0', report_text)
+                report_display.config(state='disabled')
+            
+                def rebuild_statistics():
+                    self.run_action(self.auth.reconcile_stats_counters, (), view='System Reports')
+            
+                tk.Button(container, text="Rebuild Statistics", font=self.FONTS['body'],
+                         bg=self.COLORS['secondary'], fg='white', relief='raised',
+                         command=rebuild_statistics).pack(anchor='e', padx=10)
+            else:
+                tk.Label(container, text="Could not generate reports.", 
+                        font=self.FONTS['body'], bg=self.COLORS['white']).pack(pady=20)
+        
+        self.load_async(container, lambda: (self.auth.get_user_stats(), self.auth.get_report_stats()), render)
 
     def logout(self):
         """Logout and return to login screen"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+            self.loader.shutdown()
             self.root.destroy()
             # Restart the application
             import main
@@ -0,0 +1,179 @@
+import argparse
+import csv
+import gzip
+import json
+import time
+from contextlib import closing
+from mysql.connector import Error
+from database_config import DatabaseManager
+
+CHUNK_SIZE = 1000
+
+# Per entity: base query, date column and the columns the status/category filters apply to
+EXPORT_SOURCES = {
+    'reports': {
+        'sql': '''
+            SELECT r.*, u1.full_name as reporter_name, u2.full_name as assigned_officer
+            FROM reports r
+            JOIN users u1 ON r.user_id = u1.id
+            LEFT JOIN users u2 ON r.assigned_to = u2.id
+        ''',
+        'date_column': 'r.created_at',
+        'status_column': 'r.status',
+        'category_column': 'r.category',
+        'id_column': 'r.id'
+    },
+    'applications': {
+        'sql': '''
+            SELECT a.*, s.name as service_name, s.category as service_category,
+                   u.full_name as applicant_name, u.username as applicant_username,
+                   p.full_name as processor_name
+            FROM applications a
+            JOIN services s ON a.service_id = s.id
+            JOIN users u ON a.user_id = u.id
+            LEFT JOIN users p ON a.processed_by = p.id
+        ''',
+        'date_column': 'a.applied_date',
+        'status_column': 'a.status',
+        'category_column': 's.category',
+        'id_column': 'a.id'
+    }
+}
+
+
+def build_export_query(entity, date_from=None, date_to=None, status=None, category=None):
+    """Build the filtered export query and its parameters"""
+    source = EXPORT_SOURCES[entity]
+    conditions = []
+    params = []
+    if date_from:
+        conditions.append(f"{source['date_column']} >= %s")
+        params.append(date_from)
+    if date_to:
+        # date_to is inclusive of the whole day
+        conditions.append(f"{source['date_column']} < DATE_ADD(%s, INTERVAL 1 DAY)")
+        params.append(date_to)
+    if status:
+        conditions.append(f"{source['status_column']} = %s")
+        params.append(status)
+    if category:
+        conditions.append(f"{source['category_column']} = %s")
+        params.append(category)
+
+    sql = source['sql']
+    if conditions:
+        sql += ' WHERE ' + ' AND '.join(conditions)
+    sql += f" ORDER BY {source['id_column']}"
+    return sql, params
+
+
+def iter_rows(connection, sql, params, chunk_size=CHUNK_SIZE):
+    """Stream rows from an unbuffered cursor inside a read-only consistent snapshot"""
+    connection.start_transaction(consistent_snapshot=True, readonly=True)
+    cursor = connection.cursor(buffered=False, dictionary=True)
+    try:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        # Drain anything left unread (e.g. after a write error) before closing
+        if connection.unread_result:
+            connection.consume_results()
+        cursor.close()
+        connection.rollback()
+
+
+def open_output(path):
+    """Open an output file for text writing, gzip-compressed when it ends in .gz"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'wt', newline='', encoding='utf-8')
+    return open(path, 'w', newline='', encoding='utf-8')
+
+
+def write_csv(rows, output):
+    """Write dict rows as CSV, taking the header from the first row"""
+    writer = None
+    count = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(output, fieldnames=list(row.keys()))
+            writer.writeheader()
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows, output):
+    """Write dict rows as one JSON object per line"""
+    count = 0
+    for row in rows:
+        output.write(json.dumps(row, default=str, ensure_ascii=False))
+        output.write('\n')
+        count += 1
+    return count
+
+
+WRITERS = {
+    'csv': write_csv,
+    'jsonl': write_jsonl
+}
+
+
+def export_format(path):
+    """Infer the export format from the output file name"""
+    name = path[:-3] if path.endswith('.gz') else path
+    for fmt in WRITERS:
+        if name.endswith(f".{fmt}"):
+            return fmt
+    raise ValueError(f"Cannot tell export format from file name: {path} (use .csv, .jsonl, optionally .gz)")
+
+
+def export_data(entity, output_path, date_from=None, date_to=None, status=None, category=None,
+                chunk_size=CHUNK_SIZE, db=None):
+    """Export reports or applications to CSV/JSONL (optionally gzipped) without buffering the result set"""
+    try:
+        if entity not in EXPORT_SOURCES:
+            raise ValueError(f"Unknown export entity: {entity}")
+        writer = WRITERS[export_format(output_path)]
+        sql, params = build_export_query(entity, date_from, date_to, status, category)
+        db = db or DatabaseManager()
+        started = time.monotonic()
+
+        with db.pool.connection() as connection, open_output(output_path) as output:
+            # Close the row stream before the connection goes back to the pool
+            with closing(iter_rows(connection, sql, params, chunk_size)) as rows:
+                count = writer(rows, output)
+
+        return True, {
+            'rows': count,
+            'path': output_path,
+            'seconds': round(time.monotonic() - started, 2)
+        }
+    except (Error, OSError, ValueError) as e:
+        return False, f"Export failed: {str(e)}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export reports or applications")
+    parser.add_argument('entity', choices=sorted(EXPORT_SOURCES))
+    parser.add_argument('output', help="Output file: .csv, .jsonl, .csv.gz or .jsonl.gz")
+    parser.add_argument('--from', dest='date_from', help="First day to include (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='date_to', help="Last day to include (YYYY-MM-DD)")
+    parser.add_argument('--status')
+    parser.add_argument('--category')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    success, result = export_data(args.entity, args.output, args.date_from, args.date_to,
+                                  args.status, args.category, args.chunk_size)
+    if success:
+        print(f"✅ Exported {result['rows']} {args.entity} to {result['path']} in {result['seconds']}s")
+    else:
+        print(f"❌ {result}")
+
+
+if __name__ == "__main__":
+    main()
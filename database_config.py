@@ -1,216 +1,691 @@
 import mysql.connector
-from mysql.connector import Error
-import hashlib
+from mysql.connector import Error, errorcode
+import functools
+import re
+import threading
+import unicodedata
 from datetime import datetime
+from connection_pool import ConnectionPool
+from sqlite_backend import SQLiteDatabase
+from password_hashing import get_password_hasher
+from query_metrics import InstrumentedPool, get_query_metrics, instrument_methods, untimed
+from statement_cache import fetch_prepared, get_statement_cache_stats
+
+DB_CONFIG = {
+    'host': 'localhost',
+    'user': 'root',
+    'password': '',
+    'database': 'citizen_portal_db'
+}
+
+# 'mysql', or 'sqlite' to run without a MySQL server (tests, benchmarks)
+DB_BACKEND = 'mysql'
+
+# SQLite database file, or ':memory:' for a private in-memory database
+SQLITE_PATH = ':memory:'
+
+POOL_SIZE = 5
+POOL_CHECKOUT_TIMEOUT = 10
+
+# Ping connections idle at least this many seconds before handing them out
+POOL_VALIDATE_AFTER = 1.0
+
+# Attempts, and first delay in seconds (doubling each time), when (re)connecting to the server
+POOL_RECONNECT_ATTEMPTS = 5
+POOL_RECONNECT_DELAY = 0.1
+
+# Times an idempotent read is re-run after its connection is lost mid-call
+READ_RETRIES = 2
+
+_pool = None
+_pool_lock = threading.Lock()
+
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Columns whose per-value row counts are kept in stats_counters, by table
+STATS_COUNTER_DIMENSIONS = {
+    'users': ('role', 'status'),
+    'reports': ('status', 'category')
+}
+STATS_TOTAL_DIMENSION = 'total'
+
+# Maximum ids per "WHERE id IN (...)" statement in bulk operations
+BULK_CHUNK_SIZE = 500
+
+# Shortest word InnoDB full-text indexes (innodb_ft_min_token_size)
+FULLTEXT_MIN_WORD_LENGTH = 3
+
+# Upper bound on search_users results
+MAX_USER_SEARCH_RESULTS = 100
+
+# Report columns search_reports can filter on
+REPORT_SEARCH_FILTERS = ('status', 'category', 'priority', 'assigned_to')
+
+# User-facing messages for duplicate-key errors, by unique index name
+DUPLICATE_KEY_MESSAGES = {
+    'username': "Username already exists",
+    'nid': "NID already registered",
+    'uq_users_email': "Email already registered"
+}
+
+
+def get_connection_pool():
+    """Get the process-wide connection pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            if DB_BACKEND == 'sqlite':
+                database = SQLiteDatabase(SQLITE_PATH)
+                _pool = ConnectionPool({}, database.max_connections(POOL_SIZE), POOL_CHECKOUT_TIMEOUT,
+                                       connect=database.connect, **resilience_settings())
+            else:
+                _pool = ConnectionPool(DB_CONFIG, POOL_SIZE, POOL_CHECKOUT_TIMEOUT, **resilience_settings())
+        return _pool
+
+
+def resilience_settings():
+    return {
+        'validate_after': POOL_VALIDATE_AFTER,
+        'reconnect_attempts': POOL_RECONNECT_ATTEMPTS,
+        'reconnect_delay': POOL_RECONNECT_DELAY
+    }
+
+
+def configure_pool(pool_size=None, checkout_timeout=None, validate_after=None, reconnect_attempts=None,
+                   reconnect_delay=None):
+    """Change pool settings; takes effect for the next pool created"""
+    global _pool, POOL_SIZE, POOL_CHECKOUT_TIMEOUT, POOL_VALIDATE_AFTER, POOL_RECONNECT_ATTEMPTS, POOL_RECONNECT_DELAY
+    with _pool_lock:
+        if pool_size is not None:
+            POOL_SIZE = pool_size
+        if checkout_timeout is not None:
+            POOL_CHECKOUT_TIMEOUT = checkout_timeout
+        if validate_after is not None:
+            POOL_VALIDATE_AFTER = validate_after
+        if reconnect_attempts is not None:
+            POOL_RECONNECT_ATTEMPTS = reconnect_attempts
+        if reconnect_delay is not None:
+            POOL_RECONNECT_DELAY = reconnect_delay
+        if _pool is not None:
+            _pool.close_all()
+            _pool = None
+
+
+def configure_backend(backend, sqlite_path=None):
+    """Switch between 'mysql' and 'sqlite'; the next DatabaseManager connects to (and migrates) the new database"""
+    global _pool, _schema_ready, DB_BACKEND, SQLITE_PATH
+    if backend not in ('mysql', 'sqlite'):
+        raise ValueError(f"Unknown database backend: {backend}")
+    with _pool_lock:
+        DB_BACKEND = backend
+        if sqlite_path is not None:
+            SQLITE_PATH = sqlite_path
+        if _pool is not None:
+            _pool.close_all()
+            _pool = None
+    with _schema_lock:
+        _schema_ready = False
+
+
+def encode_page_token(sort_value, row_id):
+    """Encode the last row of a page as an opaque next-page token"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.strftime('%Y-%m-%d %H:%M:%S')
+    return f"{sort_value}|{row_id}"
+
+
+def decode_page_token(token):
+    """Decode a next-page token into (sort_value, row_id)"""
+    sort_value, row_id = token.rsplit('|', 1)
+    return sort_value, int(row_id)
+
+
+def fulltext_query(text):
+    """Turn free text into a boolean-mode query requiring every word as a prefix"""
+    words = [word for word in re.findall(r'\w+', text) if len(word) >= FULLTEXT_MIN_WORD_LENGTH]
+    return ' '.join(f"+{word}*" for word in words)
+
+
+def normalize_name(name):
+    """Normalize a name for prefix search: strip accents, casefold and collapse whitespace"""
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.casefold().split())
+
+
+def like_prefix(prefix):
+    """Escape LIKE wildcards in prefix and append %"""
+    return prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def duplicate_key_message(error):
+    """Map a duplicate-key error to its user-facing message (None for other errors)"""
+    if error.errno != errorcode.ER_DUP_ENTRY:
+        return None
+    # "Duplicate entry 'x' for key 'users.username'" (MySQL 8.0.19+) or "... for key 'username'"
+    match = re.search(r"for key '(?:[^']*\.)?([^'.]+)'", error.msg or '')
+    return DUPLICATE_KEY_MESSAGES.get(match.group(1) if match else None, "Account already registered")
+
+
+def retry_on_disconnect(method):
+    """Re-run an idempotent read whose pooled connection was lost mid-call"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        for attempt in range(READ_RETRIES + 1):
+            disconnects = self.pool.disconnects_seen()
+            result = method(self, *args, **kwargs)
+            if attempt == READ_RETRIES or self.pool.disconnects_seen() == disconnects:
+                return result
+            self.pool.count('read_retries')
+    return wrapper
+
+
+def chunked(ids, size=BULK_CHUNK_SIZE):
+    """Split a list of ids into chunks of at most size"""
+    ids = list(ids)
+    return [ids[start:start + size] for start in range(0, len(ids), size)]
+
 
 class DatabaseManager:
     def __init__(self):
-        self.connection = None
+        self.pool = None
         self.connect()
-        self.create_tables()
-        self.create_default_admin()
+        self.migrate_schema()
 
     def connect(self):
-        """Create database connection"""
+        """Attach to the shared connection pool"""
+        self.pool = InstrumentedPool(get_connection_pool(), get_query_metrics())
         try:
-            self.connection = mysql.connector.connect(
-                host='localhost',
-                user='root',
-                password='',
-                database='citizen_portal_db'
-            )
+            with self.pool.connection():
+                pass
             print("✅ Database connected successfully")
             return True
         except Error as e:
-            print(f"❌ Error connecting to MySQL: {e}")
+            print(f"❌ Error connecting to {DB_BACKEND}: {e}")
+            if DB_BACKEND != 'mysql':
+                return False
             return self.create_database()
 
     def create_database(self):
         """Create database if it doesn't exist"""
         try:
-            temp_connection = mysql.connector.connect(
-                host='localhost',
-                user='root',
-                password=''
-            )
+            server_config = {k: v for k, v in DB_CONFIG.items() if k != 'database'}
+            temp_connection = mysql.connector.connect(**server_config)
             cursor = temp_connection.cursor()
-            cursor.execute("CREATE DATABASE IF NOT EXISTS citizen_portal_db")
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {DB_CONFIG['database']}")
             print("✅ Database created successfully")
             cursor.close()
             temp_connection.close()
             
-            self.connection = mysql.connector.connect(
-                host='localhost',
-                user='root',
-                password='',
-                database='citizen_portal_db'
-            )
+            with self.pool.connection():
+                pass
             return True
         except Error as e:
             print(f"❌ Error creating database: {e}")
             return False
 
-    def create_tables(self):
-        """Create all necessary tables"""
+    def get_pool_stats(self):
+        """Get connection pool statistics"""
+        return self.pool.stats()
+
+    def get_statement_cache_stats(self):
+        """Get prepared statement cache statistics"""
+        return get_statement_cache_stats()
+
+    def get_query_metrics(self):
+        """Get per-method call counts, latency, rows, bytes and errors, slowest total first"""
+        return get_query_metrics().snapshot()
+
+    def reset_query_metrics(self):
+        """Clear the per-method query metrics"""
+        get_query_metrics().reset()
+
+    # Schema Management Methods
+    def get_schema_version(self, cursor):
+        """Get the schema version stored in the database (0 if unversioned)"""
         try:
-            cursor = self.connection.cursor()
+            cursor.execute('SELECT MAX(version) FROM schema_version')
+            version = cursor.fetchone()[0]
+            return version or 0
+        except Error as e:
+            if e.errno == errorcode.ER_NO_SUCH_TABLE:
+                return 0
+            raise
 
-            # Users table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    full_name VARCHAR(255) NOT NULL,
-                    email VARCHAR(255),
-                    phone VARCHAR(20) NOT NULL,
-                    nid VARCHAR(50) UNIQUE NOT NULL,
-                    date_of_birth DATE NOT NULL,
-                    address TEXT NOT NULL,
-                    username VARCHAR(100) UNIQUE NOT NULL,
-                    password_hash VARCHAR(255) NOT NULL,
-                    role ENUM('Citizen', 'Government Officer', 'Administrator') NOT NULL,
-                    department VARCHAR(100),
-                    status ENUM('Active', 'Inactive', 'Suspended') DEFAULT 'Active',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_login TIMESTAMP NULL,
-                    profile_picture VARCHAR(255) DEFAULT NULL
-                )
-            ''')
+    def migrate_schema(self):
+        """Run pending schema migrations (once per process)"""
+        global _schema_ready
+        with _schema_lock:
+            if _schema_ready:
+                return True
+            try:
+                with self.pool.connection() as connection:
+                    cursor = connection.cursor()
+                    if self.get_schema_version(cursor) >= SCHEMA_VERSION:
+                        cursor.close()
+                        _schema_ready = True
+                        return True
 
-            # Services table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS services (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL,
-                    description TEXT,
-                    category VARCHAR(100),
-                    department VARCHAR(100),
-                    requirements JSON,
-                    processing_time VARCHAR(50),
-                    fee DECIMAL(10,2) DEFAULT 0.00,
-                    status ENUM('Active', 'Inactive') DEFAULT 'Active',
-                    created_by INT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (created_by) REFERENCES users(id)
-                )
-            ''')
+                    # Serialize migrations across clients starting at the same time
+                    cursor.execute("SELECT GET_LOCK('citizen_portal_schema', 60)")
+                    cursor.fetchone()
+                    try:
+                        cursor.execute('''
+                            CREATE TABLE IF NOT EXISTS schema_version (
+                                version INT PRIMARY KEY,
+                                description VARCHAR(255) NOT NULL,
+                                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                            )
+                        ''')
+                        current_version = self.get_schema_version(cursor)
+                        for version, description, steps in SCHEMA_MIGRATIONS:
+                            if version <= current_version:
+                                continue
+                            for step in steps:
+                                if callable(step):
+                                    step(self, cursor)
+                                else:
+                                    self.run_migration_statement(cursor, step)
+                            cursor.execute(
+                                'INSERT INTO schema_version (version, description) VALUES (%s, %s)',
+                                (version, description)
+                            )
+                            connection.commit()
+                            print(f"✅ Applied schema migration {version}: {description}")
+                    finally:
+                        cursor.execute("SELECT RELEASE_LOCK('citizen_portal_schema')")
+                        cursor.fetchone()
+                    cursor.close()
+                _schema_ready = True
+                return True
 
-            # Applications table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS applications (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    service_id INT NOT NULL,
-                    application_data JSON,
-                    status ENUM('Pending', 'Approved', 'Rejected', 'In Review') DEFAULT 'Pending',
-                    applied_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    processed_date TIMESTAMP NULL,
-                    processed_by INT NULL,
-                    notes TEXT,
-                    FOREIGN KEY (user_id) REFERENCES users(id),
-                    FOREIGN KEY (service_id) REFERENCES services(id),
-                    FOREIGN KEY (processed_by) REFERENCES users(id)
-                )
-            ''')
+            except Error as e:
+                print(f"❌ Error migrating schema: {e}")
+                return False
+
+    def run_migration_statement(self, cursor, statement):
+        """Execute one migration statement, tolerating columns/indexes that already exist or are already gone"""
+        try:
+            cursor.execute(statement)
+        except Error as e:
+            if e.errno not in (errorcode.ER_DUP_KEYNAME, errorcode.ER_DUP_FIELDNAME,
+                               errorcode.ER_CANT_DROP_FIELD_OR_KEY):
+                raise
+
+    def create_tables(self, cursor):
+        """Create all necessary tables"""
+        # Users table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                full_name VARCHAR(255) NOT NULL,
+                email VARCHAR(255),
+                phone VARCHAR(20) NOT NULL,
+                nid VARCHAR(50) UNIQUE NOT NULL,
+                date_of_birth DATE NOT NULL,
+                address TEXT NOT NULL,
+                username VARCHAR(100) UNIQUE NOT NULL,
+                password_hash VARCHAR(255) NOT NULL,
+                role ENUM('Citizen', 'Government Officer', 'Administrator') NOT NULL,
+                department VARCHAR(100),
+                status ENUM('Active', 'Inactive', 'Suspended') DEFAULT 'Active',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_login TIMESTAMP NULL,
+                profile_picture VARCHAR(255) DEFAULT NULL
+            )
+        ''')
+
+        # Services table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS services (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                description TEXT,
+                category VARCHAR(100),
+                department VARCHAR(100),
+                requirements JSON,
+                processing_time VARCHAR(50),
+                fee DECIMAL(10,2) DEFAULT 0.00,
+                status ENUM('Active', 'Inactive') DEFAULT 'Active',
+                created_by INT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (created_by) REFERENCES users(id)
+            )
+        ''')
 
-            # Reports table
+        # Applications table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS applications (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                user_id INT NOT NULL,
+                service_id INT NOT NULL,
+                application_data JSON,
+                status ENUM('Pending', 'Approved', 'Rejected', 'In Review') DEFAULT 'Pending',
+                applied_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                processed_date TIMESTAMP NULL,
+                processed_by INT NULL,
+                notes TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(id),
+                FOREIGN KEY (service_id) REFERENCES services(id),
+                FOREIGN KEY (processed_by) REFERENCES users(id)
+            )
+        ''')
+
+        # Reports table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS reports (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                user_id INT NOT NULL,
+                title VARCHAR(255) NOT NULL,
+                description TEXT NOT NULL,
+                category ENUM('Infrastructure', 'Health', 'Education', 'Utility', 'Environment', 'Other') NOT NULL,
+                location VARCHAR(255),
+                image_url VARCHAR(500),
+                status ENUM('Pending', 'In Progress', 'Resolved', 'Rejected') DEFAULT 'Pending',
+                priority ENUM('Low', 'Medium', 'High', 'Emergency') DEFAULT 'Medium',
+                assigned_to INT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                resolved_at TIMESTAMP NULL,
+                feedback TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(id),
+                FOREIGN KEY (assigned_to) REFERENCES users(id)
+            )
+        ''')
+
+    def create_default_admin(self, cursor):
+        """Create default admin account"""
+        cursor.execute("SELECT id FROM users WHERE username = 'admin'")
+        if not cursor.fetchone():
+            password_hash = self.hash_password("admin123")
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS reports (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    title VARCHAR(255) NOT NULL,
-                    description TEXT NOT NULL,
-                    category ENUM('Infrastructure', 'Health', 'Education', 'Utility', 'Environment', 'Other') NOT NULL,
-                    location VARCHAR(255),
-                    image_url VARCHAR(500),
-                    status ENUM('Pending', 'In Progress', 'Resolved', 'Rejected') DEFAULT 'Pending',
-                    priority ENUM('Low', 'Medium', 'High', 'Emergency') DEFAULT 'Medium',
-                    assigned_to INT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    resolved_at TIMESTAMP NULL,
-                    feedback TEXT,
-                    FOREIGN KEY (user_id) REFERENCES users(id),
-                    FOREIGN KEY (assigned_to) REFERENCES users(id)
+                INSERT INTO users (full_name, email, phone, nid, date_of_birth, address, username, password_hash, role)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ''', ("System Administrator", "admin@gov.bd", "01700000000", 
+                  "0000000000000", "2000-01-01", "Government Building", 
+                  "admin", password_hash, "Administrator"))
+            print("✅ Default admin account created")
+
+    def deduplicate_user_emails(self, cursor):
+        """Clear blank emails and repeats of an email already used by an older account"""
+        cursor.execute("UPDATE users SET email = NULL WHERE TRIM(email) = ''")
+        cursor.execute('''
+            SELECT u.id, u.email FROM users u
+            JOIN (
+                SELECT email, MIN(id) AS first_id FROM users
+                WHERE email IS NOT NULL GROUP BY email HAVING COUNT(*) > 1
+            ) d ON u.email = d.email AND u.id > d.first_id
+        ''')
+        duplicates = cursor.fetchall()
+        if duplicates:
+            cursor.executemany(
+                'UPDATE users SET email = NULL WHERE id = %s', [(user_id,) for user_id, email in duplicates]
+            )
+            print(f"⚠️ Cleared duplicate email on {len(duplicates)} users: "
+                  + ', '.join(f"#{user_id} ({email})" for user_id, email in duplicates))
+
+    def backfill_normalized_names(self, cursor, batch_size=5000):
+        """Fill users.name_normalized in id-ordered batches"""
+        last_id = 0
+        while True:
+            cursor.execute(
+                'SELECT id, full_name FROM users WHERE id > %s ORDER BY id LIMIT %s',
+                (last_id, batch_size)
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            cursor.executemany(
+                'UPDATE users SET name_normalized = %s WHERE id = %s',
+                [(normalize_name(full_name), user_id) for user_id, full_name in rows]
+            )
+            last_id = rows[-1][0]
+
+    def hash_password(self, password):
+        """Hash password with the configured salted KDF"""
+        return get_password_hasher().hash(password)
+
+    def verify_password(self, password, password_hash):
+        """Check a password against a stored hash, returning (valid, needs_rehash)"""
+        return get_password_hasher().verify(password, password_hash)
+
+    def fetch_page(self, sql, conditions, params, sort_column, page_cursor, page_size, id_column=None):
+        """Run a keyset-paginated query ordered by (sort_column, id) descending"""
+        table_alias = sort_column.rsplit('.', 1)[0] if '.' in sort_column else None
+        id_column = id_column or (f"{table_alias}.id" if table_alias else 'id')
+        page_size = max(1, min(page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+        conditions = list(conditions)
+        params = list(params)
+        
+        if page_cursor:
+            sort_value, last_id = decode_page_token(page_cursor)
+            conditions.append(f"({sort_column} < %s OR ({sort_column} = %s AND {id_column} < %s))")
+            params += [sort_value, sort_value, last_id]
+        
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += f' ORDER BY {sort_column} DESC, {id_column} DESC LIMIT %s'
+        params.append(page_size + 1)
+        
+        with self.pool.connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute(sql, tuple(params))
+            rows = cursor.fetchall()
+            cursor.close()
+        
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last_row = rows[-1]
+            next_cursor = encode_page_token(last_row[sort_column.rsplit('.', 1)[-1]], last_row['id'])
+        
+        return {'rows': rows, 'next_cursor': next_cursor}
+
+    # Stats Counter Methods
+    def get_counted_values(self, cursor, entity, row_id):
+        """Lock one row and get its counted column values (None if it does not exist)"""
+        dimensions = STATS_COUNTER_DIMENSIONS[entity]
+        cursor.execute(
+            f"SELECT {', '.join(dimensions)} FROM {entity} WHERE id = %s FOR UPDATE", (row_id,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return {dimension: '' if value is None else value for dimension, value in zip(dimensions, row)}
+
+    def get_counted_groups(self, cursor, entity, row_ids):
+        """Lock a set of rows and count them per (dimension, value), including the total"""
+        groups = {}
+        for chunk in chunked(row_ids):
+            placeholders = ', '.join(['%s'] * len(chunk))
+            for dimension in STATS_COUNTER_DIMENSIONS[entity]:
+                cursor.execute(f'''
+                    SELECT COALESCE({dimension}, ''), COUNT(*) FROM {entity}
+                    WHERE id IN ({placeholders}) GROUP BY COALESCE({dimension}, '')
+                    FOR UPDATE
+                ''', chunk)
+                for value, count in cursor.fetchall():
+                    groups[(dimension, value)] = groups.get((dimension, value), 0) + count
+                    if dimension == STATS_COUNTER_DIMENSIONS[entity][0]:
+                        key = (STATS_TOTAL_DIMENSION, '')
+                        groups[key] = groups.get(key, 0) + count
+        return groups
+
+    def adjust_stats_counters(self, cursor, entity, old_values=None, new_values=None):
+        """Move one row's contribution in stats_counters from old_values to new_values"""
+        deltas = {}
+        for values, delta in ((old_values, -1), (new_values, 1)):
+            if values is None:
+                continue
+            if (old_values is None) != (new_values is None):
+                deltas[(STATS_TOTAL_DIMENSION, '')] = delta
+            for dimension in STATS_COUNTER_DIMENSIONS[entity]:
+                key = (dimension, values[dimension])
+                deltas[key] = deltas.get(key, 0) + delta
+        self.apply_stats_counter_deltas(cursor, entity, deltas)
+
+    def apply_stats_counter_deltas(self, cursor, entity, deltas):
+        """Add {(dimension, value): delta} to stats_counters in one statement"""
+        rows = [(entity, dimension, value, delta) for (dimension, value), delta in deltas.items() if delta]
+        if not rows:
+            return
+
+        placeholders = ', '.join(['(%s, %s, %s, %s)'] * len(rows))
+        cursor.execute(f'''
+            INSERT INTO stats_counters (entity, dimension, value, count)
+            VALUES {placeholders}
+            ON DUPLICATE KEY UPDATE count = count + VALUES(count)
+        ''', [field for row in rows for field in row])
+
+    def run_bulk_update(self, entity, row_ids, assignments, params):
+        """Apply one SET clause to many rows in chunked UPDATE ... WHERE id IN (...) statements.
+
+        Everything runs in a single transaction with one commit, including the
+        stats counter changes when the entity has counters. Returns the number
+        of rows changed.
+        """
+        row_ids = list(dict.fromkeys(row_ids))
+        if not row_ids:
+            return 0
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            counted = entity in STATS_COUNTER_DIMENSIONS
+            if counted:
+                before = self.get_counted_groups(cursor, entity, row_ids)
+            changed = 0
+            for chunk in chunked(row_ids):
+                placeholders = ', '.join(['%s'] * len(chunk))
+                cursor.execute(
+                    f"UPDATE {entity} SET {assignments} WHERE id IN ({placeholders})",
+                    list(params) + chunk
                 )
-            ''')
+                changed += cursor.rowcount
+            if counted:
+                after = self.get_counted_groups(cursor, entity, row_ids)
+                deltas = {key: after.get(key, 0) - before.get(key, 0) for key in set(before) | set(after)}
+                self.apply_stats_counter_deltas(cursor, entity, deltas)
+            connection.commit()
+            cursor.close()
+            return changed
+
+    def run_bulk_delete(self, entity, row_ids):
+        """Delete many rows in chunked DELETE ... WHERE id IN (...) statements.
 
-            self.connection.commit()
+        Runs in a single transaction with one commit, removing the rows from
+        the stats counters when the entity has counters. Returns the number
+        of rows deleted.
+        """
+        row_ids = list(dict.fromkeys(row_ids))
+        if not row_ids:
+            return 0
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            counted = entity in STATS_COUNTER_DIMENSIONS
+            if counted:
+                before = self.get_counted_groups(cursor, entity, row_ids)
+            deleted = 0
+            for chunk in chunked(row_ids):
+                placeholders = ', '.join(['%s'] * len(chunk))
+                cursor.execute(f"DELETE FROM {entity} WHERE id IN ({placeholders})", chunk)
+                deleted += cursor.rowcount
+            if counted:
+                self.apply_stats_counter_deltas(cursor, entity, {key: -count for key, count in before.items()})
+            connection.commit()
             cursor.close()
-            print("✅ Tables created successfully")
-            return True
+            return deleted
 
-        except Error as e:
-            print(f"❌ Error creating tables: {e}")
-            return False
+    def rebuild_stats_counters(self, cursor):
+        """Recompute every stats counter from the base tables"""
+        cursor.execute('DELETE FROM stats_counters')
+        for entity, dimensions in STATS_COUNTER_DIMENSIONS.items():
+            cursor.execute(f'''
+                INSERT INTO stats_counters (entity, dimension, value, count)
+                SELECT %s, %s, '', COUNT(*) FROM {entity}
+            ''', (entity, STATS_TOTAL_DIMENSION))
+            for dimension in dimensions:
+                cursor.execute(f'''
+                    INSERT INTO stats_counters (entity, dimension, value, count)
+                    SELECT %s, %s, COALESCE({dimension}, ''), COUNT(*) FROM {entity}
+                    GROUP BY COALESCE({dimension}, '')
+                ''', (entity, dimension))
 
-    def create_default_admin(self):
-        """Create default admin account"""
+    def reconcile_stats_counters(self):
+        """Rebuild stats counters from scratch, repairing any drift"""
         try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute("SELECT * FROM users WHERE username = 'admin'")
-            if not cursor.fetchone():
-                password_hash = self.hash_password("admin123")
-                cursor.execute('''
-                    INSERT INTO users (full_name, email, phone, nid, date_of_birth, address, username, password_hash, role)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ''', ("System Administrator", "admin@gov.bd", "01700000000", 
-                      "0000000000000", "2000-01-01", "Government Building", 
-                      "admin", password_hash, "Administrator"))
-                
-                self.connection.commit()
-                print("✅ Default admin account created")
-            
-            cursor.close()
-            return True
-            
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                self.rebuild_stats_counters(cursor)
+                connection.commit()
+                cursor.close()
+                return True, "Statistics counters rebuilt successfully"
         except Error as e:
-            print(f"❌ Error creating default admin: {e}")
-            return False
+            return False, f"Database error: {str(e)}"
 
-    def hash_password(self, password):
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def read_stats_counters(self, cursor, entity, created_column):
+        """Read an entity's counters plus its 7-day count in one round trip"""
+        cursor.execute(f'''
+            SELECT dimension, value, count
+            FROM stats_counters
+            WHERE entity = %s AND count > 0
+            UNION ALL
+            SELECT 'recent', '', COUNT(*)
+            FROM {entity}
+            WHERE {created_column} >= DATE_SUB(NOW(), INTERVAL 7 DAY)
+        ''', (entity,))
+        counters = {'total': 0, 'recent': 0}
+        counters.update({dimension: [] for dimension in STATS_COUNTER_DIMENSIONS[entity]})
+        for dimension, value, count in cursor.fetchall():
+            if dimension in (STATS_TOTAL_DIMENSION, 'recent'):
+                counters[dimension] = int(count)
+            else:
+                counters[dimension].append({dimension: value, 'count': int(count)})
+        return counters
 
     # User Management Methods
     def register_user(self, user_data):
         """Register a new user"""
         try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute("SELECT id FROM users WHERE username = %s", (user_data['username'],))
-            if cursor.fetchone():
-                return False, "Username already exists"
-            
-            cursor.execute("SELECT id FROM users WHERE nid = %s", (user_data['nid'],))
-            if cursor.fetchone():
-                return False, "NID already registered"
-            
-            if user_data['email']:
-                cursor.execute("SELECT id FROM users WHERE email = %s", (user_data['email'],))
-                if cursor.fetchone():
-                    return False, "Email already registered"
-            
+            # Hash before checking out a connection; the KDF is deliberately slow
             password_hash = self.hash_password(user_data['password'])
             
-            cursor.execute('''
-                INSERT INTO users (full_name, email, phone, nid, date_of_birth, address, username, password_hash, role, department)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ''', (
-                user_data['full_name'],
-                user_data['email'],
-                user_data['phone'],
-                user_data['nid'],
-                user_data['date_of_birth'],
-                user_data['address'],
-                user_data['username'],
-                password_hash,
-                user_data['role'],
-                user_data.get('department')
-            ))
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
             
-            self.connection.commit()
-            cursor.close()
-            return True, "Registration successful! Please login."
+                # The unique indexes on username, nid and email reject duplicates,
+                # so there is no check-then-insert race between concurrent sign-ups
+                try:
+                    cursor.execute('''
+                        INSERT INTO users (full_name, name_normalized, email, phone, nid, date_of_birth, address, username, password_hash, role, department, status)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Active')
+                    ''', (
+                        user_data['full_name'],
+                        normalize_name(user_data['full_name']),
+                        user_data.get('email') or None,
+                        user_data['phone'],
+                        user_data['nid'],
+                        user_data['date_of_birth'],
+                        user_data['address'],
+                        user_data['username'],
+                        password_hash,
+                        user_data['role'],
+                        user_data.get('department')
+                    ))
+                except Error as e:
+                    message = duplicate_key_message(e)
+                    if message is None:
+                        raise
+                    cursor.close()
+                    return False, message
+                self.adjust_stats_counters(
+                    cursor, 'users', new_values={'role': user_data['role'], 'status': 'Active'}
+                )
+            
+                connection.commit()
+                cursor.close()
+                return True, "Registration successful! Please login."
             
         except Error as e:
             return False, f"Database error: {str(e)}"
@@ -218,43 +693,51 @@ class DatabaseManager:
     def login_user(self, username, password):
         """Authenticate user login"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            with self.pool.connection() as connection:
+                users = fetch_prepared(connection, '''
+                    SELECT id, full_name, username, password_hash, role, email, status, department
+                    FROM users WHERE username = %s
+                ''', (username,), dictionary=True)
             
-            cursor.execute('''
-                SELECT id, full_name, username, password_hash, role, email, status, department
-                FROM users WHERE username = %s
-            ''', (username,))
+            user = users[0] if users else None
+            if not user:
+                return False, "User not found"
             
-            user = cursor.fetchone()
+            if user['status'] != 'Active':
+                return False, "Your account is not active. Please contact administrator."
             
-            if user:
-                if user['status'] != 'Active':
-                    cursor.close()
-                    return False, "Your account is not active. Please contact administrator."
-                
-                if self.hash_password(password) == user['password_hash']:
+            # The KDF runs without holding a pooled connection
+            valid, needs_rehash = self.verify_password(password, user['password_hash'])
+            if not valid:
+                return False, "Invalid password"
+            
+            new_hash = self.hash_password(password) if needs_rehash else None
+            
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                if new_hash:
+                    # Transparently upgrade legacy or outdated hashes
+                    cursor.execute('''
+                        UPDATE users SET last_login = NOW(), password_hash = %s
+                        WHERE id = %s AND password_hash = %s
+                    ''', (new_hash, user['id'], user['password_hash']))
+                else:
                     # Update last login
                     cursor.execute('''
                         UPDATE users SET last_login = NOW() WHERE id = %s
                     ''', (user['id'],))
-                    self.connection.commit()
-                    cursor.close()
-                    
-                    return True, {
-                        "id": user['id'],
-                        "name": user['full_name'],
-                        "username": user['username'],
-                        "role": user['role'],
-                        "email": user['email'],
-                        "status": user['status'],
-                        "department": user['department']
-                    }
-                else:
-                    cursor.close()
-                    return False, "Invalid password"
-            else:
+                connection.commit()
                 cursor.close()
-                return False, "User not found"
+            
+            return True, {
+                "id": user['id'],
+                "name": user['full_name'],
+                "username": user['username'],
+                "role": user['role'],
+                "email": user['email'],
+                "status": user['status'],
+                "department": user['department']
+            }
                 
         except Error as e:
             return False, f"Database error: {str(e)}"
@@ -262,127 +745,239 @@ class DatabaseManager:
     def check_username_availability(self, username):
         """Check if username is available"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT id FROM users WHERE username = %s", (username,))
-            result = cursor.fetchone() is None
-            cursor.close()
-            return result
+            with self.pool.connection() as connection:
+                return not fetch_prepared(connection, "SELECT id FROM users WHERE username = %s", (username,))
         except Error:
             return False
 
     def check_nid_availability(self, nid):
         """Check if NID is available"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT id FROM users WHERE nid = %s", (nid,))
-            result = cursor.fetchone() is None
-            cursor.close()
-            return result
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("SELECT id FROM users WHERE nid = %s", (nid,))
+                result = cursor.fetchone() is None
+                cursor.close()
+                return result
         except Error:
             return False
 
     def get_all_users(self, current_admin_id=None):
         """Get all users (admin only)"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                if current_admin_id:
+                    cursor.execute('''
+                        SELECT id, full_name, email, phone, nid, date_of_birth, 
+                               address, username, role, department, status, created_at, last_login
+                        FROM users WHERE id != %s ORDER BY created_at DESC
+                    ''', (current_admin_id,))
+                else:
+                    cursor.execute('''
+                        SELECT id, full_name, email, phone, nid, date_of_birth, 
+                               address, username, role, department, status, created_at, last_login
+                        FROM users ORDER BY created_at DESC
+                    ''')
+                users = cursor.fetchall()
+                cursor.close()
+                return True, users
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def get_users_page(self, current_admin_id=None, page_cursor=None, page_size=DEFAULT_PAGE_SIZE):
+        """Get one page of users, newest first (admin only)"""
+        try:
+            conditions, params = [], []
             if current_admin_id:
-                cursor.execute('''
-                    SELECT id, full_name, email, phone, nid, date_of_birth, 
-                           address, username, role, department, status, created_at, last_login
-                    FROM users WHERE id != %s ORDER BY created_at DESC
-                ''', (current_admin_id,))
-            else:
-                cursor.execute('''
-                    SELECT id, full_name, email, phone, nid, date_of_birth, 
-                           address, username, role, department, status, created_at, last_login
-                    FROM users ORDER BY created_at DESC
+                conditions.append('id != %s')
+                params.append(current_admin_id)
+            page = self.fetch_page('''
+                SELECT id, full_name, email, phone, nid, date_of_birth, 
+                       address, username, role, department, status, created_at, last_login
+                FROM users
+            ''', conditions, params, 'created_at', page_cursor, page_size)
+            return True, page
+        except (Error, ValueError) as e:
+            return False, f"Database error: {str(e)}"
+
+    def search_users(self, prefix, limit=20, current_admin_id=None):
+        """Type-ahead user search by name, username, phone or NID prefix"""
+        try:
+            prefix = (prefix or '').strip()
+            if not prefix:
+                return True, []
+            limit = max(1, min(limit, MAX_USER_SEARCH_RESULTS))
+            
+            # One index range scan per searchable column, each capped at limit
+            searches = [('username', prefix), ('name_normalized', normalize_name(prefix))]
+            if prefix.isdigit():
+                searches += [('phone', prefix), ('nid', prefix)]
+            exclude = ' AND id != %s' if current_admin_id else ''
+            
+            queries, params = [], []
+            for column, value in searches:
+                queries.append(f'''
+                    (SELECT id, full_name, email, phone, nid, date_of_birth, 
+                            address, username, role, department, status, created_at, last_login
+                     FROM users WHERE {column} LIKE %s{exclude} ORDER BY {column} LIMIT %s)
                 ''')
-            users = cursor.fetchall()
-            cursor.close()
-            return True, users
+                params.append(like_prefix(value))
+                if current_admin_id:
+                    params.append(current_admin_id)
+                params.append(limit)
+            
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(
+                    ' UNION '.join(queries) + ' ORDER BY full_name LIMIT %s',
+                    tuple(params + [limit])
+                )
+                users = cursor.fetchall()
+                cursor.close()
+                return True, users
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def get_active_officers(self, department=None):
+        """Get active government officers, optionally for one department"""
+        try:
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                query = '''
+                    SELECT id, full_name, department
+                    FROM users
+                    WHERE role = 'Government Officer' AND status = 'Active'
+                '''
+                params = ()
+                if department:
+                    query += ' AND department = %s'
+                    params = (department,)
+                cursor.execute(query + ' ORDER BY full_name', params)
+                officers = cursor.fetchall()
+                cursor.close()
+                return True, officers
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def update_user_status(self, user_id, status):
         """Update user status (Active/Inactive/Suspended)"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                UPDATE users SET status = %s WHERE id = %s
-            ''', (status, user_id))
-            self.connection.commit()
-            cursor.close()
-            return True, "User status updated successfully"
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                old_values = self.get_counted_values(cursor, 'users', user_id)
+                cursor.execute('''
+                    UPDATE users SET status = %s WHERE id = %s
+                ''', (status, user_id))
+                self.adjust_stats_counters(
+                    cursor, 'users', old_values, self.get_counted_values(cursor, 'users', user_id)
+                )
+                connection.commit()
+                cursor.close()
+                return True, "User status updated successfully"
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def bulk_update_user_status(self, user_ids, status):
+        """Update the status of many users in one transaction"""
+        try:
+            changed = self.run_bulk_update('users', user_ids, 'status = %s', (status,))
+            return True, f"{changed} user(s) updated successfully"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def delete_user(self, user_id):
         """Delete a user"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('DELETE FROM users WHERE id = %s', (user_id,))
-            self.connection.commit()
-            cursor.close()
-            return True, "User deleted successfully"
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                old_values = self.get_counted_values(cursor, 'users', user_id)
+                cursor.execute('DELETE FROM users WHERE id = %s', (user_id,))
+                self.adjust_stats_counters(cursor, 'users', old_values=old_values)
+                connection.commit()
+                cursor.close()
+                return True, "User deleted successfully"
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def bulk_delete_users(self, user_ids):
+        """Delete many users in one transaction"""
+        try:
+            deleted = self.run_bulk_delete('users', user_ids)
+            return True, f"{deleted} user(s) deleted successfully"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def update_user_role(self, user_id, new_role):
         """Update user role"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                UPDATE users SET role = %s WHERE id = %s
-            ''', (new_role, user_id))
-            self.connection.commit()
-            cursor.close()
-            return True, "User role updated successfully"
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                old_values = self.get_counted_values(cursor, 'users', user_id)
+                cursor.execute('''
+                    UPDATE users SET role = %s WHERE id = %s
+                ''', (new_role, user_id))
+                self.adjust_stats_counters(
+                    cursor, 'users', old_values, self.get_counted_values(cursor, 'users', user_id)
+                )
+                connection.commit()
+                cursor.close()
+                return True, "User role updated successfully"
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def bulk_update_user_role(self, user_ids, new_role):
+        """Update the role of many users in one transaction"""
+        try:
+            changed = self.run_bulk_update('users', user_ids, 'role = %s', (new_role,))
+            return True, f"{changed} user(s) updated successfully"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def get_user_stats(self):
         """Get user statistics for admin dashboard"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            
-            # Total users
-            cursor.execute('SELECT COUNT(*) as total FROM users')
-            total_users = cursor.fetchone()['total']
-            
-            # Users by role
-            cursor.execute('''
-                SELECT role, COUNT(*) as count 
-                FROM users 
-                GROUP BY role
-            ''')
-            users_by_role = cursor.fetchall()
-            
-            # Users by status
-            cursor.execute('''
-                SELECT status, COUNT(*) as count 
-                FROM users 
-                GROUP BY status
-            ''')
-            users_by_status = cursor.fetchall()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                counters = self.read_stats_counters(cursor, 'users', 'created_at')
+                cursor.close()
             
-            # Recent registrations (last 7 days)
-            cursor.execute('''
-                SELECT COUNT(*) as recent 
-                FROM users 
-                WHERE created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-            ''')
-            recent_registrations = cursor.fetchone()['recent']
+                stats = {
+                    'total_users': counters['total'],
+                    'users_by_role': counters['role'],
+                    'users_by_status': counters['status'],
+                    'recent_registrations': counters['recent']
+                }
             
-            cursor.close()
-            
-            stats = {
-                'total_users': total_users,
-                'users_by_role': users_by_role,
-                'users_by_status': users_by_status,
-                'recent_registrations': recent_registrations
-            }
+                return True, stats
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def count_user_items(self, user_id):
+        """Count a user's applications and reports, grouped by status"""
+        try:
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute('''
+                    SELECT 'applications', status, COUNT(*) FROM applications
+                    WHERE user_id = %s GROUP BY status
+                    UNION ALL
+                    SELECT 'reports', status, COUNT(*) FROM reports
+                    WHERE user_id = %s GROUP BY status
+                ''', (user_id, user_id))
+                rows = cursor.fetchall()
+                cursor.close()
             
-            return True, stats
+                counts = {
+                    'applications': 0,
+                    'reports': 0,
+                    'applications_by_status': {},
+                    'reports_by_status': {}
+                }
+                for item_type, status, count in rows:
+                    counts[item_type] += count
+                    counts[f"{item_type}_by_status"][status] = count
+                return True, counts
         except Error as e:
             return False, f"Database error: {str(e)}"
 
@@ -390,35 +985,37 @@ class DatabaseManager:
     def create_service(self, service_data):
         """Create a new service"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                INSERT INTO services (name, description, category, department, requirements, processing_time, fee, created_by)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            ''', (service_data['name'], service_data['description'], 
-                  service_data['category'], service_data.get('department'),
-                  service_data.get('requirements'), service_data.get('processing_time'),
-                  service_data.get('fee', 0.00), service_data['created_by']))
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute('''
+                    INSERT INTO services (name, description, category, department, requirements, processing_time, fee, created_by)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                ''', (service_data['name'], service_data['description'], 
+                      service_data['category'], service_data.get('department'),
+                      service_data.get('requirements'), service_data.get('processing_time'),
+                      service_data.get('fee', 0.00), service_data['created_by']))
             
-            self.connection.commit()
-            service_id = cursor.lastrowid
-            cursor.close()
-            return True, f"Service created successfully (ID: {service_id})"
+                connection.commit()
+                service_id = cursor.lastrowid
+                cursor.close()
+                return True, f"Service created successfully (ID: {service_id})"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def get_all_services(self):
         """Get all services"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute('''
-                SELECT s.*, u.full_name as created_by_name 
-                FROM services s 
-                LEFT JOIN users u ON s.created_by = u.id 
-                ORDER BY s.created_at DESC
-            ''')
-            services = cursor.fetchall()
-            cursor.close()
-            return True, services
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute('''
+                    SELECT s.*, u.full_name as created_by_name 
+                    FROM services s 
+                    LEFT JOIN users u ON s.created_by = u.id 
+                    ORDER BY s.created_at DESC
+                ''')
+                services = cursor.fetchall()
+                cursor.close()
+                return True, services
         except Error as e:
             return False, f"Database error: {str(e)}"
 
@@ -426,69 +1023,109 @@ class DatabaseManager:
     def create_application(self, application_data):
         """Create a new service application"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                INSERT INTO applications (user_id, service_id, application_data, status)
-                VALUES (%s, %s, %s, %s)
-            ''', (application_data['user_id'], application_data['service_id'],
-                  application_data['application_data'], 'Pending'))
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute('''
+                    INSERT INTO applications (user_id, service_id, application_data, status)
+                    VALUES (%s, %s, %s, %s)
+                ''', (application_data['user_id'], application_data['service_id'],
+                      application_data['application_data'], 'Pending'))
             
-            self.connection.commit()
-            application_id = cursor.lastrowid
-            cursor.close()
-            return True, f"Application submitted successfully (ID: {application_id})"
+                connection.commit()
+                application_id = cursor.lastrowid
+                cursor.close()
+                return True, f"Application submitted successfully (ID: {application_id})"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def get_user_applications(self, user_id):
         """Get applications for a specific user"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute('''
+            with self.pool.connection() as connection:
+                applications = fetch_prepared(connection, '''
+                    SELECT a.*, s.name as service_name, s.category as service_category
+                    FROM applications a
+                    JOIN services s ON a.service_id = s.id
+                    WHERE a.user_id = %s
+                    ORDER BY a.applied_date DESC
+                ''', (user_id,), dictionary=True)
+                return True, applications
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def get_user_applications_page(self, user_id, page_cursor=None, page_size=DEFAULT_PAGE_SIZE):
+        """Get one page of a user's applications, newest first"""
+        try:
+            page = self.fetch_page('''
                 SELECT a.*, s.name as service_name, s.category as service_category
                 FROM applications a
                 JOIN services s ON a.service_id = s.id
-                WHERE a.user_id = %s
-                ORDER BY a.applied_date DESC
-            ''', (user_id,))
-            applications = cursor.fetchall()
-            cursor.close()
-            return True, applications
-        except Error as e:
+            ''', ['a.user_id = %s'], [user_id], 'a.applied_date', page_cursor, page_size)
+            return True, page
+        except (Error, ValueError) as e:
             return False, f"Database error: {str(e)}"
 
     def get_all_applications(self):
         """Get all applications (for admin/officers)"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute('''
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute('''
+                    SELECT a.*, s.name as service_name, u.full_name as applicant_name,
+                           u.username as applicant_username, p.full_name as processor_name
+                    FROM applications a
+                    JOIN services s ON a.service_id = s.id
+                    JOIN users u ON a.user_id = u.id
+                    LEFT JOIN users p ON a.processed_by = p.id
+                    ORDER BY a.applied_date DESC
+                ''')
+                applications = cursor.fetchall()
+                cursor.close()
+                return True, applications
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def get_applications_page(self, page_cursor=None, page_size=DEFAULT_PAGE_SIZE):
+        """Get one page of applications, newest first (for admin/officers)"""
+        try:
+            page = self.fetch_page('''
                 SELECT a.*, s.name as service_name, u.full_name as applicant_name,
                        u.username as applicant_username, p.full_name as processor_name
                 FROM applications a
                 JOIN services s ON a.service_id = s.id
                 JOIN users u ON a.user_id = u.id
                 LEFT JOIN users p ON a.processed_by = p.id
-                ORDER BY a.applied_date DESC
-            ''')
-            applications = cursor.fetchall()
-            cursor.close()
-            return True, applications
-        except Error as e:
+            ''', [], [], 'a.applied_date', page_cursor, page_size)
+            return True, page
+        except (Error, ValueError) as e:
             return False, f"Database error: {str(e)}"
 
     def update_application_status(self, application_id, status, processed_by, notes=None):
         """Update application status"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                UPDATE applications 
-                SET status = %s, processed_by = %s, processed_date = NOW(), notes = %s
-                WHERE id = %s
-            ''', (status, processed_by, notes, application_id))
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute('''
+                    UPDATE applications 
+                    SET status = %s, processed_by = %s, processed_date = NOW(), notes = %s
+                    WHERE id = %s
+                ''', (status, processed_by, notes, application_id))
             
-            self.connection.commit()
-            cursor.close()
-            return True, "Application status updated successfully"
+                connection.commit()
+                cursor.close()
+                return True, "Application status updated successfully"
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def bulk_update_application_status(self, application_ids, status, processed_by, notes=None):
+        """Update the status of many applications in one transaction"""
+        try:
+            changed = self.run_bulk_update(
+                'applications', application_ids,
+                'status = %s, processed_by = %s, processed_date = NOW(), notes = %s',
+                (status, processed_by, notes)
+            )
+            return True, f"{changed} application(s) updated successfully"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
@@ -496,204 +1133,397 @@ class DatabaseManager:
     def submit_report(self, report_data):
         """Submit a citizen report"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                INSERT INTO reports (user_id, title, description, category, location, image_url, priority)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ''', (report_data['user_id'], report_data['title'], report_data['description'],
-                  report_data['category'], report_data.get('location'), 
-                  report_data.get('image_url'), report_data.get('priority', 'Medium')))
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute('''
+                    INSERT INTO reports (user_id, title, description, category, location, image_url, priority)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ''', (report_data['user_id'], report_data['title'], report_data['description'],
+                      report_data['category'], report_data.get('location'), 
+                      report_data.get('image_url'), report_data.get('priority', 'Medium')))
             
-            self.connection.commit()
-            report_id = cursor.lastrowid
-            cursor.close()
-            return True, f"Report submitted successfully (ID: {report_id})"
+                report_id = cursor.lastrowid
+                self.adjust_stats_counters(
+                    cursor, 'reports', new_values=self.get_counted_values(cursor, 'reports', report_id)
+                )
+                connection.commit()
+                cursor.close()
+                return True, f"Report submitted successfully (ID: {report_id})"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def get_user_reports(self, user_id):
         """Get reports for a specific user"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute('''
-                SELECT r.*, u.full_name as assigned_officer
-                FROM reports r
-                LEFT JOIN users u ON r.assigned_to = u.id
-                WHERE r.user_id = %s
-                ORDER BY r.created_at DESC
-            ''', (user_id,))
-            reports = cursor.fetchall()
-            cursor.close()
-            return True, reports
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute('''
+                    SELECT r.*, u.full_name as assigned_officer
+                    FROM reports r
+                    LEFT JOIN users u ON r.assigned_to = u.id
+                    WHERE r.user_id = %s
+                    ORDER BY r.created_at DESC
+                ''', (user_id,))
+                reports = cursor.fetchall()
+                cursor.close()
+                return True, reports
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def get_all_reports(self):
         """Get all reports (Admin only)"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute('''
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute('''
+                    SELECT r.*, u1.full_name as reporter_name, u2.full_name as assigned_officer,
+                           u1.username as reporter_username, u1.phone as reporter_phone
+                    FROM reports r
+                    JOIN users u1 ON r.user_id = u1.id
+                    LEFT JOIN users u2 ON r.assigned_to = u2.id
+                    ORDER BY r.created_at DESC
+                ''')
+                reports = cursor.fetchall()
+                cursor.close()
+                return True, reports
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def get_reports_page(self, page_cursor=None, page_size=DEFAULT_PAGE_SIZE):
+        """Get one page of reports, newest first (Admin only)"""
+        try:
+            page = self.fetch_page('''
                 SELECT r.*, u1.full_name as reporter_name, u2.full_name as assigned_officer,
                        u1.username as reporter_username, u1.phone as reporter_phone
                 FROM reports r
                 JOIN users u1 ON r.user_id = u1.id
                 LEFT JOIN users u2 ON r.assigned_to = u2.id
-                ORDER BY r.created_at DESC
-            ''')
-            reports = cursor.fetchall()
-            cursor.close()
-            return True, reports
-        except Error as e:
+            ''', [], [], 'r.created_at', page_cursor, page_size)
+            return True, page
+        except (Error, ValueError) as e:
+            return False, f"Database error: {str(e)}"
+
+    def search_reports(self, query, filters=None, page_cursor=None, page_size=DEFAULT_PAGE_SIZE):
+        """Full-text search over report title, description and location, best matches first"""
+        try:
+            search = fulltext_query(query)
+            if not search:
+                return True, {'rows': [], 'next_cursor': None}
+            page_size = max(1, min(page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+            offset = int(page_cursor or 0)
+            
+            conditions = ['MATCH(r.title, r.description, r.location) AGAINST (%s IN BOOLEAN MODE)']
+            params = [search, search]
+            for column, value in (filters or {}).items():
+                if column not in REPORT_SEARCH_FILTERS:
+                    raise ValueError(f"Unknown report filter: {column}")
+                if value:
+                    conditions.append(f"r.{column} = %s")
+                    params.append(value)
+            params += [page_size + 1, offset]
+            
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(f'''
+                    SELECT r.*, u1.full_name as reporter_name, u2.full_name as assigned_officer,
+                           u1.username as reporter_username, u1.phone as reporter_phone,
+                           MATCH(r.title, r.description, r.location) AGAINST (%s IN BOOLEAN MODE) as relevance
+                    FROM reports r
+                    JOIN users u1 ON r.user_id = u1.id
+                    LEFT JOIN users u2 ON r.assigned_to = u2.id
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY relevance DESC, r.id DESC
+                    LIMIT %s OFFSET %s
+                ''', tuple(params))
+                rows = cursor.fetchall()
+                cursor.close()
+            
+            # Relevance order has no stable keyset, so search pages by offset
+            next_cursor = None
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                next_cursor = str(offset + page_size)
+            return True, {'rows': rows, 'next_cursor': next_cursor}
+        except (Error, ValueError) as e:
             return False, f"Database error: {str(e)}"
 
     def get_report_by_id(self, report_id):
         """Get specific report by ID"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute('''
-                SELECT r.*, u1.full_name as reporter_name, u2.full_name as assigned_officer,
-                       u1.username as reporter_username, u1.phone as reporter_phone,
-                       u1.email as reporter_email
-                FROM reports r
-                JOIN users u1 ON r.user_id = u1.id
-                LEFT JOIN users u2 ON r.assigned_to = u2.id
-                WHERE r.id = %s
-            ''', (report_id,))
-            report = cursor.fetchone()
-            cursor.close()
-            if report:
-                return True, report
-            else:
-                return False, "Report not found"
+            with self.pool.connection() as connection:
+                reports = fetch_prepared(connection, '''
+                    SELECT r.*, u1.full_name as reporter_name, u2.full_name as assigned_officer,
+                           u1.username as reporter_username, u1.phone as reporter_phone,
+                           u1.email as reporter_email
+                    FROM reports r
+                    JOIN users u1 ON r.user_id = u1.id
+                    LEFT JOIN users u2 ON r.assigned_to = u2.id
+                    WHERE r.id = %s
+                ''', (report_id,), dictionary=True)
+                if reports:
+                    return True, reports[0]
+                else:
+                    return False, "Report not found"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def get_reports_by_department(self, department):
         """Get reports by department category"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute('''
+            with self.pool.connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute('''
+                    SELECT r.*, u1.full_name as reporter_name, u2.full_name as assigned_officer
+                    FROM reports r
+                    JOIN users u1 ON r.user_id = u1.id
+                    LEFT JOIN users u2 ON r.assigned_to = u2.id
+                    WHERE r.category = %s
+                    ORDER BY r.created_at DESC
+                ''', (department,))
+                reports = cursor.fetchall()
+                cursor.close()
+                return True, reports
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def get_department_reports_page(self, department, page_cursor=None, page_size=DEFAULT_PAGE_SIZE):
+        """Get one page of reports for a department category, newest first"""
+        try:
+            page = self.fetch_page('''
                 SELECT r.*, u1.full_name as reporter_name, u2.full_name as assigned_officer
                 FROM reports r
                 JOIN users u1 ON r.user_id = u1.id
                 LEFT JOIN users u2 ON r.assigned_to = u2.id
-                WHERE r.category = %s
-                ORDER BY r.created_at DESC
-            ''', (department,))
-            reports = cursor.fetchall()
-            cursor.close()
-            return True, reports
+            ''', ['r.category = %s'], [department], 'r.created_at', page_cursor, page_size)
+            return True, page
+        except (Error, ValueError) as e:
+            return False, f"Database error: {str(e)}"
+
+    def count_department_reports_by_status(self, department):
+        """Count a department's reports, grouped by status"""
+        try:
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute('''
+                    SELECT status, COUNT(*) FROM reports
+                    WHERE category = %s
+                    GROUP BY status
+                ''', (department,))
+                by_status = dict(cursor.fetchall())
+                cursor.close()
+                return True, {'total': sum(by_status.values()), 'by_status': by_status}
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def update_report_status(self, report_id, status, assigned_to=None, feedback=None):
         """Update report status"""
         try:
-            cursor = self.connection.cursor()
-            if status == 'Resolved':
-                cursor.execute('''
-                    UPDATE reports 
-                    SET status = %s, assigned_to = %s, resolved_at = NOW(), feedback = %s
-                    WHERE id = %s
-                ''', (status, assigned_to, feedback, report_id))
-            else:
-                cursor.execute('''
-                    UPDATE reports 
-                    SET status = %s, assigned_to = %s, feedback = %s
-                    WHERE id = %s
-                ''', (status, assigned_to, feedback, report_id))
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                old_values = self.get_counted_values(cursor, 'reports', report_id)
+                if status == 'Resolved':
+                    cursor.execute('''
+                        UPDATE reports 
+                        SET status = %s, assigned_to = %s, resolved_at = NOW(), feedback = %s
+                        WHERE id = %s
+                    ''', (status, assigned_to, feedback, report_id))
+                else:
+                    cursor.execute('''
+                        UPDATE reports 
+                        SET status = %s, assigned_to = %s, feedback = %s
+                        WHERE id = %s
+                    ''', (status, assigned_to, feedback, report_id))
             
-            self.connection.commit()
-            cursor.close()
-            return True, "Report status updated successfully"
+                self.adjust_stats_counters(
+                    cursor, 'reports', old_values, self.get_counted_values(cursor, 'reports', report_id)
+                )
+                connection.commit()
+                cursor.close()
+                return True, "Report status updated successfully"
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def bulk_update_report_status(self, report_ids, status, feedback=None):
+        """Update the status of many reports in one transaction"""
+        try:
+            assignments = 'status = %s, feedback = COALESCE(%s, feedback)'
+            # Only resolved reports carry a resolution time; reopening one clears it
+            assignments += ', resolved_at = NOW()' if status == 'Resolved' else ', resolved_at = NULL'
+            changed = self.run_bulk_update('reports', report_ids, assignments, (status, feedback or None))
+            return True, f"{changed} report(s) updated successfully"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def update_report_details(self, report_id, title, description, category, priority):
         """Update report details"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                UPDATE reports 
-                SET title = %s, description = %s, category = %s, priority = %s
-                WHERE id = %s
-            ''', (title, description, category, priority, report_id))
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                old_values = self.get_counted_values(cursor, 'reports', report_id)
+                cursor.execute('''
+                    UPDATE reports 
+                    SET title = %s, description = %s, category = %s, priority = %s
+                    WHERE id = %s
+                ''', (title, description, category, priority, report_id))
             
-            self.connection.commit()
-            cursor.close()
-            return True, "Report details updated successfully"
+                self.adjust_stats_counters(
+                    cursor, 'reports', old_values, self.get_counted_values(cursor, 'reports', report_id)
+                )
+                connection.commit()
+                cursor.close()
+                return True, "Report details updated successfully"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def delete_report(self, report_id):
         """Delete a report (Admin only)"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('DELETE FROM reports WHERE id = %s', (report_id,))
-            self.connection.commit()
-            cursor.close()
-            return True, "Report deleted successfully"
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                old_values = self.get_counted_values(cursor, 'reports', report_id)
+                cursor.execute('DELETE FROM reports WHERE id = %s', (report_id,))
+                self.adjust_stats_counters(cursor, 'reports', old_values=old_values)
+                connection.commit()
+                cursor.close()
+                return True, "Report deleted successfully"
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def bulk_delete_reports(self, report_ids):
+        """Delete many reports in one transaction (Admin only)"""
+        try:
+            deleted = self.run_bulk_delete('reports', report_ids)
+            return True, f"{deleted} report(s) deleted successfully"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def assign_report_to_officer(self, report_id, officer_id):
         """Assign report to government officer"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                UPDATE reports 
-                SET assigned_to = %s, status = 'In Progress'
-                WHERE id = %s
-            ''', (officer_id, report_id))
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                old_values = self.get_counted_values(cursor, 'reports', report_id)
+                cursor.execute('''
+                    UPDATE reports 
+                    SET assigned_to = %s, status = 'In Progress'
+                    WHERE id = %s
+                ''', (officer_id, report_id))
             
-            self.connection.commit()
-            cursor.close()
-            return True, "Report assigned to officer successfully"
+                self.adjust_stats_counters(
+                    cursor, 'reports', old_values, self.get_counted_values(cursor, 'reports', report_id)
+                )
+                connection.commit()
+                cursor.close()
+                return True, "Report assigned to officer successfully"
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def bulk_assign_reports(self, report_ids, officer_id):
+        """Assign many reports to one government officer in one transaction"""
+        try:
+            changed = self.run_bulk_update(
+                'reports', report_ids, "assigned_to = %s, status = 'In Progress'", (officer_id,)
+            )
+            return True, f"{changed} report(s) assigned to officer successfully"
         except Error as e:
             return False, f"Database error: {str(e)}"
 
     def get_report_stats(self):
         """Get report statistics"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            
-            # Total reports
-            cursor.execute('SELECT COUNT(*) as total FROM reports')
-            total_reports = cursor.fetchone()['total']
-            
-            # Reports by status
-            cursor.execute('''
-                SELECT status, COUNT(*) as count 
-                FROM reports 
-                GROUP BY status
-            ''')
-            reports_by_status = cursor.fetchall()
-            
-            # Reports by category
-            cursor.execute('''
-                SELECT category, COUNT(*) as count 
-                FROM reports 
-                GROUP BY category
-            ''')
-            reports_by_category = cursor.fetchall()
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                counters = self.read_stats_counters(cursor, 'reports', 'created_at')
+                cursor.close()
             
-            # Recent reports (last 7 days)
-            cursor.execute('''
-                SELECT COUNT(*) as recent 
-                FROM reports 
-                WHERE created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-            ''')
-            recent_reports = cursor.fetchone()['recent']
+                stats = {
+                    'total_reports': counters['total'],
+                    'reports_by_status': counters['status'],
+                    'reports_by_category': counters['category'],
+                    'recent_reports': counters['recent']
+                }
             
-            cursor.close()
-            
-            stats = {
-                'total_reports': total_reports,
-                'reports_by_status': reports_by_status,
-                'reports_by_category': reports_by_category,
-                'recent_reports': recent_reports
-            }
-            
-            return True, stats
+                return True, stats
         except Error as e:
-            return False, f"Database error: {str(e)}"
\ No newline at end of file
+            return False, f"Database error: {str(e)}"
+
+
+# Ordered schema migrations: (version, description, steps). A step is either
+# an SQL statement or a callable taking (DatabaseManager, cursor).
+SCHEMA_MIGRATIONS = [
+    (1, "Create core tables", [DatabaseManager.create_tables]),
+    (2, "Create default administrator", [DatabaseManager.create_default_admin]),
+    (3, "Add secondary indexes for hot queries", [
+        'CREATE INDEX idx_users_role_status ON users (role, status)',
+        'CREATE INDEX idx_users_created_at ON users (created_at)',
+        'CREATE INDEX idx_services_created_at ON services (created_at)',
+        'CREATE INDEX idx_applications_user_applied ON applications (user_id, applied_date)',
+        'CREATE INDEX idx_applications_applied_date ON applications (applied_date)',
+        'CREATE INDEX idx_reports_category_created ON reports (category, created_at)',
+        'CREATE INDEX idx_reports_user_created ON reports (user_id, created_at)',
+        'CREATE INDEX idx_reports_created_at ON reports (created_at)',
+        'CREATE INDEX idx_reports_status ON reports (status)',
+    ]),
+    (4, "Add incrementally maintained stats counters", [
+        '''
+        CREATE TABLE IF NOT EXISTS stats_counters (
+            entity VARCHAR(50) NOT NULL,
+            dimension VARCHAR(50) NOT NULL,
+            value VARCHAR(100) NOT NULL,
+            count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (entity, dimension, value)
+        )
+        ''',
+        DatabaseManager.rebuild_stats_counters,
+    ]),
+    (5, "Add covering indexes for per-user and per-department status counts", [
+        'CREATE INDEX idx_applications_user_status ON applications (user_id, status)',
+        'CREATE INDEX idx_reports_user_status ON reports (user_id, status)',
+        'CREATE INDEX idx_reports_category_status ON reports (category, status)',
+    ]),
+    (6, "Index active officer lookup by role, status and department", [
+        'CREATE INDEX idx_users_role_status_department ON users (role, status, department)',
+        # Left prefix of the new index
+        'DROP INDEX idx_users_role_status ON users',
+    ]),
+    (7, "Add full-text index for report search", [
+        'CREATE FULLTEXT INDEX ft_reports_text ON reports (title, description, location)',
+    ]),
+    (8, "Add normalized name column and prefix indexes for user search", [
+        'ALTER TABLE users ADD COLUMN name_normalized VARCHAR(255) NULL AFTER full_name',
+        DatabaseManager.backfill_normalized_names,
+        'CREATE INDEX idx_users_name_normalized ON users (name_normalized)',
+        'CREATE INDEX idx_users_phone ON users (phone)',
+    ]),
+    (9, "Enforce unique email addresses", [
+        DatabaseManager.deduplicate_user_emails,
+        'CREATE UNIQUE INDEX uq_users_email ON users (email)',
+    ]),
+]
+
+SCHEMA_VERSION = SCHEMA_MIGRATIONS[-1][0]
+
+# Reads that are safe to run twice. login_user qualifies too: its only write
+# (last_login, plus a rehash guarded on the old hash) can be repeated.
+IDEMPOTENT_READS = (
+    'login_user', 'check_username_availability', 'check_nid_availability', 'get_all_users',
+    'get_users_page', 'search_users', 'get_active_officers', 'get_user_stats',
+    'count_user_items', 'get_all_services', 'get_user_applications', 'get_user_applications_page',
+    'get_all_applications', 'get_applications_page', 'get_user_reports', 'get_all_reports',
+    'get_reports_page', 'search_reports', 'get_report_by_id', 'get_reports_by_department',
+    'get_department_reports_page', 'count_department_reports_by_status', 'get_report_stats'
+)
+
+for _name in IDEMPOTENT_READS:
+    setattr(DatabaseManager, _name, retry_on_disconnect(getattr(DatabaseManager, _name)))
+
+# Methods left out of the per-method query metrics: setup, password hashing and the diagnostics themselves
+UNINSTRUMENTED_METHODS = ('connect', 'create_database', 'hash_password', 'verify_password',
+                          'get_pool_stats', 'get_statement_cache_stats', 'get_query_metrics',
+                          'reset_query_metrics')
+
+instrument_methods(DatabaseManager, exclude=UNINSTRUMENTED_METHODS)
+
+# The KDF is CPU time, not query latency: login and registration metrics time only their SQL
+for _name in ('hash_password', 'verify_password'):
+    setattr(DatabaseManager, _name, untimed(getattr(DatabaseManager, _name)))
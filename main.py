@@ -1,8 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from auth_functions import AuthManager
+from async_loader import AsyncLoader
 from dashboard import start_dashboard
 
+# Pause after the last keystroke before a possibly-taken username/NID is checked in the database
+AVAILABILITY_CHECK_DELAY_MS = 300
+
 class ModernLoginApp:
     def __init__(self, root):
         self.root = root
@@ -30,9 +34,14 @@ class ModernLoginApp:
         }
         
         self.auth = AuthManager()
+        self.loader = AsyncLoader(root)
         self.current_user = None
+        self.request_pending = False
+        self.availability_jobs = {}
+        self.availability_labels = {}
         
         self.setup_ui()
+        self.loader.submit(self.auth.load_availability_filter, self.on_availability_filter_loaded)
 
     def setup_ui(self):
         self.create_login_screen()
@@ -155,6 +164,8 @@ class ModernLoginApp:
             entry = tk.Entry(row_frame, width=30, font=self.FONTS['body'], relief='solid', bd=1)
             entry.pack(side='left', fill='x', expand=True, padx=(10, 0), ipady=4)
             self.reg_entries[label] = entry
+            if label == "NID Number":
+                self.attach_availability_check('nid', entry, row_frame, "✗ NID registered")
         
         # Account Information
         account_frame = tk.LabelFrame(scrollable_frame, text=" Account Information ", font=self.FONTS['body'], bg=self.COLORS['white'], fg=self.COLORS['primary'], relief='solid', bd=1)
@@ -166,6 +177,7 @@ class ModernLoginApp:
         tk.Label(user_frame, text="Username *", font=self.FONTS['body'], bg=self.COLORS['white'], fg=self.COLORS['text_dark'], width=20, anchor='w').pack(side='left')
         self.reg_entries['Username'] = tk.Entry(user_frame, width=30, font=self.FONTS['body'], relief='solid', bd=1)
         self.reg_entries['Username'].pack(side='left', fill='x', expand=True, padx=(10, 0), ipady=4)
+        self.attach_availability_check('username', self.reg_entries['Username'], user_frame, "✗ Username taken")
         
         # Password
         pass_frame = tk.Frame(account_frame, bg=self.COLORS['white'])
@@ -223,6 +235,47 @@ class ModernLoginApp:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+    def attach_availability_check(self, field, entry, row_frame, taken_text):
+        """Show live availability next to a username/NID entry as the user types"""
+        status_label = tk.Label(row_frame, text="", font=self.FONTS['small'], bg=self.COLORS['white'], width=16, anchor='w')
+        status_label.pack(side='left', padx=(10, 0))
+        self.availability_labels[field] = status_label
+        
+        def on_result(value, available):
+            # Ignore answers for text the user has since changed
+            if entry.get().strip() != value:
+                return
+            if available is True:
+                status_label.config(text="✓ Available", fg=self.COLORS['success'])
+            else:
+                status_label.config(text=taken_text, fg='#e74c3c')
+        
+        def check_database(value):
+            self.availability_jobs.pop(field, None)
+            self.loader.submit(self.auth.check_availability, lambda available: on_result(value, available), field, value)
+        
+        def on_key(event):
+            job = self.availability_jobs.pop(field, None)
+            if job:
+                self.root.after_cancel(job)
+            value = entry.get().strip()
+            if not value:
+                status_label.config(text="")
+            elif not self.auth.might_be_taken(field, value):
+                # Certainly free: answered from memory, no query
+                status_label.config(text="✓ Available", fg=self.COLORS['success'])
+            else:
+                status_label.config(text="Checking...", fg=self.COLORS['text_light'])
+                self.availability_jobs[field] = self.root.after(AVAILABILITY_CHECK_DELAY_MS, check_database, value)
+        
+        entry.bind('<KeyRelease>', on_key)
+
+    def on_availability_filter_loaded(self, load_result):
+        success, result = load_result
+        if not success:
+            # Checks still work, they just all go to the database
+            print(f"⚠️ Availability filter not loaded: {result}")
+
     def show_frame(self, frame_name):
         self.login_frame.pack_forget()
         self.register_frame.pack_forget()
@@ -233,19 +286,30 @@ class ModernLoginApp:
             self.register_frame.pack(fill='both', expand=True)
 
     def handle_login(self):
+        if self.request_pending:
+            return
         username = self.login_username.get().strip()
         password = self.login_password.get().strip()
         
-        success, result = self.auth.login_user(username, password)
-        if success:
-            self.current_user = result
-            messagebox.showinfo("Success", f"Welcome {result['name']}!\nRole: {result['role']}")
-            self.clear_login_form()
-            # Launch dashboard
-            self.root.destroy()
-            start_dashboard(result)
-        else:
-            messagebox.showerror("Error", result)
+        def on_login(login_result):
+            self.request_pending = False
+            self.root.config(cursor='')
+            success, result = login_result
+            if success:
+                self.current_user = result
+                messagebox.showinfo("Success", f"Welcome {result['name']}!\nRole: {result['role']}")
+                self.clear_login_form()
+                # Launch dashboard
+                self.loader.shutdown()
+                self.root.destroy()
+                start_dashboard(result)
+            else:
+                messagebox.showerror("Error", result)
+        
+        # Password hashing is slow by design, so keep it off the Tk thread
+        self.request_pending = True
+        self.root.config(cursor='watch')
+        self.loader.submit(self.auth.login_user, on_login, username, password)
 
     def handle_register(self):
         data = {
@@ -269,13 +333,23 @@ class ModernLoginApp:
             messagebox.showwarning("Warning", "Please agree to the Terms and Conditions")
             return
         
-        success, result = self.auth.register_user(data)
-        if success:
-            messagebox.showinfo("Success", "Account created successfully!\nYou can now login.")
-            self.clear_register_form()
-            self.show_frame('login')
-        else:
-            messagebox.showerror("Error", result)
+        if self.request_pending:
+            return
+        
+        def on_register(register_result):
+            self.request_pending = False
+            self.root.config(cursor='')
+            success, result = register_result
+            if success:
+                messagebox.showinfo("Success", "Account created successfully!\nYou can now login.")
+                self.clear_register_form()
+                self.show_frame('login')
+            else:
+                messagebox.showerror("Error", result)
+        
+        self.request_pending = True
+        self.root.config(cursor='watch')
+        self.loader.submit(self.auth.register_user, on_register, data)
 
     def clear_login_form(self):
         self.login_username.delete(0, tk.END)
@@ -284,6 +358,8 @@ class ModernLoginApp:
     def clear_register_form(self):
         for entry in self.reg_entries.values():
             entry.delete(0, tk.END)
+        for status_label in self.availability_labels.values():
+            status_label.config(text="")
         self.role_var.set("Citizen")
         self.terms_var.set(False)
 
@@ -0,0 +1,173 @@
+import hashlib
+import math
+import threading
+from mysql.connector import Error
+from database_config import normalize_name
+
+# Target false-positive rate; a false positive only costs one database lookup
+FILTER_ERROR_RATE = 0.01
+
+# Filters are sized for this many times the current user count, so new
+# registrations do not push the false-positive rate up quickly
+FILTER_HEADROOM = 2
+FILTER_MIN_CAPACITY = 10000
+
+# Users read per query while loading
+FILTER_LOAD_BATCH_SIZE = 10000
+
+# Columns the availability filter covers
+FILTER_FIELDS = ('username', 'nid')
+
+_filter = None
+_filter_lock = threading.Lock()
+
+
+def membership_key(value):
+    """Key a value the way the unique indexes compare it (case- and accent-insensitive)"""
+    return normalize_name(value)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    ``in`` never misses a value that was added; it wrongly reports a value
+    that was not added with probability close to ``error_rate`` once
+    ``capacity`` values are in.
+    """
+
+    def __init__(self, capacity, error_rate=FILTER_ERROR_RATE):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, value):
+        """Bit positions for a value, by double hashing one 128-bit digest"""
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        for position in self.positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(value))
+
+
+class AvailabilityFilter:
+    """In-memory username/NID filter for live sign-up feedback.
+
+    Values the filter has never seen are reported free without touching the
+    database. Possible matches fall through to the existing availability
+    queries, so a Bloom false positive costs one lookup and never a wrong
+    answer. Until ``load`` has run every check goes to the database. Users
+    registered by other processes are not in this process's filter, so the
+    unique indexes stay the authority at INSERT time.
+    """
+
+    def __init__(self, db, error_rate=FILTER_ERROR_RATE):
+        self.db = db
+        self.error_rate = error_rate
+        self.filters = None
+        self._lock = threading.Lock()
+        self._stats = {
+            'checks': 0,
+            'filter_negatives': 0,
+            'database_checks': 0,
+            'false_positives': 0
+        }
+
+    @property
+    def loaded(self):
+        return self.filters is not None
+
+    def load(self):
+        """Build the filters from every username and NID in the users table"""
+        try:
+            with self.db.pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute('SELECT COUNT(*) FROM users')
+                capacity = max(cursor.fetchone()[0] * FILTER_HEADROOM, FILTER_MIN_CAPACITY)
+                filters = {field: BloomFilter(capacity, self.error_rate) for field in FILTER_FIELDS}
+
+                last_id = 0
+                while True:
+                    cursor.execute(
+                        f"SELECT id, {', '.join(FILTER_FIELDS)} FROM users WHERE id > %s ORDER BY id LIMIT %s",
+                        (last_id, FILTER_LOAD_BATCH_SIZE)
+                    )
+                    rows = cursor.fetchall()
+                    if not rows:
+                        break
+                    for row in rows:
+                        for field, value in zip(FILTER_FIELDS, row[1:]):
+                            filters[field].add(membership_key(value))
+                    last_id = rows[-1][0]
+                cursor.close()
+
+            with self._lock:
+                self.filters = filters
+            return True, filters[FILTER_FIELDS[0]].count
+
+        except Error as e:
+            return False, f"Database error: {str(e)}"
+
+    def add_user(self, user_data):
+        """Record a newly registered user's username and NID"""
+        with self._lock:
+            if self.filters is None:
+                return
+            for field in FILTER_FIELDS:
+                if user_data.get(field):
+                    self.filters[field].add(membership_key(user_data[field]))
+
+    def might_exist(self, field, value):
+        """False only when value is certainly not taken"""
+        filters = self.filters
+        with self._lock:
+            self._stats['checks'] += 1
+        if filters is None or membership_key(value) in filters[field]:
+            return True
+        with self._lock:
+            self._stats['filter_negatives'] += 1
+        return False
+
+    def is_available(self, field, value):
+        """Check availability, querying the database only for possible matches"""
+        if not self.might_exist(field, value):
+            return True
+        if field == 'username':
+            available = self.db.check_username_availability(value)
+        else:
+            available = self.db.check_nid_availability(value)
+        with self._lock:
+            self._stats['database_checks'] += 1
+            if available and self.filters is not None:
+                self._stats['false_positives'] += 1
+        return available
+
+    def stats(self):
+        """Get check counts and filter sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['loaded'] = self.loaded
+        if self.filters is not None:
+            for field, bloom in self.filters.items():
+                stats[f'{field}_entries'] = bloom.count
+            stats['capacity'] = self.filters[FILTER_FIELDS[0]].capacity
+            stats['memory_bytes'] = sum(len(bloom.bits) for bloom in self.filters.values())
+        return stats
+
+
+def get_availability_filter(db):
+    """Get the process-wide availability filter, creating it (unloaded) on first use"""
+    global _filter
+    with _filter_lock:
+        if _filter is None:
+            _filter = AvailabilityFilter(db)
+        return _filter
@@ -0,0 +1,173 @@
+import base64
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Default cost settings; raise them as hardware gets faster
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = 600000
+
+# Hashing threads; bounds the CPU (and scrypt memory) spent on logins at once
+HASHING_WORKERS = 2
+
+SALT_BYTES = 16
+
+_hasher = None
+_hasher_lock = threading.Lock()
+
+
+def b64encode(data):
+    """Unpadded base64 text"""
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+
+def b64decode(text):
+    """Decode unpadded base64 text"""
+    return base64.b64decode(text + '=' * (-len(text) % 4))
+
+
+class ScryptHasher:
+    """scrypt KDF, encoded as scrypt$n$r$p$salt$hash"""
+
+    algorithm = 'scrypt'
+
+    def __init__(self, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=32):
+        self.n = n
+        self.r = r
+        self.p = p
+        self.dklen = dklen
+
+    def derive(self, password, salt, n, r, p, dklen):
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                              maxmem=128 * n * r * p + 1024 * 1024, dklen=dklen)
+
+    def hash(self, password):
+        salt = os.urandom(SALT_BYTES)
+        key = self.derive(password, salt, self.n, self.r, self.p, self.dklen)
+        return f"{self.algorithm}${self.n}${self.r}${self.p}${b64encode(salt)}${b64encode(key)}"
+
+    def verify(self, password, encoded):
+        algorithm, n, r, p, salt, key = encoded.split('$')
+        key = b64decode(key)
+        derived = self.derive(password, b64decode(salt), int(n), int(r), int(p), len(key))
+        return hmac.compare_digest(derived, key)
+
+    def needs_rehash(self, encoded):
+        parts = encoded.split('$')
+        if parts[0] != self.algorithm:
+            return True
+        return tuple(int(part) for part in parts[1:4]) != (self.n, self.r, self.p)
+
+
+class Pbkdf2Hasher:
+    """PBKDF2-HMAC-SHA256, encoded as pbkdf2_sha256$iterations$salt$hash"""
+
+    algorithm = 'pbkdf2_sha256'
+
+    def __init__(self, iterations=PBKDF2_ITERATIONS, dklen=32):
+        self.iterations = iterations
+        self.dklen = dklen
+
+    def hash(self, password):
+        salt = os.urandom(SALT_BYTES)
+        key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, self.iterations, self.dklen)
+        return f"{self.algorithm}${self.iterations}${b64encode(salt)}${b64encode(key)}"
+
+    def verify(self, password, encoded):
+        algorithm, iterations, salt, key = encoded.split('$')
+        key = b64decode(key)
+        derived = hashlib.pbkdf2_hmac('sha256', password.encode(), b64decode(salt), int(iterations), len(key))
+        return hmac.compare_digest(derived, key)
+
+    def needs_rehash(self, encoded):
+        parts = encoded.split('$')
+        if parts[0] != self.algorithm:
+            return True
+        return int(parts[1]) != self.iterations
+
+
+class LegacySha256Hasher:
+    """Unsalted SHA-256 hex digests from before salted hashing; verify only"""
+
+    algorithm = 'sha256'
+
+    def verify(self, password, encoded):
+        return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), encoded)
+
+
+HASHERS = {
+    ScryptHasher.algorithm: ScryptHasher,
+    Pbkdf2Hasher.algorithm: Pbkdf2Hasher
+}
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords on a bounded worker pool.
+
+    New hashes use ``hasher``. Stored hashes made by any known algorithm, or by
+    the legacy unsalted SHA-256 scheme, still verify. ``verify`` also reports
+    whether the stored hash should be replaced with one at the current
+    settings. hashlib releases the GIL while it runs the KDF, so the workers
+    hash in parallel without blocking the calling thread's interpreter.
+    """
+
+    def __init__(self, hasher=None, workers=HASHING_WORKERS):
+        self.hasher = hasher or ScryptHasher()
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hasher')
+        self.verifiers = {algorithm: hasher_class() for algorithm, hasher_class in HASHERS.items()}
+        self.verifiers[self.hasher.algorithm] = self.hasher
+        self.legacy = LegacySha256Hasher()
+
+    def hash(self, password):
+        """Hash a password with the current algorithm and cost"""
+        return self.executor.submit(self.hasher.hash, password).result()
+
+    def hash_many(self, passwords):
+        """Hash several passwords, in parallel across the workers"""
+        return list(self.executor.map(self.hasher.hash, passwords))
+
+    def verify(self, password, encoded):
+        """Check a password against a stored hash, returning (valid, needs_rehash)"""
+        return self.executor.submit(self._verify, password, encoded).result()
+
+    def _verify(self, password, encoded):
+        if not encoded:
+            return False, False
+        if '$' not in encoded:
+            return self.legacy.verify(password, encoded), True
+        verifier = self.verifiers.get(encoded.split('$', 1)[0])
+        if verifier is None:
+            return False, False
+        try:
+            valid = verifier.verify(password, encoded)
+        except ValueError:
+            return False, False
+        return valid, valid and self.hasher.needs_rehash(encoded)
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        self.executor.shutdown(wait=False)
+
+
+def get_password_hasher():
+    """Get the process-wide password hasher, creating it on first use"""
+    global _hasher
+    with _hasher_lock:
+        if _hasher is None:
+            _hasher = PasswordHasher()
+        return _hasher
+
+
+def configure_password_hashing(algorithm='scrypt', workers=HASHING_WORKERS, **cost):
+    """Replace the process-wide hasher, e.g. configure_password_hashing('pbkdf2_sha256', iterations=300000)"""
+    global _hasher
+    with _hasher_lock:
+        if _hasher is not None:
+            _hasher.shutdown()
+        _hasher = PasswordHasher(HASHERS[algorithm](**cost), workers)
+        return _hasher
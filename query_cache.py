@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class QueryCache:
+    """Thread-safe LRU cache of query results with per-entry expiry.
+
+    Keys are tuples whose first element is the method name, so a write can
+    drop either one exact key or every cached call of a method. Any
+    invalidation bumps ``version``; a result fetched before the bump is not
+    stored, so a read racing a write cannot put stale data back in the cache.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.version = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+
+    def get(self, key):
+        """Look a key up, returning (hit, value)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return True, value
+                del self._entries[key]
+                self._stats['expired'] += 1
+            self._stats['misses'] += 1
+            return False, None
+
+    def set(self, key, value, ttl, version=None):
+        """Store a value for ttl seconds unless the cache was invalidated since version"""
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, *keys):
+        """Drop exact tuple keys, or every key of a method when given its name"""
+        with self._lock:
+            self.version += 1
+            for key in keys:
+                if isinstance(key, tuple):
+                    removed = [key] if key in self._entries else []
+                else:
+                    removed = [cached for cached in self._entries if cached[0] == key]
+                for cached in removed:
+                    del self._entries[cached]
+                self._stats['invalidations'] += len(removed)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def stats(self):
+        """Get hit/miss statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['max_entries'] = self.max_entries
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,432 @@
+import functools
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from decimal import Decimal
+from logging.handlers import RotatingFileHandler
+
+from mysql.connector import Error
+
+# Statements slower than this (execute plus fetch) are written to the slow-query log, once it is
+# turned on with configure_query_metrics(slow_log_enabled=True) or the benchmark's --slow-query-log
+SLOW_QUERY_LOG_ENABLED = False
+SLOW_QUERY_THRESHOLD_MS = 200
+
+SLOW_QUERY_LOG_PATH = 'slow_queries.log'
+SLOW_QUERY_LOG_MAX_BYTES = 5 * 1024 * 1024
+SLOW_QUERY_LOG_BACKUPS = 5
+
+# Upper bounds of the latency histogram buckets; slower calls land in an overflow bucket
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Rows per fetch whose size is measured to estimate bytes fetched
+BYTES_SAMPLE_ROWS = 20
+
+# Longest parameter value written to the slow-query log
+MAX_LOGGED_PARAM_LENGTH = 200
+
+# Statements MySQL can EXPLAIN
+EXPLAINABLE_VERBS = ('SELECT', 'WITH', 'INSERT', 'REPLACE', 'UPDATE', 'DELETE')
+
+# Name statements run outside any instrumented method are recorded under
+DIRECT_POOL_USE = '(direct pool use)'
+
+# Stored password hashes (scrypt$..., pbkdf2_sha256$..., legacy hex SHA-256) never reach the log
+PASSWORD_HASH_PATTERN = re.compile(r'^(?:\w+\$\S+\$\S+|[0-9a-f]{64})$')
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def value_size(value):
+    """Approximate wire size of one column value in bytes"""
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, (Decimal, set)):
+        return len(str(value))
+    return 8
+
+
+def estimate_bytes(rows):
+    """Estimate the bytes in a batch of fetched rows from a sample of them"""
+    if not rows:
+        return 0
+    sample = rows[:BYTES_SAMPLE_ROWS]
+    sampled = sum(value_size(value) for row in sample
+                  for value in (row.values() if isinstance(row, dict) else row))
+    return sampled * len(rows) // len(sample)
+
+
+def loggable_params(params):
+    """Parameters as written to the slow-query log: hashes redacted, long values cut short"""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {key: loggable_params((value,))[0] for key, value in params.items()}
+    logged = []
+    for value in params:
+        if isinstance(value, str):
+            if PASSWORD_HASH_PATTERN.match(value):
+                value = '<redacted>'
+            elif len(value) > MAX_LOGGED_PARAM_LENGTH:
+                value = value[:MAX_LOGGED_PARAM_LENGTH] + '...'
+        logged.append(value)
+    return logged
+
+
+def new_method_stats():
+    return {
+        'calls': 0,
+        'errors': 0,
+        'statements': 0,
+        'slow_statements': 0,
+        'rows': 0,
+        'bytes': 0,
+        'total_ms': 0.0,
+        'max_ms': 0.0,
+        'histogram': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+        'last_error': None
+    }
+
+
+def histogram_percentile(histogram, total, fraction):
+    """Upper bound of the bucket holding the given fraction of calls"""
+    threshold = total * fraction
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS_MS, histogram):
+        seen += count
+        if seen >= threshold:
+            return bound
+    return float('inf')
+
+
+class QueryMetrics:
+    """Per-method call counts, latency histograms, rows, bytes and errors.
+
+    ``call`` brackets one DatabaseManager method; statements run on an
+    instrumented cursor while it is open are charged to that method. Calls
+    made from inside another instrumented call are counted as part of the
+    outer one, and time spent in ``untimed`` sections (password hashing) is
+    left out of its latency. Statements slower than ``slow_threshold_ms`` are logged with
+    their parameters and EXPLAIN output to a rotating file.
+    """
+
+    def __init__(self, slow_threshold_ms=SLOW_QUERY_THRESHOLD_MS, log_path=SLOW_QUERY_LOG_PATH,
+                 max_bytes=SLOW_QUERY_LOG_MAX_BYTES, backups=SLOW_QUERY_LOG_BACKUPS,
+                 slow_log_enabled=SLOW_QUERY_LOG_ENABLED):
+        self.slow_log_enabled = slow_log_enabled
+        self.slow_threshold_ms = slow_threshold_ms
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._methods = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._logger = None
+
+    @contextmanager
+    def call(self, method):
+        """Record one call of method, unless already inside an instrumented call"""
+        if getattr(self._local, 'frame', None) is not None:
+            yield
+            return
+        frame = self._local.frame = new_method_stats()
+        self._local.method = method
+        self._local.untimed_ms = 0.0
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            frame['errors'] += 1
+            frame['last_error'] = str(e)
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000 - self._local.untimed_ms
+            self._local.frame = self._local.method = None
+            self._record(method, frame, max(elapsed_ms, 0.0))
+
+    @contextmanager
+    def untimed(self):
+        """Leave the time spent inside this block out of the current call's latency"""
+        if getattr(self._local, 'frame', None) is None:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._local.untimed_ms += (time.perf_counter() - started) * 1000
+
+    def record_statement(self, connection, sql, params, elapsed_ms, rows, fetched_bytes, error=None):
+        """Charge one finished statement to the current call and log it if slow"""
+        frame = getattr(self._local, 'frame', None)
+        standalone = frame is None
+        if standalone:
+            frame = new_method_stats()
+        frame['statements'] += 1
+        frame['rows'] += rows
+        frame['bytes'] += fetched_bytes
+        if error is not None:
+            frame['errors'] += 1
+            frame['last_error'] = str(error)
+        if self.slow_log_enabled and elapsed_ms >= self.slow_threshold_ms:
+            frame['slow_statements'] += 1
+            self.log_slow(connection, sql, params, elapsed_ms, rows)
+        if standalone:
+            self._record(DIRECT_POOL_USE, frame, elapsed_ms)
+
+    def _record(self, method, frame, elapsed_ms):
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = new_method_stats()
+            stats['calls'] += 1
+            stats['errors'] += min(frame['errors'], 1)
+            for key in ('statements', 'slow_statements', 'rows', 'bytes'):
+                stats[key] += frame[key]
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['histogram'][bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+            if frame['last_error'] is not None:
+                stats['last_error'] = frame['last_error']
+
+    def explain(self, connection, sql, params):
+        """EXPLAIN a statement on the connection that ran it"""
+        verb = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ''
+        if verb not in EXPLAINABLE_VERBS:
+            return "not explainable"
+        if connection.unread_result:
+            return "skipped: unread result on connection"
+        try:
+            cursor = connection.cursor(dictionary=True, buffered=True)
+            cursor.execute('EXPLAIN ' + sql, params)
+            plan = cursor.fetchall()
+            cursor.close()
+        except Error as e:
+            return f"failed: {e}"
+        return '\n'.join(
+            '    ' + ', '.join(f"{key}={value}" for key, value in row.items() if value is not None)
+            for row in plan
+        )
+
+    def log_slow(self, connection, sql, params, elapsed_ms, rows):
+        """Write a slow statement to the rotating slow-query log"""
+        method = getattr(self._local, 'method', None) or DIRECT_POOL_USE
+        self.slow_logger().warning(
+            "%.1f ms, %d rows, %s\n  SQL: %s\n  params: %r\n  EXPLAIN:\n%s",
+            elapsed_ms, rows, method, ' '.join(sql.split()), loggable_params(params),
+            self.explain(connection, sql, params)
+        )
+
+    def slow_logger(self):
+        """Get the slow-query logger, opening its file on first use"""
+        with self._lock:
+            if self._logger is None:
+                logger = logging.getLogger(f'{__name__}.slow.{id(self)}')
+                logger.setLevel(logging.WARNING)
+                logger.propagate = False
+                handler = RotatingFileHandler(self.log_path, maxBytes=self.max_bytes,
+                                              backupCount=self.backups, encoding='utf-8')
+                handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+                logger.addHandler(handler)
+                self._logger = logger
+            return self._logger
+
+    def close_log(self):
+        """Close the slow-query log file (reopened on the next slow statement)"""
+        with self._lock:
+            logger, self._logger = self._logger, None
+        if logger is not None:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+
+    def reset(self):
+        """Drop every recorded counter"""
+        with self._lock:
+            self._methods.clear()
+
+    def snapshot(self):
+        """Get per-method metrics, busiest methods (by total time) first"""
+        with self._lock:
+            methods = {method: dict(stats, histogram=list(stats['histogram']))
+                       for method, stats in self._methods.items()}
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        report = {}
+        for method, stats in sorted(methods.items(), key=lambda item: -item[1]['total_ms']):
+            calls = stats['calls']
+            stats['avg_ms'] = stats['total_ms'] / calls if calls else 0.0
+            for name, fraction in (('p50_ms', 0.50), ('p95_ms', 0.95), ('p99_ms', 0.99)):
+                stats[name] = histogram_percentile(stats['histogram'], calls, fraction)
+            stats['histogram'] = {label: count for label, count in zip(labels, stats['histogram']) if count}
+            report[method] = stats
+        return report
+
+
+class InstrumentedCursor:
+    """Cursor wrapper that times each statement from execute to its last fetch"""
+
+    def __init__(self, cursor, connection, metrics):
+        self._cursor = cursor
+        self._connection = connection
+        self._metrics = metrics
+        self._statement = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _run(self, execute, operation, params):
+        self._finish()
+        started = time.perf_counter()
+        try:
+            result = execute()
+        except Error as e:
+            self._metrics.record_statement(self._connection, operation, params,
+                                           (time.perf_counter() - started) * 1000, 0, 0, e)
+            raise
+        self._statement = [operation, params, (time.perf_counter() - started) * 1000, 0, 0]
+        if self._cursor.description is None:
+            self._finish()
+        return result
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        return self._run(lambda: self._cursor.execute(operation, params, *args, **kwargs), operation, params)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        seq_params = list(seq_params)
+        return self._run(lambda: self._cursor.executemany(operation, seq_params, *args, **kwargs),
+                         operation, seq_params[0] if seq_params else None)
+
+    def _fetched(self, fetch, *args):
+        started = time.perf_counter()
+        result = fetch(*args)
+        if self._statement is not None:
+            rows = result if isinstance(result, list) else [] if result is None else [result]
+            self._statement[2] += (time.perf_counter() - started) * 1000
+            self._statement[3] += len(rows)
+            self._statement[4] += estimate_bytes(rows)
+        return result
+
+    def fetchone(self):
+        row = self._fetched(self._cursor.fetchone)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size=1):
+        rows = self._fetched(self._cursor.fetchmany, size)
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._fetched(self._cursor.fetchall)
+        self._finish()
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def _finish(self):
+        statement, self._statement = self._statement, None
+        if statement is not None:
+            self._metrics.record_statement(self._connection, *statement)
+
+    def close(self):
+        self._finish()
+        return self._cursor.close()
+
+
+class InstrumentedConnection:
+    """Connection wrapper whose cursors are instrumented"""
+
+    def __init__(self, connection, metrics):
+        self.wrapped_connection = connection
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped_connection, name)
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self.wrapped_connection.cursor(*args, **kwargs), self.wrapped_connection,
+                                  self._metrics)
+
+
+class InstrumentedPool:
+    """Connection pool wrapper handing out instrumented connections"""
+
+    def __init__(self, pool, metrics):
+        self.pool = pool
+        self.metrics = metrics
+
+    def __getattr__(self, name):
+        return getattr(self.pool, name)
+
+    @contextmanager
+    def connection(self):
+        with self.pool.connection() as connection:
+            yield InstrumentedConnection(connection, self.metrics)
+
+
+def instrument_methods(cls, exclude=()):
+    """Record every public method of cls (except exclude) in the process-wide metrics"""
+    for name, method in list(vars(cls).items()):
+        if name.startswith('_') or name in exclude or not callable(method):
+            continue
+        setattr(cls, name, timed(name)(method))
+    return cls
+
+
+def timed(name):
+    """Decorator recording each call of a method under name"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with get_query_metrics().call(name):
+                return method(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def untimed(method):
+    """Decorator leaving a method's own time out of the instrumented call it runs in"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with get_query_metrics().untimed():
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def get_query_metrics():
+    """Get the process-wide query metrics, creating them on first use"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = QueryMetrics()
+        return _metrics
+
+
+def configure_query_metrics(slow_threshold_ms=None, slow_log_enabled=None, log_path=None, max_bytes=None,
+                            backups=None):
+    """Change the slow-query threshold, turn the slow-query log on or off, or move/resize its file"""
+    metrics = get_query_metrics()
+    if slow_threshold_ms is not None:
+        metrics.slow_threshold_ms = slow_threshold_ms
+    if slow_log_enabled is not None:
+        metrics.slow_log_enabled = slow_log_enabled
+    if log_path is not None or max_bytes is not None or backups is not None:
+        metrics.close_log()
+        if log_path is not None:
+            metrics.log_path = log_path
+        if max_bytes is not None:
+            metrics.max_bytes = max_bytes
+        if backups is not None:
+            metrics.backups = backups
+    return metrics
@@ -0,0 +1,425 @@
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from mysql.connector import errorcode, errors
+
+# Seconds a connection waits for another connection's write lock
+SQLITE_BUSY_TIMEOUT = 10
+
+# Distinct SQL strings whose translation is kept
+TRANSLATION_CACHE_SIZE = 512
+
+# Columns returned for EXPLAIN, mirroring MySQL's EXPLAIN output
+EXPLAIN_COLUMNS = ('id', 'select_type', 'table', 'type', 'key', 'rows', 'Extra')
+
+INTERVAL_UNITS = {'SECOND': 'seconds', 'MINUTE': 'minutes', 'HOUR': 'hours',
+                  'DAY': 'days', 'MONTH': 'months', 'YEAR': 'years'}
+
+WRITE_VERBS = ('INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'CREATE', 'DROP', 'ALTER')
+
+LOCAL_NOW = "datetime('now', 'localtime')"
+
+
+def parse_timestamp(value):
+    text = value.decode()
+    return datetime.fromisoformat(text) if ' ' in text or 'T' in text else datetime.fromisoformat(text + ' 00:00:00')
+
+
+def parse_date(value):
+    return date.fromisoformat(value.decode()[:10])
+
+
+# Return the Python types mysql.connector returns, and store values the way MySQL prints them
+sqlite3.register_converter('TIMESTAMP', parse_timestamp)
+sqlite3.register_converter('DATETIME', parse_timestamp)
+sqlite3.register_converter('DATE', parse_date)
+sqlite3.register_converter('DECIMAL', lambda value: Decimal(value.decode()))
+sqlite3.register_adapter(datetime, lambda value: value.strftime('%Y-%m-%d %H:%M:%S'))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(Decimal, str)
+
+
+def fulltext_match(query, *columns):
+    """Score text columns against a MySQL boolean-mode query; 0 means no match.
+
+    Supports the operators search_reports generates: +required, -excluded and
+    trailing-* prefix terms. The score is the number of matching words.
+    """
+    if not query:
+        return 0
+    words = re.findall(r'\w+', ' '.join(column for column in columns if column).lower())
+    score = 0
+    for term in query.lower().split():
+        required, excluded = term.startswith('+'), term.startswith('-')
+        term = term.lstrip('+-')
+        prefix = term.endswith('*')
+        term = term.rstrip('*')
+        if not term:
+            continue
+        hits = sum(1 for word in words if (word.startswith(term) if prefix else word == term))
+        if excluded and hits:
+            return 0
+        if required and not hits:
+            return 0
+        if not excluded:
+            score += hits
+    return score
+
+
+def translate_interval(match):
+    """DATE_ADD/DATE_SUB(expr, INTERVAL n UNIT) -> datetime(expr, '+n units')"""
+    function, expression, amount, unit = match.groups()
+    sign = '-' if function.upper() == 'SUB' else '+'
+    return f"datetime({expression}, '{sign}{amount} {INTERVAL_UNITS[unit.upper()]}')"
+
+
+def translate_ddl(sql):
+    """Rewrite MySQL column definitions for SQLite"""
+    sql = re.sub(r'\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b', 'INTEGER PRIMARY KEY AUTOINCREMENT', sql)
+    # MySQL's default collations compare text case-insensitively
+    sql = re.sub(r'\b(VARCHAR\(\d+\)|TEXT\b)', r'\1 COLLATE NOCASE', sql)
+    sql = re.sub(r'(\w+)\s+ENUM\(([^)]*)\)', r'\1 TEXT COLLATE NOCASE CHECK (\1 IN (\2))', sql)
+    sql = re.sub(r'\bJSON\b', 'TEXT', sql)
+    sql = re.sub(r'\bDEFAULT\s+CURRENT_TIMESTAMP\b', f"DEFAULT ({LOCAL_NOW})", sql)
+    sql = re.sub(r'\s+AFTER\s+\w+', '', sql)
+    # Inline secondary keys are not allowed in CREATE TABLE
+    sql = re.sub(r',\s*UNIQUE\s+KEY\s+\w*\s*(\([^)]*\))', r', UNIQUE \1', sql)
+    sql = re.sub(r',\s*(?:KEY|INDEX)\s*\w*\s*\([^)]*\)', '', sql)
+    return sql
+
+
+@lru_cache(maxsize=TRANSLATION_CACHE_SIZE)
+def translate_sql(sql):
+    """Translate one MySQL statement to SQLite, or None when it has no SQLite equivalent"""
+    statement = sql.strip()
+    if re.match(r'CREATE\s+FULLTEXT\s+INDEX\b', statement, re.I):
+        # fulltext_match scans instead of using an index
+        return None
+    if re.match(r'(CREATE|ALTER)\s+(TEMPORARY\s+)?TABLE\b', statement, re.I):
+        statement = translate_ddl(statement)
+    statement = re.sub(r'^DROP\s+TEMPORARY\s+TABLE\b', 'DROP TABLE', statement, flags=re.I)
+    statement = re.sub(r'^(DROP\s+INDEX\s+\w+)\s+ON\s+\w+', r'\1', statement, flags=re.I)
+
+    statement = re.sub(r'\b(GET_LOCK|RELEASE_LOCK)\([^)]*\)', '1', statement, flags=re.I)
+    statement = re.sub(r'\bNOW\(\)', LOCAL_NOW, statement, flags=re.I)
+    statement = re.sub(r'\bDATE_(ADD|SUB)\((.+?),\s*INTERVAL\s+(\d+)\s+(\w+)\)', translate_interval,
+                       statement, flags=re.I)
+    statement = re.sub(r'\bMATCH\s*\(([^)]*)\)\s*AGAINST\s*\(\s*%s\s+IN\s+BOOLEAN\s+MODE\s*\)',
+                       r'fulltext_match(%s, \1)', statement, flags=re.I)
+    statement = re.sub(r'\s+FOR\s+UPDATE\b', '', statement, flags=re.I)
+    upsert = re.search(r'\bON\s+DUPLICATE\s+KEY\s+UPDATE\b', statement, re.I)
+    if upsert:
+        assignments = re.sub(r'\bVALUES\((\w+)\)', r'excluded.\1', statement[upsert.end():], flags=re.I)
+        statement = statement[:upsert.start()] + 'ON CONFLICT DO UPDATE SET' + assignments
+
+    # SQLite does not allow parenthesized SELECTs as UNION members
+    statement = re.sub(r'^\(\s*SELECT\b', 'SELECT * FROM (SELECT', statement, flags=re.I)
+    statement = re.sub(r'\bUNION(\s+ALL)?\s+\(\s*SELECT\b', r'UNION\1 SELECT * FROM (SELECT', statement, flags=re.I)
+
+    # MySQL LIKE escapes with backslash by default
+    statement = re.sub(r'\bLIKE\s+%s', r"LIKE %s ESCAPE '\\'", statement, flags=re.I)
+    return statement.replace('%s', '?').replace('%%', '%')
+
+
+def explain_row(row_id, detail):
+    """Describe one EXPLAIN QUERY PLAN step in MySQL EXPLAIN terms (None if it reads no table)"""
+    match = re.match(r'(SCAN|SEARCH) (\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX (\w+)| USING INTEGER PRIMARY KEY)?', detail)
+    if not match or match.group(2) == 'CONSTANT':
+        return None
+    operation, table, index = match.groups()
+    if 'PRIMARY KEY' in detail:
+        access, key = 'const', 'PRIMARY'
+    elif operation == 'SEARCH':
+        access, key = ('range' if re.search(r'[<>]', detail) else 'ref'), index
+    else:
+        access, key = ('index' if index else 'ALL'), index
+    return (row_id, 'SIMPLE', table, access, key, None, detail)
+
+
+def translate_error(error, connection, sql):
+    """Convert a sqlite3 error into the mysql.connector error MySQL would have raised"""
+    message = str(error)
+    name = getattr(error, 'sqlite_errorname', '')
+    verb = sql.lstrip().split(None, 1)[0].upper() if sql and sql.strip() else ''
+
+    if name in ('SQLITE_CONSTRAINT_UNIQUE', 'SQLITE_CONSTRAINT_PRIMARYKEY'):
+        table, key = duplicate_key_name(connection, message)
+        return errors.IntegrityError(msg=f"Duplicate entry for key '{table}.{key}'",
+                                     errno=errorcode.ER_DUP_ENTRY, sqlstate='23000')
+    if name == 'SQLITE_CONSTRAINT_NOTNULL':
+        column = message.rsplit('.', 1)[-1]
+        return errors.IntegrityError(msg=f"Column '{column}' cannot be null",
+                                     errno=errorcode.ER_BAD_NULL_ERROR, sqlstate='23000')
+    if name == 'SQLITE_CONSTRAINT_FOREIGNKEY':
+        errno = errorcode.ER_ROW_IS_REFERENCED_2 if verb == 'DELETE' else errorcode.ER_NO_REFERENCED_ROW_2
+        return errors.IntegrityError(msg=f"Foreign key constraint fails ({message})", errno=errno, sqlstate='23000')
+    if name == 'SQLITE_CONSTRAINT_CHECK':
+        # A value outside an ENUM's list
+        return errors.DataError(msg=f"Data truncated ({message})", errno=errorcode.WARN_DATA_TRUNCATED,
+                                sqlstate='01000')
+    if name.startswith('SQLITE_BUSY') or name.startswith('SQLITE_LOCKED'):
+        return errors.DatabaseError(msg=f"Lock wait timeout exceeded ({message})",
+                                    errno=errorcode.ER_LOCK_WAIT_TIMEOUT, sqlstate='HY000')
+
+    patterns = [
+        (r'no such table', errors.ProgrammingError, errorcode.ER_NO_SUCH_TABLE, '42S02'),
+        (r'index .* already exists', errors.ProgrammingError, errorcode.ER_DUP_KEYNAME, '42000'),
+        (r'duplicate column name', errors.ProgrammingError, errorcode.ER_DUP_FIELDNAME, '42S21'),
+        (r'no such index', errors.ProgrammingError, errorcode.ER_CANT_DROP_FIELD_OR_KEY, '42000'),
+        (r'no such column', errors.ProgrammingError, errorcode.ER_BAD_FIELD_ERROR, '42S22'),
+        (r'syntax error|incomplete input', errors.ProgrammingError, errorcode.ER_PARSE_ERROR, '42000'),
+    ]
+    for pattern, error_class, errno, sqlstate in patterns:
+        if re.search(pattern, message):
+            return error_class(msg=message, errno=errno, sqlstate=sqlstate)
+    if isinstance(error, sqlite3.InterfaceError):
+        return errors.InterfaceError(msg=message)
+    if isinstance(error, sqlite3.IntegrityError):
+        return errors.IntegrityError(msg=message)
+    if isinstance(error, sqlite3.OperationalError):
+        return errors.OperationalError(msg=message)
+    return errors.DatabaseError(msg=message)
+
+
+def duplicate_key_name(connection, message):
+    """Name the violated unique key the way MySQL does: PRIMARY, the column for inline UNIQUE, else the index"""
+    match = re.search(r'failed: (.*)$', message)
+    if not match:
+        return '', ''
+    qualified = [column.strip() for column in match.group(1).split(',')]
+    table = qualified[0].split('.')[0]
+    columns = [column.split('.', 1)[-1] for column in qualified]
+    try:
+        for seq, name, unique, origin, partial in connection.execute(f"PRAGMA index_list('{table}')"):
+            indexed = [row[2] for row in connection.execute(f"PRAGMA index_info('{name}')")]
+            if unique and indexed == columns:
+                if origin == 'pk':
+                    return table, 'PRIMARY'
+                return table, columns[0] if origin == 'u' else name
+    except sqlite3.Error:
+        pass
+    return table, 'PRIMARY' if 'PRIMARY' in message else columns[0]
+
+
+class SQLiteCursor:
+    """mysql.connector-style cursor over a sqlite3 cursor.
+
+    Statements are translated from MySQL with ``translate_sql``; rows come
+    back as tuples, or dicts for ``dictionary=True``; sqlite3 errors are
+    raised as the matching mysql.connector errors.
+    """
+
+    def __init__(self, connection, dictionary=False):
+        self.connection = connection
+        self.dictionary = dictionary
+        self._cursor = connection.raw.cursor()
+        self._rows = None
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+
+    @property
+    def column_names(self):
+        return tuple(column[0] for column in self.description or ())
+
+    def execute(self, operation, params=()):
+        self._rows = None
+        if re.match(r'\s*EXPLAIN\s+(?!QUERY\s+PLAN)', operation, re.I):
+            return self._explain(re.sub(r'^\s*EXPLAIN\s+', '', operation, flags=re.I), params)
+        sql = translate_sql(operation)
+        if sql is None:
+            self.description, self.rowcount = None, 0
+            return
+        self.connection.begin_for(sql)
+        try:
+            self._cursor.execute(sql, tuple(params or ()))
+        except sqlite3.Error as e:
+            raise translate_error(e, self.connection.raw, sql) from e
+        self._after_execute()
+
+    def executemany(self, operation, seq_params):
+        self._rows = None
+        sql = translate_sql(operation)
+        if sql is None:
+            return
+        self.connection.begin_for(sql)
+        try:
+            self._cursor.executemany(sql, [tuple(params) for params in seq_params])
+        except sqlite3.Error as e:
+            raise translate_error(e, self.connection.raw, sql) from e
+        self._after_execute()
+
+    def _after_execute(self):
+        self.description = self._cursor.description
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+
+    def _explain(self, operation, params):
+        sql = translate_sql(operation)
+        self.connection.begin_for(sql)
+        try:
+            plan = self._cursor.execute('EXPLAIN QUERY PLAN ' + sql, tuple(params or ())).fetchall()
+        except sqlite3.Error as e:
+            raise translate_error(e, self.connection.raw, sql) from e
+        steps = [explain_row(row_id, detail) for row_id, parent, unused, detail in plan]
+        self._rows = [step for step in steps if step is not None]
+        self.description = tuple((column, None, None, None, None, None, None) for column in EXPLAIN_COLUMNS)
+        self.rowcount = len(self._rows)
+
+    def _shape(self, row):
+        if row is None or not self.dictionary:
+            return row
+        return dict(zip(self.column_names, row))
+
+    def fetchone(self):
+        if self._rows is not None:
+            return self._shape(self._rows.pop(0)) if self._rows else None
+        return self._shape(self._cursor.fetchone())
+
+    def fetchmany(self, size=1):
+        if self._rows is not None:
+            rows, self._rows = self._rows[:size], self._rows[size:]
+        else:
+            rows = self._cursor.fetchmany(size)
+        return [self._shape(row) for row in rows]
+
+    def fetchall(self):
+        if self._rows is not None:
+            rows, self._rows = self._rows, []
+        else:
+            rows = self._cursor.fetchall()
+        return [self._shape(row) for row in rows]
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """mysql.connector-style connection over a sqlite3 connection.
+
+    Like a MySQL connection with autocommit off, the first statement opens a
+    transaction that lasts until ``commit`` or ``rollback``. Transactions that
+    start with a write, or with SELECT ... FOR UPDATE, take the write lock up
+    front (BEGIN IMMEDIATE) so they wait for other writers instead of failing
+    when they upgrade.
+    """
+
+    def __init__(self, raw, shared=False):
+        self.raw = raw
+        self.shared = shared
+        self.closed = False
+
+    def begin_for(self, sql):
+        """Open a transaction for the statement about to run, if none is open"""
+        if self.raw.in_transaction:
+            return
+        verb = sql.lstrip().split(None, 1)[0].upper()
+        if verb in WRITE_VERBS or re.search(r'\bFOR\s+UPDATE\b', sql, re.I):
+            self.raw.execute('BEGIN IMMEDIATE')
+        elif verb in ('SELECT', 'WITH'):
+            self.raw.execute('BEGIN')
+
+    def cursor(self, dictionary=False, buffered=None, **kwargs):
+        if self.closed:
+            raise errors.OperationalError(msg="Connection is closed")
+        return SQLiteCursor(self, dictionary)
+
+    def start_transaction(self, consistent_snapshot=False, isolation_level=None, readonly=None):
+        if self.raw.in_transaction:
+            raise errors.ProgrammingError(msg="Transaction already in progress")
+        self.raw.execute('BEGIN')
+        # Take the read snapshot now, as START TRANSACTION WITH CONSISTENT SNAPSHOT does
+        if consistent_snapshot:
+            self.raw.execute('SELECT 1 FROM sqlite_master LIMIT 1').fetchall()
+
+    @property
+    def in_transaction(self):
+        return self.raw.in_transaction
+
+    @property
+    def unread_result(self):
+        return False
+
+    def consume_results(self):
+        pass
+
+    def commit(self):
+        try:
+            if self.raw.in_transaction:
+                self.raw.execute('COMMIT')
+        except sqlite3.Error as e:
+            raise translate_error(e, self.raw, 'COMMIT') from e
+
+    def rollback(self):
+        try:
+            if self.raw.in_transaction:
+                self.raw.execute('ROLLBACK')
+        except sqlite3.Error as e:
+            raise translate_error(e, self.raw, 'ROLLBACK') from e
+
+    def is_connected(self):
+        return not self.closed
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        if self.closed:
+            raise errors.InterfaceError(msg="Connection is closed")
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.shared:
+            # The in-memory database lives as long as its one sqlite3 connection
+            try:
+                self.raw.rollback()
+            except sqlite3.Error:
+                pass
+        else:
+            self.raw.close()
+
+
+class SQLiteDatabase:
+    """Connection factory for a SQLite database, used in place of mysql.connector.connect.
+
+    ``':memory:'`` gives a private in-memory database: every connection wraps
+    the same sqlite3 connection, so the pool must hand out one at a time
+    (``max_connections`` is 1). A file path opens one sqlite3 connection per
+    pool slot in WAL mode, so readers do not block the writer.
+    """
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self.in_memory = path == ':memory:'
+        self._shared = None
+        self._lock = threading.Lock()
+
+    def max_connections(self, pool_size):
+        return 1 if self.in_memory else pool_size
+
+    def open_raw(self):
+        raw = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT, isolation_level=None,
+                              detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+        raw.create_function('fulltext_match', -1, fulltext_match, deterministic=True)
+        raw.execute('PRAGMA foreign_keys = ON')
+        if not self.in_memory:
+            raw.execute('PRAGMA journal_mode = WAL')
+            raw.execute('PRAGMA synchronous = NORMAL')
+        return raw
+
+    def connect(self, **config):
+        """Open a connection; config is accepted for mysql.connector.connect compatibility"""
+        try:
+            if not self.in_memory:
+                return SQLiteConnection(self.open_raw())
+            with self._lock:
+                if self._shared is None:
+                    self._shared = self.open_raw()
+            return SQLiteConnection(self._shared, shared=True)
+        except sqlite3.Error as e:
+            raise errors.InterfaceError(msg=f"Can't open SQLite database {self.path}: {e}") from e
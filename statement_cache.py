@@ -0,0 +1,204 @@
+import threading
+from collections import OrderedDict
+
+from mysql.connector import Error, errorcode
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.cursor import MySQLCursorPrepared, MySQLCursorPreparedDict
+
+try:
+    from mysql.connector.connection_cext import CMySQLConnection
+    from mysql.connector.cursor_cext import CMySQLCursorPrepared, CMySQLCursorPreparedDict
+except ImportError:
+    CMySQLConnection = None
+
+# Send hot statements as server-side prepared statements
+PREPARED_STATEMENTS_ENABLED = True
+
+# Prepared statements kept per pooled connection; the server caps the total
+# at max_prepared_stmt_count (16382 by default) across all sessions
+STATEMENT_CACHE_SIZE = 32
+
+# Errors after which a cached statement is thrown away and prepared again
+REPREPARE_ERRORS = (errorcode.ER_UNKNOWN_STMT_HANDLER, errorcode.ER_NEED_REPREPARE)
+
+_stats = {
+    'executions': 0,
+    'hits': 0,
+    'prepares': 0,
+    'evictions': 0,
+    'reprepares': 0
+}
+_stats_lock = threading.Lock()
+
+
+def count(stat, amount=1):
+    with _stats_lock:
+        _stats[stat] += amount
+
+
+class ReexecutingCursor:
+    """Prepared cursor that re-executes its statement without resetting it first.
+
+    mysql.connector sends COM_STMT_RESET, and waits for the reply, before
+    every execute of a prepared statement, so each cached hit would cost two
+    round trips. The reset only discards long data sent for the statement,
+    which these reads never send, so once a cursor holds the statement for
+    the SQL string it is given, it goes straight to COM_STMT_EXECUTE.
+    """
+
+    def execute(self, operation, params=None, multi=False):
+        params = params or ()
+        statement = self._prepared
+        if operation is not self._executed or statement is None or len(params) != len(statement['parameters']):
+            return super().execute(operation, params, multi)
+        self._handle_result(self._connection.cmd_stmt_execute(
+            statement['statement_id'], data=params, parameters=statement['parameters']
+        ))
+
+
+class CReexecutingCursor:
+    """ReexecutingCursor for the C extension's prepared cursors"""
+
+    def execute(self, operation, params=None, multi=False):
+        params = params or ()
+        statement = self._stmt
+        if operation is not self._executed or statement is None or len(params) != statement.param_count:
+            return super().execute(operation, params, multi)
+        self._cnx.handle_unread_result(prepared=True)
+        result = self._cnx.cmd_stmt_execute(statement, *params)
+        if result:
+            self._handle_result(result)
+
+
+class CachedCursor(ReexecutingCursor, MySQLCursorPrepared):
+    pass
+
+
+class CachedDictCursor(ReexecutingCursor, MySQLCursorPreparedDict):
+    pass
+
+
+# Cursor classes for cached statements, by connection class and then by dictionary=
+CACHED_CURSOR_CLASSES = [(MySQLConnection, {False: CachedCursor, True: CachedDictCursor})]
+
+if CMySQLConnection is not None:
+    class CCachedCursor(CReexecutingCursor, CMySQLCursorPrepared):
+        pass
+
+    class CCachedDictCursor(CReexecutingCursor, CMySQLCursorPreparedDict):
+        pass
+
+    CACHED_CURSOR_CLASSES.append((CMySQLConnection, {False: CCachedCursor, True: CCachedDictCursor}))
+
+
+def prepared_cursor(connection, dictionary=False):
+    """Open a prepared cursor, one that re-executes without a reset on mysql.connector"""
+    pooled = wrapped_connection(connection)
+    for connection_class, cursor_classes in CACHED_CURSOR_CLASSES:
+        if isinstance(pooled, connection_class):
+            return connection.cursor(cursor_class=cursor_classes[dictionary])
+    return connection.cursor(prepared=True, dictionary=dictionary)
+
+
+class StatementCache:
+    """LRU of prepared cursors for one pooled connection, keyed by SQL text.
+
+    MySQL keeps prepared statements per session, so the cache is stored on
+    the connection it belongs to and dies with it. mysql.connector only
+    reuses a cursor's statement when it is handed the same string object, so
+    the first string seen for a SQL text is the one every later call passes.
+    When the connection reconnects (its ``connection_id`` changes), the old
+    handles no longer exist on the server: they are dropped without being
+    closed and each statement is prepared again on first use.
+    """
+
+    def __init__(self, connection):
+        self.connection_id = getattr(connection, 'connection_id', None)
+        self._cursors = OrderedDict()
+
+    def lookup(self, connection, sql, dictionary):
+        """Get (sql, cursor) for a statement, preparing it on a miss"""
+        connection_id = getattr(connection, 'connection_id', None)
+        if connection_id != self.connection_id:
+            count('reprepares', len(self._cursors))
+            self._cursors.clear()
+            self.connection_id = connection_id
+
+        key = (sql, dictionary)
+        entry = self._cursors.get(key)
+        if entry is not None:
+            self._cursors.move_to_end(key)
+            count('hits')
+            return entry
+
+        entry = self._cursors[key] = (sql, prepared_cursor(connection, dictionary))
+        count('prepares')
+        while len(self._cursors) > STATEMENT_CACHE_SIZE:
+            evicted = self._cursors.popitem(last=False)[1][1]
+            count('evictions')
+            self.close_cursor(evicted)
+        return entry
+
+    def forget(self, sql, dictionary):
+        """Drop one statement so the next call prepares it again"""
+        entry = self._cursors.pop((sql, dictionary), None)
+        if entry is not None:
+            self.close_cursor(entry[1])
+
+    def close_cursor(self, cursor):
+        try:
+            cursor.close()
+        except Error:
+            pass
+
+
+def wrapped_connection(connection):
+    """The pooled connection behind an instrumented wrapper"""
+    return getattr(connection, 'wrapped_connection', connection)
+
+
+def fetch_prepared(connection, sql, params=(), dictionary=False):
+    """Run a hot read as a cached prepared statement and return all its rows"""
+    if not PREPARED_STATEMENTS_ENABLED:
+        cursor = connection.cursor(dictionary=dictionary)
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows
+
+    pooled = wrapped_connection(connection)
+    cache = getattr(pooled, 'statement_cache', None)
+    if cache is None:
+        cache = pooled.statement_cache = StatementCache(pooled)
+
+    count('executions')
+    for attempt in range(2):
+        cached_sql, cursor = cache.lookup(connection, sql, dictionary)
+        try:
+            cursor.execute(cached_sql, params)
+            return cursor.fetchall()
+        except Error as e:
+            cache.forget(sql, dictionary)
+            if attempt or e.errno not in REPREPARE_ERRORS:
+                raise
+            count('reprepares')
+
+
+def get_statement_cache_stats():
+    """Get prepared statement cache counters"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['enabled'] = PREPARED_STATEMENTS_ENABLED
+    stats['max_statements_per_connection'] = STATEMENT_CACHE_SIZE
+    lookups = stats['hits'] + stats['prepares']
+    stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+    return stats
+
+
+def configure_statement_cache(enabled=None, max_statements=None):
+    """Turn prepared statements on or off, or change the per-connection cache size"""
+    global PREPARED_STATEMENTS_ENABLED, STATEMENT_CACHE_SIZE
+    if enabled is not None:
+        PREPARED_STATEMENTS_ENABLED = enabled
+    if max_statements is not None:
+        STATEMENT_CACHE_SIZE = max_statements
@@ -0,0 +1,89 @@
+import itertools
+
+import pytest
+
+import database_config
+from auth_functions import AuthManager
+from membership_filter import AvailabilityFilter
+from password_hashing import configure_password_hashing
+from query_metrics import configure_query_metrics
+from tests.helpers import PASSWORD
+
+_sequence = itertools.count(1)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def fast_settings():
+    """A cheap KDF and no slow-query log file, for the whole test session"""
+    configure_password_hashing('pbkdf2_sha256', iterations=1000)
+    configure_query_metrics(slow_log_enabled=False)
+
+
+@pytest.fixture
+def auth():
+    """AuthManager on a fresh, fully migrated in-memory SQLite database"""
+    database_config.configure_backend('sqlite', ':memory:')
+    manager = AuthManager()
+    manager.cache.clear()
+    manager.availability = AvailabilityFilter(manager.db)
+    yield manager
+    manager.cache.clear()
+    database_config.configure_backend('sqlite', ':memory:')
+
+
+@pytest.fixture
+def db(auth):
+    return auth.db
+
+
+@pytest.fixture
+def user_data():
+    """Build valid registration data, unique per call unless fields are overridden"""
+    def build(**fields):
+        n = next(_sequence)
+        data = {
+            'full_name': f'Test User {n}',
+            'email': f'user{n}@gmail.com',
+            'phone': '01712345678',
+            'nid': f'{1000000000 + n}',
+            'date_of_birth': '1990-05-17',
+            'address': 'Road 1, Dhaka',
+            'username': f'user{n}',
+            'password': PASSWORD,
+            'role': 'Citizen',
+            'department': None
+        }
+        data.update(fields)
+        return data
+    return build
+
+
+@pytest.fixture
+def register(auth, user_data):
+    """Register a user through AuthManager and return its id"""
+    def register_user(**fields):
+        data = user_data(**fields)
+        success, message = auth.register_user(data)
+        assert success, message
+        success, user = auth.login_user(data['username'], data['password'])
+        assert success, user
+        return user['id']
+    return register_user
+
+
+@pytest.fixture
+def submit(auth):
+    """Submit a report for a user and return its id"""
+    def submit_report(user_id, category='Infrastructure', priority='Medium', title='Broken road'):
+        success, message = auth.submit_citizen_report({
+            'user_id': user_id,
+            'title': title,
+            'description': f'{title} near the market',
+            'category': category,
+            'location': 'Mirpur',
+            'priority': priority
+        })
+        assert success, message
+        return int(message.rsplit('ID: ', 1)[1].rstrip(')'))
+    return submit_report
+
@@ -0,0 +1,22 @@
+PASSWORD = 'Secret#123'
+
+
+def counters(db):
+    """User and report stats counters as read by the dashboards"""
+    users = db.get_user_stats()[1]
+    reports = db.get_report_stats()[1]
+    return {
+        'users': users['total_users'],
+        'users_by_role': {row['role']: row['count'] for row in users['users_by_role']},
+        'users_by_status': {row['status']: row['count'] for row in users['users_by_status']},
+        'reports': reports['total_reports'],
+        'reports_by_status': {row['status']: row['count'] for row in reports['reports_by_status']},
+        'reports_by_category': {row['category']: row['count'] for row in reports['reports_by_category']}
+    }
+
+
+def recounted(db):
+    """Counters after rebuilding stats_counters from the base tables"""
+    success, message = db.reconcile_stats_counters()
+    assert success, message
+    return counters(db)
@@ -0,0 +1,54 @@
+import time
+
+from async_loader import AsyncLoader
+
+
+class FakeRoot:
+    """Records after() callbacks instead of running a Tk event loop"""
+
+    def after(self, delay, callback):
+        return 'job'
+
+    def after_cancel(self, job):
+        pass
+
+
+def deliver(loader, expected):
+    """Poll until expected results are queued, then hand them out like the Tk loop would"""
+    deadline = time.monotonic() + 5
+    while loader.results.qsize() < expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    loader._poll()
+
+
+def test_view_change_drops_loads_but_not_actions():
+    loader = AsyncLoader(FakeRoot())
+    delivered = []
+    try:
+        loader.submit(lambda: 'rows', delivered.append)
+        loader.submit_action(lambda: (True, "Report deleted successfully"), delivered.append)
+        loader.new_view()
+        deliver(loader, 2)
+    finally:
+        loader.shutdown()
+
+    assert delivered == [(True, "Report deleted successfully")]
+    assert loader.dropped == 1
+    assert loader.pending == 0
+
+
+def test_action_errors_are_delivered():
+    loader = AsyncLoader(FakeRoot())
+    delivered = []
+
+    def failing():
+        raise OSError("disk full")
+
+    try:
+        loader.submit_action(failing, delivered.append)
+        loader.new_view()
+        deliver(loader, 1)
+    finally:
+        loader.shutdown()
+
+    assert delivered == [(False, "Error: disk full")]
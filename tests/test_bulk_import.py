@@ -0,0 +1,74 @@
+import csv
+
+import bulk_import
+from bulk_import import import_users
+from password_hashing import get_password_hasher
+from tests.helpers import PASSWORD
+
+FIELDS = ['full_name', 'email', 'phone', 'nid', 'date_of_birth', 'address', 'username', 'password', 'password_hash']
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({field: row.get(field, '') for field in FIELDS})
+    return str(path)
+
+
+def csv_row(n, **fields):
+    row = {
+        'full_name': f'Imported User {n}',
+        'email': f'imported{n}@gmail.com',
+        'phone': '01812345678',
+        'nid': f'{2000000000 + n}',
+        'date_of_birth': '1988-02-01',
+        'address': 'Road 2, Khulna',
+        'username': f'imported{n}',
+        'password': PASSWORD
+    }
+    row.update(fields)
+    return row
+
+
+def test_import_with_plain_and_prehashed_passwords(auth, tmp_path):
+    prehashed = get_password_hasher().hash('Migrated#1')
+    csv_path = write_csv(tmp_path / 'users.csv', [
+        csv_row(1),
+        csv_row(2, password='', password_hash=prehashed),
+        csv_row(3, password='', password_hash='md5$abc'),
+        csv_row(4, username='imported1'),
+    ])
+
+    success, summary = import_users(csv_path, auth=auth)
+    assert success, summary
+    assert (summary['rows'], summary['imported'], summary['rejected']) == (4, 2, 2)
+    assert auth.login_user('imported1', PASSWORD)[0]
+    assert auth.login_user('imported2', 'Migrated#1')[0]
+
+    with open(summary['rejects_path'], newline='', encoding='utf-8') as rejects_file:
+        rejects = list(csv.DictReader(rejects_file))
+    assert [row['reason'] for row in rejects] == [
+        "Unsupported password hash format", "Username already exists (duplicate in file)"
+    ]
+    assert all(row['password'] == '' and row['password_hash'] == '' for row in rejects)
+
+
+def test_hashing_runs_without_holding_a_connection(auth, tmp_path, monkeypatch):
+    hasher = get_password_hasher()
+    pool = auth.db.pool
+
+    class CheckingHasher:
+        def hash_many(self, passwords):
+            # The in-memory pool has a single connection: this times out if the importer holds it
+            connection = pool.acquire(timeout=0.5)
+            pool.release(connection)
+            return hasher.hash_many(passwords)
+
+    monkeypatch.setattr(bulk_import, 'get_password_hasher', CheckingHasher)
+    csv_path = write_csv(tmp_path / 'users.csv', [csv_row(n) for n in range(10, 15)])
+
+    success, summary = import_users(csv_path, batch_size=2, auth=auth)
+    assert success, summary
+    assert summary['imported'] == 5
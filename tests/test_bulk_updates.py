@@ -0,0 +1,102 @@
+from tests.helpers import counters, recounted
+
+
+def report_row(db, report_id):
+    return db.get_report_by_id(report_id)[1]
+
+
+def test_bulk_update_report_status(db, register, submit):
+    citizen = register()
+    officer = register(role='Government Officer', department='Infrastructure')
+    first, second, third = (submit(citizen) for _ in range(3))
+    assert db.update_report_status(first, 'In Progress', officer, 'Crew assigned')[0]
+
+    assert db.bulk_update_report_status([first, second, second], 'Resolved') == (
+        True, "2 report(s) updated successfully"
+    )
+
+    resolved = report_row(db, first)
+    assert resolved['status'] == 'Resolved'
+    assert resolved['resolved_at'] is not None
+    # Bulk updates keep the assigned officer and, without new feedback, the old feedback
+    assert resolved['assigned_to'] == officer
+    assert resolved['feedback'] == 'Crew assigned'
+    assert report_row(db, second)['status'] == 'Resolved'
+    assert report_row(db, third)['status'] == 'Pending'
+
+    assert db.bulk_update_report_status([first, third], 'Rejected', 'Duplicate')[0]
+    assert report_row(db, first)['feedback'] == 'Duplicate'
+    assert report_row(db, third)['feedback'] == 'Duplicate'
+
+    stats = counters(db)
+    assert stats['reports_by_status'] == {'Resolved': 1, 'Rejected': 2}
+    assert stats == recounted(db)
+
+
+def test_reopening_a_resolved_report_clears_resolved_at(db, register, submit):
+    report_id = submit(register())
+    assert db.bulk_update_report_status([report_id], 'Resolved')[0]
+    assert report_row(db, report_id)['resolved_at'] is not None
+
+    assert db.bulk_update_report_status([report_id], 'In Progress', 'Reopened')[0]
+    report = report_row(db, report_id)
+    assert (report['status'], report['resolved_at']) == ('In Progress', None)
+
+
+def test_bulk_update_with_no_ids(db):
+    assert db.bulk_update_report_status([], 'Resolved') == (True, "0 report(s) updated successfully")
+
+
+def test_bulk_assign_and_user_status(db, register, submit):
+    citizen = register()
+    officer = register(role='Government Officer', department='Health')
+    reports = [submit(citizen, 'Health') for _ in range(3)]
+
+    assert db.bulk_assign_reports(reports, officer)[0]
+    assert {report_row(db, report_id)['assigned_to'] for report_id in reports} == {officer}
+
+    users = [register() for _ in range(3)]
+    assert db.bulk_update_user_status(users, 'Inactive')[0]
+    stats = counters(db)
+    assert stats['users_by_status']['Inactive'] == 3
+    assert stats == recounted(db)
+
+
+def test_single_report_status_update_keeps_assignment(db, register, submit):
+    citizen = register()
+    officer = register(role='Government Officer', department='Infrastructure')
+    report_id = submit(citizen)
+    assert db.assign_report_to_officer(report_id, officer)[0]
+    assert db.bulk_update_report_status([report_id], 'In Progress', 'Crew on site')[0]
+
+    # The status dialog sends an empty feedback box as ''
+    assert db.bulk_update_report_status([report_id], 'Resolved', '') == (True, "1 report(s) updated successfully")
+    report = report_row(db, report_id)
+    assert (report['status'], report['assigned_to'], report['feedback']) == ('Resolved', officer, 'Crew on site')
+
+
+def test_bulk_delete_reports(auth, db, register, submit):
+    citizen = register()
+    first, second, kept = (submit(citizen) for _ in range(3))
+    assert auth.get_report_stats()[1]['total_reports'] == 3
+
+    assert auth.bulk_delete_reports([first, second, second]) == (True, "2 report(s) deleted successfully")
+    assert auth.get_report_by_id(first) == (False, "Report not found")
+    assert auth.get_report_by_id(kept)[0]
+    assert auth.get_report_stats()[1]['total_reports'] == 1
+    assert counters(db) == recounted(db)
+
+
+def test_bulk_delete_users_and_role_change(auth, db, register):
+    users = [register() for _ in range(4)]
+
+    assert auth.bulk_update_user_role(users[:2], 'Government Officer') == (True, "2 user(s) updated successfully")
+    roles = {user['id']: user['role'] for user in auth.get_all_users(1)[1]}
+    assert [roles[user_id] for user_id in users] == ['Government Officer'] * 2 + ['Citizen'] * 2
+    assert counters(db) == recounted(db)
+
+    assert auth.bulk_delete_users(users[1:3]) == (True, "2 user(s) deleted successfully")
+    remaining = {user['id'] for user in auth.get_all_users(1)[1]}
+    assert users[0] in remaining and users[3] in remaining
+    assert not remaining & set(users[1:3])
+    assert counters(db) == recounted(db)
@@ -0,0 +1,12 @@
+from membership_filter import BloomFilter
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    names = [f'user{i}' for i in range(1000)]
+    for name in names:
+        bloom.add(name)
+
+    assert all(name in bloom for name in names)
+    false_positives = sum(f'other{i}' in bloom for i in range(1000))
+    assert false_positives < 50
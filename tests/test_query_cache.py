@@ -0,0 +1,90 @@
+from query_cache import QueryCache
+
+
+def test_reads_are_served_from_the_cache(auth, register, db):
+    user_id = register()
+    assert auth.get_user_stats()[0]
+
+    # A write that bypasses AuthManager is not seen until the entry expires
+    assert db.update_user_status(user_id, 'Suspended')[0]
+    statuses = {row['status']: row['count'] for row in auth.get_user_stats()[1]['users_by_status']}
+    assert 'Suspended' not in statuses
+    assert auth.get_cache_stats()['hits'] >= 1
+
+
+def test_registration_invalidates_user_reads(auth, register):
+    register()
+    users_before = auth.get_all_users(1)[1]
+    total_before = auth.get_user_stats()[1]['total_users']
+
+    register(username='newcomer')
+    assert len(auth.get_all_users(1)[1]) == len(users_before) + 1
+    assert auth.get_user_stats()[1]['total_users'] == total_before + 1
+
+
+def test_user_writes_invalidate_user_reads(auth, register):
+    user_id = register()
+    auth.get_all_users(1)
+    auth.get_user_stats()
+
+    assert auth.update_user_status(user_id, 'Suspended')[0]
+    assert {user['id']: user['status'] for user in auth.get_all_users(1)[1]}[user_id] == 'Suspended'
+    statuses = {row['status']: row['count'] for row in auth.get_user_stats()[1]['users_by_status']}
+    assert statuses['Suspended'] == 1
+
+    assert auth.delete_user(user_id)[0]
+    assert user_id not in {user['id'] for user in auth.get_all_users(1)[1]}
+
+
+def test_report_writes_invalidate_report_reads(auth, register, submit):
+    citizen = register()
+    report_id = submit(citizen)
+    assert auth.get_report_by_id(report_id)[1]['status'] == 'Pending'
+    assert len(auth.get_user_reports(citizen)[1]) == 1
+    assert auth.get_report_stats()[1]['total_reports'] == 1
+
+    assert auth.update_report_status(report_id, 'In Progress')[0]
+    assert auth.get_report_by_id(report_id)[1]['status'] == 'In Progress'
+
+    assert auth.bulk_update_report_status([report_id], 'Resolved')[0]
+    assert auth.get_report_by_id(report_id)[1]['status'] == 'Resolved'
+    assert auth.get_user_reports(citizen)[1][0]['status'] == 'Resolved'
+
+    submit(citizen)
+    assert len(auth.get_user_reports(citizen)[1]) == 2
+    assert auth.get_report_stats()[1]['total_reports'] == 2
+
+    assert auth.delete_report(report_id)[0]
+    assert auth.get_report_by_id(report_id) == (False, "Report not found")
+    assert auth.get_report_stats()[1]['total_reports'] == 1
+
+
+def test_failed_writes_keep_cached_reads(auth, register):
+    register()
+    auth.get_all_users(1)
+    hits = auth.get_cache_stats()['hits']
+
+    assert not auth.update_user_status(1, 'Not a status')[0]
+    auth.get_all_users(1)
+    assert auth.get_cache_stats()['hits'] == hits + 1
+
+
+def test_stale_fetch_is_not_stored():
+    cache = QueryCache()
+    version = cache.version
+    cache.invalidate('get_all_users')
+    cache.set(('get_all_users', 1), 'stale rows', ttl=60, version=version)
+
+    assert cache.get(('get_all_users', 1)) == (False, None)
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_entries=2)
+    cache.set(('a',), 1, ttl=60)
+    cache.set(('b',), 2, ttl=60)
+    cache.get(('a',))
+    cache.set(('c',), 3, ttl=60)
+
+    assert cache.get(('b',)) == (False, None)
+    assert cache.get(('a',)) == (True, 1)
+    assert cache.stats()['evictions'] == 1
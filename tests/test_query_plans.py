@@ -0,0 +1,151 @@
+import os
+import re
+import sys
+
+import pytest
+
+import database_config
+from query_metrics import InstrumentedPool
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from synthetic_data import SCALES, seed_database
+
+# Users loaded for the plan checks; enough rows that a scan and an index lookup differ
+PLAN_USERS = 2000
+
+# Opt-in MySQL run at benchmark scale: PLAN_CHECK_MYSQL_DATABASE names a scratch database,
+# which is dropped and reloaded with PLAN_CHECK_SCALE users
+MYSQL_PLAN_DATABASE = os.environ.get('PLAN_CHECK_MYSQL_DATABASE')
+MYSQL_PLAN_SCALE = os.environ.get('PLAN_CHECK_SCALE', '1m')
+
+# Reads that scan on SQLite, which has no full-text index
+SQLITE_SCAN_CASES = ('search_reports',)
+
+
+class StatementRecorder:
+    """Stands in for QueryMetrics and keeps every (sql, params) a method runs"""
+
+    def __init__(self):
+        self.statements = []
+
+    def record_statement(self, connection, sql, params, *unused):
+        self.statements.append((sql, params))
+
+
+def recreate_mysql_database(name):
+    """Drop and recreate the scratch MySQL database and point database_config at it"""
+    import mysql.connector
+    if name == database_config.DB_CONFIG['database']:
+        pytest.fail("PLAN_CHECK_MYSQL_DATABASE must not be the application database; it is dropped and reloaded")
+    server_config = {key: value for key, value in database_config.DB_CONFIG.items() if key != 'database'}
+    connection = mysql.connector.connect(**server_config)
+    cursor = connection.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{name}`")
+    cursor.execute(f"CREATE DATABASE `{name}`")
+    cursor.close()
+    connection.close()
+    database_config.DB_CONFIG['database'] = name
+    database_config.configure_backend('mysql')
+
+
+@pytest.fixture(scope='module', params=['sqlite', pytest.param('mysql', marks=pytest.mark.skipif(
+    not MYSQL_PLAN_DATABASE, reason="set PLAN_CHECK_MYSQL_DATABASE to check plans on MySQL"))])
+def seeded(request):
+    """DatabaseManager on a database loaded with synthetic data: in-memory SQLite, or MySQL at benchmark scale"""
+    application_database = database_config.DB_CONFIG['database']
+    if request.param == 'mysql':
+        recreate_mysql_database(MYSQL_PLAN_DATABASE)
+        users = SCALES[MYSQL_PLAN_SCALE]
+    else:
+        database_config.configure_backend('sqlite', ':memory:')
+        users = PLAN_USERS
+    db = database_config.DatabaseManager()
+    data, counts = seed_database(db, users)
+    yield request.param, db, data
+    database_config.DB_CONFIG['database'] = application_database
+    database_config.configure_backend('sqlite', ':memory:')
+
+
+def resolve(args, db, data):
+    return [arg(db, data) if callable(arg) else arg for arg in args]
+
+
+def page_calls(method, *args, **kwargs):
+    """Fetch the first page, then the second from its cursor, so both keyset forms are checked"""
+    def call(db, data):
+        args_now = resolve(args, db, data)
+        success, page = getattr(db, method)(*args_now, **kwargs)
+        assert success, page
+        assert page['next_cursor'], "too few rows to reach a second page"
+        getattr(db, method)(*args_now, page_cursor=page['next_cursor'], **kwargs)
+    return call
+
+
+def read_call(method, *args):
+    def call(db, data):
+        getattr(db, method)(*resolve(args, db, data))
+    return call
+
+
+def first_user(db, data):
+    return data.first_user_id
+
+
+def user_with_applications(db, data):
+    """A user with at least two applications, so their list has a second page"""
+    with db.pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute('SELECT user_id FROM applications GROUP BY user_id HAVING COUNT(*) > 1 LIMIT 1')
+        user_id = cursor.fetchone()[0]
+        cursor.close()
+    return user_id
+
+
+# (name, call) for the filtered reads behind the dashboards, login and registration
+PLAN_CASES = [
+    ('login_user', read_call('login_user', lambda db, data: data.username(0), 'wrong password')),
+    ('check_username_availability', read_call('check_username_availability', 'free.name')),
+    ('check_nid_availability', read_call('check_nid_availability', '1234567890')),
+    ('search_users_by_name', read_call('search_users', 'abd', 20, 1)),
+    ('search_users_by_number', read_call('search_users', '0171')),
+    ('get_active_officers', read_call('get_active_officers', 'Water Supply')),
+    ('get_user_stats', read_call('get_user_stats')),
+    ('count_user_items', read_call('count_user_items', first_user)),
+    ('get_user_applications', read_call('get_user_applications', first_user)),
+    ('get_user_reports', read_call('get_user_reports', first_user)),
+    ('get_report_by_id', read_call('get_report_by_id', 1)),
+    ('get_reports_by_department', read_call('get_reports_by_department', 'Infrastructure')),
+    ('count_department_reports_by_status', read_call('count_department_reports_by_status', 'Health')),
+    ('get_report_stats', read_call('get_report_stats')),
+    ('get_reports_page', page_calls('get_reports_page')),
+    ('get_department_reports_page', page_calls('get_department_reports_page', 'Utility')),
+    ('get_users_page', page_calls('get_users_page', 1)),
+    ('get_applications_page', page_calls('get_applications_page')),
+    ('get_user_applications_page', page_calls('get_user_applications_page', user_with_applications, page_size=1)),
+    ('search_reports', read_call('search_reports', 'road')),
+]
+
+
+@pytest.mark.parametrize('name, call', PLAN_CASES, ids=[case[0] for case in PLAN_CASES])
+def test_filtered_reads_use_an_index(seeded, request, name, call):
+    backend, db, data = seeded
+    if backend == 'sqlite' and name in SQLITE_SCAN_CASES:
+        request.applymarker(pytest.mark.xfail(
+            reason="no full-text index on SQLite: each search scans every report", strict=True))
+    recorder = StatementRecorder()
+    pool, db.pool = db.pool, InstrumentedPool(db.pool.pool, recorder)
+    try:
+        call(db, data)
+    finally:
+        db.pool = pool
+
+    selects = [(sql, params) for sql, params in recorder.statements if re.match(r'[\s(]*SELECT\b', sql, re.I)]
+    assert selects, f"{name} ran no SELECT"
+    with db.pool.connection() as connection:
+        cursor = connection.cursor(dictionary=True)
+        for sql, params in selects:
+            cursor.execute('EXPLAIN ' + sql, params)
+            scans = [row['table'] for row in cursor.fetchall() if row['type'] == 'ALL']
+            assert not scans, f"{name} scans {', '.join(scans)}:\n{sql}"
+        cursor.close()
@@ -0,0 +1,62 @@
+from mysql.connector.connection import MySQLConnection
+
+from statement_cache import configure_statement_cache, fetch_prepared, get_statement_cache_stats, prepared_cursor
+
+
+def test_prepared_and_plain_reads_match(db, register):
+    register(username='prepared')
+    sql = "SELECT id, username FROM users WHERE username = %s"
+    with db.pool.connection() as connection:
+        before = get_statement_cache_stats()
+        prepared = fetch_prepared(connection, sql, ('prepared',), dictionary=True)
+        again = fetch_prepared(connection, sql, ('prepared',), dictionary=True)
+        try:
+            configure_statement_cache(enabled=False)
+            plain = fetch_prepared(connection, sql, ('prepared',), dictionary=True)
+        finally:
+            configure_statement_cache(enabled=True)
+    after = get_statement_cache_stats()
+
+    assert prepared == again == plain
+    assert prepared[0]['username'] == 'prepared'
+    assert after['hits'] >= before['hits'] + 1
+
+
+def test_pool_returns_connections(db):
+    for _ in range(3):
+        assert db.get_all_users(1)[0]
+    stats = db.get_pool_stats()
+    assert stats['checkouts'] >= 3
+    assert stats['timeouts'] == 0
+
+
+class RecordingConnection(MySQLConnection):
+    """mysql.connector connection that records the prepared-statement commands it would send"""
+
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+
+    def is_connected(self):
+        return True
+
+    def cmd_stmt_prepare(self, statement):
+        self.commands.append('prepare')
+        return {'statement_id': 1, 'parameters': [None], 'columns': []}
+
+    def cmd_stmt_reset(self, statement_id):
+        self.commands.append('reset')
+
+    def cmd_stmt_execute(self, statement_id, data=(), parameters=(), flags=0):
+        self.commands.append('execute')
+        return {'status_flag': 0, 'warning_count': 0, 'affected_rows': 0, 'insert_id': 0}
+
+
+def test_cached_statement_is_executed_without_a_reset():
+    connection = RecordingConnection()
+    cursor = prepared_cursor(connection, dictionary=True)
+    sql = "UPDATE users SET last_login = NOW() WHERE id = %s"
+
+    cursor.execute(sql, (1,))
+    cursor.execute(sql, (2,))
+    assert connection.commands == ['prepare', 'reset', 'execute', 'execute']
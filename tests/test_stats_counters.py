@@ -0,0 +1,66 @@
+from tests.helpers import counters, recounted
+
+
+def test_registration_counts_new_users(db, register):
+    before = counters(db)
+    register()
+    register(role='Government Officer', department='Infrastructure')
+    after = counters(db)
+
+    assert after['users'] == before['users'] + 2
+    assert after['users_by_role']['Citizen'] == before['users_by_role'].get('Citizen', 0) + 1
+    assert after['users_by_role']['Government Officer'] == before['users_by_role'].get('Government Officer', 0) + 1
+    assert after == recounted(db)
+
+
+def test_user_updates_and_deletes_move_counters(db, register):
+    citizen = register()
+    other = register()
+    before = counters(db)
+
+    assert db.update_user_status(citizen, 'Suspended')[0]
+    assert db.update_user_role(other, 'Government Officer')[0]
+    after = counters(db)
+    assert after['users'] == before['users']
+    assert after['users_by_status']['Suspended'] == before['users_by_status'].get('Suspended', 0) + 1
+    assert after['users_by_status']['Active'] == before['users_by_status']['Active'] - 1
+    assert after['users_by_role']['Citizen'] == before['users_by_role']['Citizen'] - 1
+    assert after == recounted(db)
+
+    assert db.delete_user(citizen)[0]
+    after_delete = counters(db)
+    assert after_delete['users'] == after['users'] - 1
+    assert after_delete['users_by_status'].get('Suspended', 0) == after['users_by_status']['Suspended'] - 1
+    assert after_delete == recounted(db)
+
+
+def test_report_updates_and_deletes_move_counters(db, register, submit):
+    citizen = register()
+    officer = register(role='Government Officer', department='Infrastructure')
+    road = submit(citizen, 'Infrastructure')
+    water = submit(citizen, 'Utility')
+    before = counters(db)
+    assert before['reports'] == 2
+    assert before['reports_by_status'] == {'Pending': 2}
+
+    assert db.update_report_status(road, 'In Progress', officer, 'On it')[0]
+    assert db.update_report_details(water, 'Leaking pipe', 'Pipe leaking', 'Infrastructure', 'High')[0]
+    after = counters(db)
+    assert after['reports_by_status'] == {'Pending': 1, 'In Progress': 1}
+    assert after['reports_by_category'] == {'Infrastructure': 2}
+    assert after == recounted(db)
+
+    assert db.delete_report(road)[0]
+    after_delete = counters(db)
+    assert after_delete['reports'] == 1
+    assert after_delete['reports_by_status'] == {'Pending': 1}
+    assert after_delete == recounted(db)
+
+
+def test_updating_a_missing_row_changes_nothing(db, register):
+    register()
+    before = counters(db)
+
+    assert db.update_user_status(999999, 'Suspended')[0]
+    assert db.delete_report(999999)[0]
+    assert counters(db) == before == recounted(db)
@@ -0,0 +1,111 @@
+import time
+
+import database_config
+from password_hashing import configure_password_hashing
+from tests.helpers import PASSWORD
+
+
+def test_register_and_login(auth, user_data):
+    data = user_data()
+    assert auth.register_user(data) == (True, "Registration successful! Please login.")
+
+    success, user = auth.login_user(data['username'], PASSWORD)
+    assert success
+    assert user['username'] == data['username']
+    assert user['role'] == 'Citizen'
+    assert user['status'] == 'Active'
+
+
+def test_login_failures(auth, register, db):
+    user_id = register(username='alice')
+
+    assert auth.login_user('alice', 'wrong password') == (False, "Invalid password")
+    assert auth.login_user('nobody', PASSWORD) == (False, "User not found")
+    assert auth.login_user('', PASSWORD) == (False, "Please enter both username and password")
+
+    assert auth.update_user_status(user_id, 'Suspended')[0]
+    assert auth.login_user('alice', PASSWORD) == (
+        False, "Your account is not active. Please contact administrator."
+    )
+
+
+def test_duplicate_key_messages(auth, register, user_data):
+    register(username='taken', nid='5550001111', email='taken@gmail.com')
+
+    assert auth.register_user(user_data(username='taken')) == (False, "Username already exists")
+    assert auth.register_user(user_data(nid='5550001111')) == (False, "NID already registered")
+    assert auth.register_user(user_data(email='taken@gmail.com')) == (False, "Email already registered")
+
+
+def test_duplicate_username_ignores_case(auth, register, user_data):
+    register(username='CaseUser')
+
+    assert auth.register_user(user_data(username='caseuser')) == (False, "Username already exists")
+
+
+def test_registration_without_email(auth, register, user_data):
+    register(email='')
+
+    # Empty emails are stored as NULL, which the unique index allows more than once
+    assert auth.register_user(user_data(email=''))[0]
+
+
+def test_validation_runs_before_the_database(auth, user_data):
+    assert auth.register_user(user_data(phone='12345')) == (
+        False, "Please enter a valid Bangladeshi phone number (01XXXXXXXXX)"
+    )
+    assert auth.register_user(user_data(email='someone@example.com')) == (
+        False, "Please enter a valid email address"
+    )
+    assert auth.register_user(user_data(password='short')) == (
+        False, "Password must be at least 6 characters long"
+    )
+
+
+def test_login_rehashes_outdated_passwords(auth, register, db):
+    user_id = register(username='rehash')
+    try:
+        configure_password_hashing('pbkdf2_sha256', iterations=2000)
+        assert auth.login_user('rehash', PASSWORD)[0]
+    finally:
+        configure_password_hashing('pbkdf2_sha256', iterations=1000)
+
+    with db.pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute('SELECT password_hash FROM users WHERE id = %s', (user_id,))
+        password_hash = cursor.fetchone()[0]
+        cursor.close()
+    assert password_hash.startswith('pbkdf2_sha256$2000$')
+    assert auth.login_user('rehash', PASSWORD)[0]
+
+
+def test_availability_filter(auth, register):
+    register(username='filtered', nid='7770001111')
+    assert auth.load_availability_filter()[0]
+
+    assert not auth.check_availability('username', 'filtered')
+    assert not auth.check_availability('nid', '7770001111')
+    assert auth.check_availability('username', 'free-name')
+    assert not auth.might_be_taken('username', 'certainly-free-name-123')
+
+    register(username='later')
+    assert auth.might_be_taken('username', 'later')
+    assert not auth.check_availability('username', 'later')
+
+
+def test_login_metrics_leave_out_the_kdf(db, register, monkeypatch):
+    register(username='alice')
+    hasher = database_config.get_password_hasher()
+
+    class SlowHasher:
+        def verify(self, password, password_hash):
+            time.sleep(0.3)
+            return hasher.verify(password, password_hash)
+
+    monkeypatch.setattr(database_config, 'get_password_hasher', SlowHasher)
+    db.reset_query_metrics()
+    assert db.login_user('alice', PASSWORD)[0]
+
+    login = db.get_query_metrics()['login_user']
+    assert login['calls'] == 1 and login['statements'] == 2
+    assert login['total_ms'] < 300
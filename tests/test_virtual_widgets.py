@@ -0,0 +1,131 @@
+from virtual_widgets import RecycledCardList
+
+
+class StubWidget:
+    """Stands in for the viewport, scrollbar and cards, which need a display"""
+
+    def __init__(self, height=500):
+        self.height = height
+        self.item = None
+        self.y = None
+
+    def winfo_height(self):
+        return self.height
+
+    def winfo_children(self):
+        return []
+
+    def bind(self, *args):
+        pass
+
+    def set(self, *args):
+        pass
+
+    def place(self, **options):
+        self.y = options['y']
+
+    def place_forget(self):
+        self.y = None
+
+
+class InlineLoader:
+    """Runs submitted calls when drained, in submission order"""
+
+    def __init__(self):
+        self.queued = []
+
+    def submit(self, func, callback, *args):
+        self.queued.append((func, callback, args))
+
+    def drain(self):
+        while self.queued:
+            func, callback, args = self.queued.pop(0)
+            callback(func(*args))
+
+
+def card_list(fetch_page, page_size=50, max_pages=3):
+    """A RecycledCardList on stub widgets, driven without a Tk root"""
+    widget = object.__new__(RecycledCardList)
+    widget.winfo_exists = lambda: True
+    widget.loader = InlineLoader()
+    widget.fetch_page = fetch_page
+    widget.make_card = lambda parent: StubWidget()
+    widget.bind_card = lambda card, item: setattr(card, 'item', item)
+    widget.card_height = 100
+    widget.slot_height = 110
+    widget.page_size = page_size
+    widget.max_pages = max_pages
+    widget.on_empty = None
+    widget.errors = []
+    widget.on_error = widget.errors.append
+    widget.cards = []
+    widget.offset = 0
+    widget._request = 0
+    widget._reset_window()
+    widget.scrollbar = StubWidget()
+    widget.viewport = StubWidget()
+    return widget
+
+
+def pages_of(total, sizes):
+    """fetch_page over range(total) returning pages of the given sizes in turn"""
+    def fetch(page_cursor, page_size):
+        page_index, start = page_cursor or (0, 0)
+        end = min(total, start + sizes[page_index % len(sizes)])
+        next_cursor = (page_index + 1, end) if end < total else None
+        return True, {'rows': list(range(start, end)), 'next_cursor': next_cursor}
+    return fetch
+
+
+def visible(widget):
+    return [card.item for card in widget.cards if card.y is not None]
+
+
+def test_page_larger_than_page_size():
+    widget = card_list(pages_of(200, [200]))
+    widget._render()
+    widget.loader.drain()
+
+    assert widget._item_count() == 200
+    assert [widget._item(index) for index in (0, 49, 60, 199)] == [0, 49, 60, 199]
+    widget.yview('moveto', 0.3)
+    assert visible(widget)[0] == 60
+
+
+def test_uneven_pages_scroll_through_and_back():
+    widget = card_list(pages_of(1000, [50, 120, 7]))
+    widget._render()
+    widget.loader.drain()
+    for _ in range(400):
+        widget.yview('scroll', 5, 'units')
+        widget.loader.drain()
+
+    assert widget.exhausted
+    assert len(widget.pages) <= widget.max_pages
+    assert visible(widget)[-1] == 999
+
+    widget.yview('moveto', 0.0)
+    widget.loader.drain()
+    assert widget.first_page == 0
+    assert visible(widget)[:3] == [0, 1, 2]
+
+
+def test_failed_page_is_not_retried_until_reset():
+    calls = []
+
+    def failing(page_cursor, page_size):
+        calls.append(page_cursor)
+        return False, "Database error: gone"
+
+    widget = card_list(failing)
+    for _ in range(3):
+        widget._render()
+        widget.loader.drain()
+    assert (len(calls), widget.errors, widget.failed) == (1, ["Database error: gone"], True)
+
+    widget.fetch_page = pages_of(10, [50])
+    widget._reset_window()
+    widget._render()
+    widget.loader.drain()
+    assert not widget.failed
+    assert visible(widget)[0] == 0
@@ -0,0 +1,324 @@
+import bisect
+import math
+import tkinter as tk
+from tkinter import ttk
+
+
+class LazyTreeview(ttk.Treeview):
+    """Treeview that pages rows in from a keyset-paginated source while scrolling.
+
+    ``fetch_page(page_cursor, page_size)`` must return ``(success, page)`` where
+    ``page`` is ``{'rows': [...], 'next_cursor': token_or_None}``. Only a sliding
+    window of ``max_pages`` pages is kept in the tree; pages that scroll far out
+    of view are evicted and fetched again from their saved cursor if the user
+    scrolls back to them. A failed fetch is reported once through ``on_error``
+    and paging stops until ``reset()`` is called.
+    """
+
+    def __init__(self, master, loader, fetch_page, row_values, scrollbar=None,
+                 page_size=50, max_pages=6, prefetch=0.25, on_error=None, **kwargs):
+        super().__init__(master, yscrollcommand=self._on_scroll, **kwargs)
+        self.loader = loader
+        self.fetch_page = fetch_page
+        self.row_values = row_values
+        self.scrollbar = scrollbar
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+        self.on_error = on_error
+        self._request = 0
+        self._reset_window()
+
+    def _reset_window(self):
+        self.page_cursors = [None]  # start cursor of every page seen so far
+        self.page_items = {}        # page index -> item ids currently in the tree
+        self.first_page = 0
+        self.last_page = -1
+        self.exhausted = False
+        self.loading = False
+        self.failed = False
+        self._request += 1  # ignore pages still in flight from before
+
+    def reset(self, fetch_page=None):
+        """Clear the tree and start paging again, optionally from a new source"""
+        if fetch_page is not None:
+            self.fetch_page = fetch_page
+        self.delete(*self.get_children())
+        self._reset_window()
+        self.load_next()
+
+    def _request_page(self, page_index, on_page):
+        self.loading = True
+        self._request += 1
+        request = self._request
+
+        def on_loaded(result):
+            if not self.winfo_exists() or request != self._request:
+                return
+            self.loading = False
+            success, page = result
+            if not success:
+                # Scroll events must not re-send a failing request; reset() retries
+                self.failed = True
+                if self.on_error:
+                    self.on_error(page)
+                return
+            on_page(page)
+
+        self.loader.submit(self.fetch_page, on_loaded, self.page_cursors[page_index], self.page_size)
+
+    def load_next(self):
+        """Fetch the page after the last one in the window"""
+        if self.loading or self.failed or self.exhausted:
+            return
+        page_index = self.last_page + 1
+
+        def on_page(page):
+            self.page_items[page_index] = [
+                self.insert('', 'end', values=self.row_values(row)) for row in page['rows']
+            ]
+            self.last_page = page_index
+            if page['next_cursor'] is None:
+                self.exhausted = True
+            elif len(self.page_cursors) == page_index + 1:
+                self.page_cursors.append(page['next_cursor'])
+
+            if self.last_page - self.first_page + 1 > self.max_pages:
+                evicted = self.page_items.pop(self.first_page)
+                self.first_page += 1
+                self.delete(*evicted)
+                # Keep the same rows on screen after removing rows above them
+                self.yview_scroll(-len(evicted), 'units')
+
+        self._request_page(page_index, on_page)
+
+    def load_previous(self):
+        """Fetch the page before the first one in the window"""
+        if self.loading or self.failed or self.first_page == 0:
+            return
+        page_index = self.first_page - 1
+
+        def on_page(page):
+            self.page_items[page_index] = [
+                self.insert('', position, values=self.row_values(row))
+                for position, row in enumerate(page['rows'])
+            ]
+            self.first_page = page_index
+            self.yview_scroll(len(page['rows']), 'units')
+
+            if self.last_page - self.first_page + 1 > self.max_pages:
+                self.delete(*self.page_items.pop(self.last_page))
+                self.last_page -= 1
+                self.exhausted = False
+
+        self._request_page(page_index, on_page)
+
+    def _on_scroll(self, first, last):
+        """Forward scroll position to the scrollbar and page in rows near the edges"""
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+        first, last = float(first), float(last)
+        if last >= 1.0 - self.prefetch:
+            self.load_next()
+        elif first <= self.prefetch:
+            self.load_previous()
+
+
+class RecycledCardList(tk.Frame):
+    """Scrollable list of fixed-height cards drawn from a recycled widget pool.
+
+    ``make_card(parent)`` builds one empty card and ``bind_card(card, item)``
+    fills an existing card with an item. Only enough cards to cover the
+    viewport are created; scrolling rebinds them to other items, so the widget
+    count stays fixed however many items are in the list. Items come from the
+    same ``fetch_page(page_cursor, page_size)`` contract as ``LazyTreeview`` and,
+    as there, only a window of ``max_pages`` pages is held: pages far out of
+    view are dropped and fetched again from their saved cursor when scrolled
+    back into view. Pages may hold any number of rows; each page's position in
+    the list is the total length of the pages before it. A failed fetch is
+    reported once through ``on_error`` and paging stops until ``reset()`` is
+    called. When the source has no items,
+    ``on_empty`` is called or ``empty_text`` is shown.
+    """
+
+    def __init__(self, master, loader, fetch_page, make_card, bind_card, card_height=110,
+                 card_gap=10, page_size=50, max_pages=6, on_empty=None, empty_text=None, on_error=None,
+                 bg=None, **kwargs):
+        super().__init__(master, bg=bg, **kwargs)
+        self.loader = loader
+        self.fetch_page = fetch_page
+        self.make_card = make_card
+        self.bind_card = bind_card
+        self.card_height = card_height
+        self.slot_height = card_height + card_gap
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.on_empty = on_empty
+        self.on_error = on_error
+        self.cards = []
+        self.offset = 0
+        self._request = 0
+        self._reset_window()
+
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+        self.viewport = tk.Frame(self, bg=bg)
+        self.viewport.pack(side='left', fill='both', expand=True)
+        self.viewport.bind('<Configure>', lambda e: self._render())
+        self._bind_wheel(self.viewport)
+        self.empty_label = tk.Label(self.viewport, text=empty_text or '', bg=bg)
+
+    def _reset_window(self):
+        self.page_cursors = [None]  # start cursor of every page seen so far
+        self.page_starts = [0]      # list index of the first row of every page seen so far
+        self.pages = {}             # page index -> rows currently held
+        self.first_page = 0
+        self.last_page = -1
+        self.exhausted = False
+        self.loading = False
+        self.failed = False
+        self._request += 1  # ignore pages still in flight from before
+
+    def reset(self, fetch_page=None):
+        """Drop loaded items and start paging again, optionally from a new source"""
+        if fetch_page is not None:
+            self.fetch_page = fetch_page
+        self._reset_window()
+        self.offset = 0
+        self.empty_label.place_forget()
+        self._render()
+        self.load_next()
+
+    def _bind_wheel(self, widget):
+        widget.bind('<MouseWheel>', lambda e: self.yview('scroll', -1 if e.delta > 0 else 1, 'units'))
+        widget.bind('<Button-4>', lambda e: self.yview('scroll', -1, 'units'))
+        widget.bind('<Button-5>', lambda e: self.yview('scroll', 1, 'units'))
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _request_page(self, page_index, on_page):
+        self.loading = True
+        self._request += 1
+        request = self._request
+
+        def on_loaded(result):
+            if not self.winfo_exists() or request != self._request:
+                return
+            self.loading = False
+            success, page = result
+            if not success:
+                # Scroll and resize events must not re-send a failing request; reset() retries
+                self.failed = True
+                if self.on_error:
+                    self.on_error(page)
+                return
+            on_page(page)
+            self._render()
+
+        self.loader.submit(self.fetch_page, on_loaded, self.page_cursors[page_index], self.page_size)
+
+    def load_next(self):
+        """Fetch the page after the last one in the window"""
+        if self.loading or self.failed or self.exhausted:
+            return
+        page_index = self.last_page + 1
+
+        def on_page(page):
+            if page_index == 0 and not page['rows']:
+                self.exhausted = True
+                if self.on_empty:
+                    self.on_empty()
+                elif self.empty_label['text']:
+                    self.empty_label.place(relx=0.5, y=20, anchor='n')
+                return
+            self.pages[page_index] = page['rows']
+            self.last_page = page_index
+            if page['next_cursor'] is None:
+                self.exhausted = True
+            elif len(self.page_cursors) == page_index + 1:
+                self.page_cursors.append(page['next_cursor'])
+                self.page_starts.append(self.page_starts[page_index] + len(page['rows']))
+
+            if self.last_page - self.first_page + 1 > self.max_pages:
+                del self.pages[self.first_page]
+                self.first_page += 1
+
+        self._request_page(page_index, on_page)
+
+    def load_previous(self):
+        """Fetch the page before the first one in the window"""
+        if self.loading or self.failed or self.first_page == 0:
+            return
+        page_index = self.first_page - 1
+
+        def on_page(page):
+            self.pages[page_index] = page['rows']
+            self.first_page = page_index
+
+            if self.last_page - self.first_page + 1 > self.max_pages:
+                del self.pages[self.last_page]
+                self.last_page -= 1
+                self.exhausted = False
+
+        self._request_page(page_index, on_page)
+
+    def _item_count(self):
+        """Items up to the end of the window"""
+        if self.last_page < 0:
+            return 0
+        return self.page_starts[self.last_page] + len(self.pages[self.last_page])
+
+    def _item(self, index):
+        """The row at a list index, or None if its page is not held"""
+        page_index = bisect.bisect_right(self.page_starts, index) - 1
+        rows = self.pages.get(page_index)
+        position = index - self.page_starts[page_index]
+        return rows[position] if rows is not None and position < len(rows) else None
+
+    def _max_offset(self):
+        return max(0, self._item_count() * self.slot_height - self.viewport.winfo_height())
+
+    def yview(self, *args):
+        """Scrollbar protocol: moveto fraction / scroll n units|pages"""
+        if args[0] == 'moveto':
+            self.offset = int(float(args[1]) * self._item_count() * self.slot_height)
+        elif args[0] == 'scroll':
+            step = self.slot_height // 2 if args[2] == 'units' else self.viewport.winfo_height()
+            self.offset += int(args[1]) * step
+        self._render()
+
+    def _render(self):
+        """Place pooled cards over the visible slice of items"""
+        height = self.viewport.winfo_height()
+        if height <= 1:
+            return
+
+        needed = math.ceil(height / self.slot_height) + 1
+        while len(self.cards) < needed:
+            card = self.make_card(self.viewport)
+            self._bind_wheel(card)
+            self.cards.append(card)
+
+        self.offset = max(0, min(self.offset, self._max_offset()))
+        first_index = self.offset // self.slot_height
+        for slot, card in enumerate(self.cards):
+            index = first_index + slot
+            item = self._item(index)
+            if item is not None:
+                self.bind_card(card, item)
+                card.place(x=0, y=index * self.slot_height - self.offset,
+                           relwidth=1, height=self.card_height)
+            else:
+                card.place_forget()
+
+        total = self._item_count() * self.slot_height
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + height) / total))
+        else:
+            self.scrollbar.set(0, 1)
+
+        # Page in more items once either end of the window is on screen
+        if first_index + len(self.cards) >= self._item_count():
+            self.load_next()
+        elif first_index < self.page_starts[self.first_page]:
+            self.load_previous()